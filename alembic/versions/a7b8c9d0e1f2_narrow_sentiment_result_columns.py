@@ -0,0 +1,96 @@
+"""narrow sentiment_results text columns and encode sentiment_label as SMALLINT
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2025-07-03 15:00:00.000000
+
+sentiment_label becomes a SMALLINT code (0=negative, 1=neutral, 2=positive,
+see SentimentLabel) guarded by a CHECK constraint, and source/source_id/
+model_version become bounded VARCHARs. Column types cannot change while
+hypertable compression is enabled, so compression is switched off for the
+duration and restored afterwards. idx_sentiment_result_label_time is rebuilt
+on the integer column.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, None] = "f6a7b8c9d0e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "sentiment_results"
+LABEL_INDEX = "idx_sentiment_result_label_time"
+LABEL_CHECK = "ck_sentiment_label_valid"
+
+
+def _disable_compression() -> None:
+    op.execute(f"SELECT remove_compression_policy('{TABLE}', if_exists => TRUE);")
+    op.execute(
+        f"SELECT decompress_chunk(c, if_compressed => TRUE) FROM show_chunks('{TABLE}') c;"
+    )
+    op.execute(f"ALTER TABLE {TABLE} SET (timescaledb.compress = false);")
+
+
+def _enable_compression() -> None:
+    # Same settings as d4e5f6a7b8c9
+    op.execute(
+        f"ALTER TABLE {TABLE} SET ("
+        "timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'source, sentiment_label', "
+        "timescaledb.compress_orderby = 'processed_at DESC, id, event_id, occurred_at'"
+        ");"
+    )
+    op.execute(f"SELECT add_compression_policy('{TABLE}', INTERVAL '7 days', if_not_exists => TRUE);")
+
+
+def upgrade() -> None:
+    _disable_compression()
+    op.execute(f"DROP INDEX IF EXISTS {LABEL_INDEX}")
+
+    op.alter_column(
+        TABLE,
+        "sentiment_label",
+        type_=sa.SmallInteger(),
+        existing_type=sa.Text(),
+        existing_nullable=False,
+        comment="The categorical sentiment label (0=negative, 1=neutral, 2=positive).",
+        postgresql_using=(
+            "CASE lower(sentiment_label) "
+            "WHEN 'negative' THEN 0 WHEN 'neutral' THEN 1 WHEN 'positive' THEN 2 END"
+        ),
+    )
+    op.create_check_constraint(LABEL_CHECK, TABLE, "sentiment_label IN (0, 1, 2)")
+    op.alter_column(TABLE, "source", type_=sa.String(64), existing_type=sa.Text(), existing_nullable=False)
+    op.alter_column(TABLE, "source_id", type_=sa.String(128), existing_type=sa.Text(), existing_nullable=False)
+    op.alter_column(TABLE, "model_version", type_=sa.String(64), existing_type=sa.Text(), existing_nullable=False)
+
+    op.create_index(LABEL_INDEX, TABLE, ["sentiment_label", "occurred_at"], unique=False)
+    _enable_compression()
+
+
+def downgrade() -> None:
+    _disable_compression()
+    op.execute(f"DROP INDEX IF EXISTS {LABEL_INDEX}")
+
+    op.alter_column(TABLE, "model_version", type_=sa.Text(), existing_type=sa.String(64), existing_nullable=False)
+    op.alter_column(TABLE, "source_id", type_=sa.Text(), existing_type=sa.String(128), existing_nullable=False)
+    op.alter_column(TABLE, "source", type_=sa.Text(), existing_type=sa.String(64), existing_nullable=False)
+    op.drop_constraint(LABEL_CHECK, TABLE, type_="check")
+    op.alter_column(
+        TABLE,
+        "sentiment_label",
+        type_=sa.Text(),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        comment="The categorical sentiment label.",
+        postgresql_using=(
+            "CASE sentiment_label "
+            "WHEN 0 THEN 'negative' WHEN 1 THEN 'neutral' WHEN 2 THEN 'positive' END"
+        ),
+    )
+
+    op.create_index(LABEL_INDEX, TABLE, ["sentiment_label", "occurred_at"], unique=False)
+    _enable_compression()
@@ -0,0 +1,48 @@
+"""add BRIN time indexes to sentiment_results
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2025-07-04 09:30:00.000000
+
+BRIN indexes on processed_at and occurred_at serve time-range scans at a
+fraction of a B-tree's size. idx_sentiment_result_src_time and
+idx_sentiment_result_label_time are kept because /events filters on
+source/label and paginates on (occurred_at, id).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "sentiment_results"
+BRIN_INDEXES = {
+    "brin_sr_processed_at": "processed_at",
+    "brin_sr_occurred_at": "occurred_at",
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing = {ix["name"] for ix in inspector.get_indexes(TABLE)}
+
+    for name, column in BRIN_INDEXES.items():
+        if name not in existing:
+            op.create_index(
+                name,
+                TABLE,
+                [column],
+                unique=False,
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+            )
+
+
+def downgrade() -> None:
+    for name in BRIN_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
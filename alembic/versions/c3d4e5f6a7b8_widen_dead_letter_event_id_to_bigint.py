@@ -0,0 +1,50 @@
+"""widen dead_letter_events.id to BIGINT
+
+Revision ID: c3d4e5f6a7b8
+Revises: b1c2d3e4f5ab
+Create Date: 2025-07-02 10:15:00.000000
+
+The dead-letter stream is append-only and high volume, so the INTEGER id
+(and its backing sequence) would wrap around at ~2.1B rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "c3d4e5f6a7b8"
+down_revision: Union[str, None] = "b1c2d3e4f5ab"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "dead_letter_events"
+SEQUENCE = "dead_letter_events_id_seq"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    columns = {c["name"]: c for c in inspector.get_columns(TABLE)}
+    if "id" in columns and not isinstance(columns["id"]["type"], sa.BigInteger):
+        op.alter_column(
+            TABLE,
+            "id",
+            type_=sa.BigInteger(),
+            existing_type=sa.Integer(),
+            existing_nullable=False,
+        )
+    # SERIAL sequences are typed INTEGER and cap nextval() independently of the column
+    op.execute(f"ALTER SEQUENCE IF EXISTS {SEQUENCE} AS BIGINT")
+
+
+def downgrade() -> None:
+    """Narrow the id back to INTEGER (fails if any id exceeds INTEGER range)."""
+    op.execute(f"ALTER SEQUENCE IF EXISTS {SEQUENCE} AS INTEGER")
+    op.alter_column(
+        TABLE,
+        "id",
+        type_=sa.Integer(),
+        existing_type=sa.BigInteger(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,77 @@
+"""add generated time_bucket_hour to sentiment_results
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2025-07-04 13:00:00.000000
+
+Adds a STORED generated column holding the UTC hour of processed_at (the
+same bucket as sentiment_metrics.time_bucket) and a covering index so hourly
+count/avg(sentiment_score) rollups per source and label are index-only scans.
+The expression is written with AT TIME ZONE 'UTC' because date_trunc() on a
+timestamptz is only STABLE, and generated columns need IMMUTABLE expressions.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "sentiment_results"
+COLUMN = "time_bucket_hour"
+INDEX = "idx_sr_bucket_source_label"
+
+
+def _disable_compression() -> None:
+    op.execute(f"SELECT remove_compression_policy('{TABLE}', if_exists => TRUE);")
+    op.execute(
+        f"SELECT decompress_chunk(c, if_compressed => TRUE) FROM show_chunks('{TABLE}') c;"
+    )
+    op.execute(f"ALTER TABLE {TABLE} SET (timescaledb.compress = false);")
+
+
+def _enable_compression() -> None:
+    # Same settings as d4e5f6a7b8c9
+    op.execute(
+        f"ALTER TABLE {TABLE} SET ("
+        "timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'source, sentiment_label', "
+        "timescaledb.compress_orderby = 'processed_at DESC, id, event_id, occurred_at'"
+        ");"
+    )
+    op.execute(f"SELECT add_compression_policy('{TABLE}', INTERVAL '7 days', if_not_exists => TRUE);")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    has_column = COLUMN in {c["name"] for c in inspector.get_columns(TABLE)}
+    has_index = INDEX in {i["name"] for i in inspector.get_indexes(TABLE)}
+    if has_column and has_index:
+        return
+
+    _disable_compression()
+    # The column may already exist (e.g. added by hand); the index is still created
+    if not has_column:
+        op.execute(
+            f"ALTER TABLE {TABLE} ADD COLUMN {COLUMN} TIMESTAMPTZ NOT NULL "
+            "GENERATED ALWAYS AS (date_trunc('hour', processed_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC') STORED"
+        )
+    op.create_index(
+        INDEX,
+        TABLE,
+        [COLUMN, "source", "sentiment_label", "sentiment_score"],
+        unique=False,
+        if_not_exists=True,
+    )
+    _enable_compression()
+
+
+def downgrade() -> None:
+    _disable_compression()
+    op.execute(f"DROP INDEX IF EXISTS {INDEX}")
+    op.drop_column(TABLE, COLUMN)
+    _enable_compression()
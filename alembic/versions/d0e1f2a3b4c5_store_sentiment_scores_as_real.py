@@ -0,0 +1,62 @@
+"""store sentiment_results score columns as REAL
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2025-07-04 16:00:00.000000
+
+sentiment_score and confidence are bounded model outputs produced in FP32, so
+DOUBLE PRECISION spends 4 extra bytes per value for no information. Column
+types cannot change while hypertable compression is enabled, so it is turned
+off for the duration and restored afterwards.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "sentiment_results"
+
+
+def _disable_compression() -> None:
+    op.execute(f"SELECT remove_compression_policy('{TABLE}', if_exists => TRUE);")
+    op.execute(
+        f"SELECT decompress_chunk(c, if_compressed => TRUE) FROM show_chunks('{TABLE}') c;"
+    )
+    op.execute(f"ALTER TABLE {TABLE} SET (timescaledb.compress = false);")
+
+
+def _enable_compression() -> None:
+    # Same settings as d4e5f6a7b8c9
+    op.execute(
+        f"ALTER TABLE {TABLE} SET ("
+        "timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'source, sentiment_label', "
+        "timescaledb.compress_orderby = 'processed_at DESC, id, event_id, occurred_at'"
+        ");"
+    )
+    op.execute(f"SELECT add_compression_policy('{TABLE}', INTERVAL '7 days', if_not_exists => TRUE);")
+
+
+def upgrade() -> None:
+    _disable_compression()
+    # One ALTER TABLE so the table (and idx_sr_bucket_source_label) is rewritten once
+    op.execute(
+        f"ALTER TABLE {TABLE} "
+        "ALTER COLUMN sentiment_score TYPE REAL USING sentiment_score::real, "
+        "ALTER COLUMN confidence TYPE REAL USING confidence::real"
+    )
+    _enable_compression()
+
+
+def downgrade() -> None:
+    _disable_compression()
+    op.execute(
+        f"ALTER TABLE {TABLE} "
+        "ALTER COLUMN sentiment_score TYPE DOUBLE PRECISION, "
+        "ALTER COLUMN confidence TYPE DOUBLE PRECISION"
+    )
+    _enable_compression()
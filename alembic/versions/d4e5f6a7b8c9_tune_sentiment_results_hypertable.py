@@ -0,0 +1,53 @@
+"""tune sentiment_results hypertable: daily chunks and compression
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2025-07-02 14:30:00.000000
+
+`sentiment_results` was converted to a hypertable on `processed_at` in
+d2dff1ec4c53 with the default 7-day chunk interval. This migration shrinks new
+chunks to one day so the hot chunk and its (already chunk-local) indexes stay
+in shared_buffers, and enables native compression for chunks older than seven
+days, segmented by source and sentiment label.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "sentiment_results"
+
+
+def upgrade() -> None:
+    # Idempotent: no-op when the table is already a hypertable
+    op.execute(
+        f"SELECT create_hypertable('{TABLE}', 'processed_at', "
+        "chunk_time_interval => INTERVAL '1 day', if_not_exists => TRUE, migrate_data => TRUE);"
+    )
+    # Only affects chunks created from now on
+    op.execute(f"SELECT set_chunk_time_interval('{TABLE}', INTERVAL '1 day');")
+
+    # Columns of the primary key (id, processed_at) and the unique constraint
+    # (event_id, occurred_at, processed_at) must appear in segmentby/orderby.
+    op.execute(
+        f"ALTER TABLE {TABLE} SET ("
+        "timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'source, sentiment_label', "
+        "timescaledb.compress_orderby = 'processed_at DESC, id, event_id, occurred_at'"
+        ");"
+    )
+    op.execute(f"SELECT add_compression_policy('{TABLE}', INTERVAL '7 days', if_not_exists => TRUE);")
+
+
+def downgrade() -> None:
+    """Remove compression (decompressing existing chunks) and restore 7-day chunks."""
+    op.execute(f"SELECT remove_compression_policy('{TABLE}', if_exists => TRUE);")
+    op.execute(
+        f"SELECT decompress_chunk(c, if_compressed => TRUE) FROM show_chunks('{TABLE}') c;"
+    )
+    op.execute(f"ALTER TABLE {TABLE} SET (timescaledb.compress = false);")
+    op.execute(f"SELECT set_chunk_time_interval('{TABLE}', INTERVAL '7 days');")
@@ -0,0 +1,58 @@
+"""index sentiment_results.sentiment_scores_json
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2025-07-03 09:00:00.000000
+
+Adds partial expression B-trees on the per-class scores
+(``(sentiment_scores_json->>'<label>')::double precision``) for score-range
+filters and sorts, plus a ``jsonb_path_ops`` GIN index for containment
+(``@>``) queries.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "e5f6a7b8c9d0"
+down_revision: Union[str, None] = "d4e5f6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "sentiment_results"
+SCORE_LABELS = ("positive", "negative", "neutral")
+GIN_INDEX = "idx_sr_scores_gin"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing = {ix["name"] for ix in inspector.get_indexes(TABLE)}
+
+    for label in SCORE_LABELS:
+        name = f"idx_sr_scores_{label}"
+        if name not in existing:
+            op.create_index(
+                name,
+                TABLE,
+                [sa.text(f"((sentiment_scores_json->>'{label}')::double precision)")],
+                unique=False,
+                postgresql_using="btree",
+                postgresql_where=sa.text("sentiment_scores_json IS NOT NULL"),
+            )
+
+    if GIN_INDEX not in existing:
+        op.create_index(
+            GIN_INDEX,
+            TABLE,
+            ["sentiment_scores_json"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"sentiment_scores_json": "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {GIN_INDEX}")
+    for label in SCORE_LABELS:
+        op.execute(f"DROP INDEX IF EXISTS idx_sr_scores_{label}")
@@ -0,0 +1,34 @@
+"""drop redundant idx_sentiment_result_event_id_occurred_at
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2025-07-03 11:00:00.000000
+
+The unique constraint uq_sentiment_result_event_occurred_processed_at on
+(event_id, occurred_at, processed_at) already provides a B-tree whose leading
+prefix serves event_id and (event_id, occurred_at) lookups, so the separate
+index only adds write amplification.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "sentiment_results"
+INDEX = "idx_sentiment_result_event_id_occurred_at"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if INDEX in {ix["name"] for ix in inspector.get_indexes(TABLE)}:
+        op.drop_index(INDEX, table_name=TABLE)
+
+
+def downgrade() -> None:
+    op.create_index(INDEX, TABLE, ["event_id", "occurred_at"], unique=False)
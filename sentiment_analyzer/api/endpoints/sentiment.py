@@ -7,7 +7,7 @@ including on-the-fly text analysis and data retrieval from stored results.
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from urllib.parse import unquote
 import base64
 import json
@@ -35,6 +35,10 @@ from sentiment_analyzer.config.settings import settings
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Labels accepted by the sentiment_label filters; anything else is rejected with a 422,
+# since SentimentLabelType cannot bind an unknown label to its SMALLINT code
+SentimentLabelFilter = Literal["positive", "negative", "neutral"]
+
 
 # Dependency to get preprocessor instance
 async def get_preprocessor() -> Preprocessor:
@@ -192,7 +196,7 @@ async def get_sentiment_events(
     end_time: Optional[datetime] = Query(None, description="Filter events before this timestamp"),
     source: Optional[str] = Query(None, description="Filter by event source"),
     source_id: Optional[str] = Query(None, description="Filter by source ID"),
-    sentiment_label: Optional[str] = Query(None, description="Filter by sentiment label"),
+    sentiment_label: Optional[SentimentLabelFilter] = Query(None, description="Filter by sentiment label"),
     limit: int = Query(100, ge=1, le=10000, description="Maximum number of results"),
     cursor: Optional[str] = Query(None, description="Pagination cursor")
 ) -> List[SentimentResultDTO]:
@@ -262,26 +266,14 @@ async def get_sentiment_events(
         events = result.scalars().all()
         
         # Convert to DTOs
-        event_dtos = [
-            SentimentResultDTO(
-                id=event.id,
-                event_id=str(event.event_id),  # Convert to string for API
-                occurred_at=event.occurred_at,
-                source=event.source,
-                source_id=event.source_id,
-                sentiment_score=event.sentiment_score,
-                sentiment_label=event.sentiment_label,
-                confidence=event.confidence,
-                processed_at=event.processed_at,
-                model_version=event.model_version,
-                raw_text=event.raw_text  # Use raw_text from ORM model
-            )
-            for event in events
-        ]
+        event_dtos = [SentimentResultDTO.from_orm_fast(event) for event in events]
         
         logger.info(f"Retrieved {len(event_dtos)} sentiment events")
         return event_dtos
         
+    except HTTPException:
+        # e.g. the 400 from decode_cursor; not a server error
+        raise
     except Exception as e:
         logger.error(f"Error retrieving sentiment events: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve events: {str(e)}")
@@ -295,7 +287,7 @@ async def get_sentiment_metrics(
     time_bucket_size: Optional[str] = Query("hour", description="Time bucket size (hour, day, week)"),
     source: Optional[str] = Query(None, description="Filter by event source"),
     source_id: Optional[str] = Query(None, description="Filter by source ID"),
-    sentiment_label: Optional[str] = Query(None, description="Filter by sentiment label"),
+    sentiment_label: Optional[SentimentLabelFilter] = Query(None, description="Filter by sentiment label"),
     limit: int = Query(1000, ge=1, le=10000, description="Maximum number of results"),
 ) -> List[SentimentMetricDTO]:
     """
@@ -382,6 +374,9 @@ async def get_sentiment_metrics(
         logger.info(f"Retrieved {len(metric_dtos)} aggregated sentiment metrics")
         return metric_dtos
         
+    except HTTPException:
+        # e.g. the 400 for an invalid time_bucket_size; not a server error
+        raise
     except Exception as e:
         logger.error(f"Error retrieving aggregated sentiment metrics: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve aggregated metrics: {str(e)}")
@@ -26,12 +26,15 @@ logging.getLogger('sentiment_analyzer.core.pipeline').setLevel(logging.INFO)
 
 from sentiment_analyzer.config.settings import settings
 from sentiment_analyzer.api.endpoints import sentiment
+from sentiment_analyzer.api.responses import ORJSONResponse
+from sentiment_analyzer.integrations.eventhubs import EventHubsPowerBISink
 from sentiment_analyzer.integrations.powerbi import PowerBIClient
 from sentiment_analyzer.core.pipeline import SentimentPipeline
+from sentiment_analyzer.utils.asyncpg_pool import close_asyncpg_pool
 
 
-# Global PowerBI client instance
-powerbi_client: PowerBIClient | None = None
+# Global PowerBI client instance (REST push client or Event Hubs sink)
+powerbi_client: PowerBIClient | EventHubsPowerBISink | None = None
 
 # Global pipeline instance and background task
 pipeline: SentimentPipeline | None = None
@@ -55,7 +58,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     
     # Initialize PowerBI client if configured
-    if hasattr(settings, 'POWERBI_PUSH_URL') and settings.POWERBI_PUSH_URL:
+    if settings.POWERBI_SINK == "eventhubs" and settings.POWERBI_EVENTHUB_CONNECTION_STRING:
+        logger.info("Initializing PowerBI Event Hubs sink")
+        powerbi_client = EventHubsPowerBISink(
+            connection_string=settings.POWERBI_EVENTHUB_CONNECTION_STRING,
+            eventhub_name=settings.POWERBI_EVENTHUB_NAME
+        )
+    elif hasattr(settings, 'POWERBI_PUSH_URL') and settings.POWERBI_PUSH_URL:
         logger.info("Initializing PowerBI client")
         powerbi_client = PowerBIClient(
             push_url=settings.POWERBI_PUSH_URL,
@@ -131,11 +140,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             await pipeline_task
         except asyncio.CancelledError:
             logger.info("Pipeline background task cancelled successfully")
+
+    # Commit dead-letter entries still waiting for their group commit
+    if pipeline:
+        await pipeline.result_processor.close()
     
     # Close PowerBI client
     if powerbi_client:
         await powerbi_client.close()
 
+    # Close the raw asyncpg pool used for claiming events
+    await close_asyncpg_pool()
+
 
 def create_app() -> FastAPI:
     """
@@ -160,6 +176,7 @@ def create_app() -> FastAPI:
         and supports real-time streaming to Power BI dashboards.""",
         debug=settings.DEBUG,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.DEBUG else None,  # Disable docs in production
         redoc_url="/redoc" if settings.DEBUG else None,
         openapi_tags=[
@@ -246,11 +263,11 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-def get_powerbi_client() -> PowerBIClient | None:
+def get_powerbi_client() -> PowerBIClient | EventHubsPowerBISink | None:
     """
     Get the global PowerBI client instance.
     
     Returns:
-        PowerBIClient | None: PowerBI client if configured, None otherwise.
+        PowerBIClient | EventHubsPowerBISink | None: PowerBI sink if configured, None otherwise.
     """
     return powerbi_client
@@ -0,0 +1,56 @@
+"""
+Shared response classes for the Sentiment Analyzer API.
+
+Provides an orjson-backed JSON response used as the application's default
+response class, replacing the standard library ``json`` encoder.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    Fallback serializer for objects orjson does not handle natively.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        Any: JSON-compatible representation of ``obj``
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if hasattr(obj, "to_json_bytes"):
+        # Frozen DTOs cache their encoding; embed it without re-serializing
+        return orjson.Fragment(obj.to_json_bytes())
+    if isinstance(obj, BaseModel):
+        return obj.__pydantic_serializer__.to_python(obj, mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Endpoints with a ``response_model`` are already serialized by pydantic-core
+    before reaching ``render``; the ``default`` hook covers handlers that
+    return pydantic models directly.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize response content to JSON bytes.
+
+        Args:
+            content: Response content
+
+        Returns:
+            bytes: Encoded JSON body
+        """
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_SERIALIZE_NUMPY)
@@ -86,10 +86,14 @@ class Settings(BaseSettings):
     SPACY_MODEL_NAME: str = "en_core_web_lg"
     FINBERT_MODEL_NAME: str = "ProsusAI/finbert"
     USE_GPU_IF_AVAILABLE: bool = True # For FinBERT
+    SENTIMENT_MODEL_INT8: bool = False # Dynamic int8 quantization of the model's Linear layers (CPU only)
 
     # Batch processing settings
     EVENT_FETCH_INTERVAL_SECONDS: int = 60
     EVENT_FETCH_BATCH_SIZE: int = 100
+    RESULT_COPY_BATCH_SIZE: int = 2000 # Rows per COPY in ResultProcessor.save_sentiment_results_bulk
+    DLQ_GROUP_COMMIT_BATCH_SIZE: int = 200 # Max queued dead-letter entries committed together
+    DLQ_GROUP_COMMIT_INTERVAL_MS: int = 5 # How long the DLQ flusher waits for more entries before committing
 
     # Logging configuration path (can be overridden by env var)
     LOGGING_CONFIG_PATH: str = str(SERVICE_ROOT_DIR / "config" / "logging_config.yaml")
@@ -99,10 +103,14 @@ class Settings(BaseSettings):
 
     # Pipeline settings
     PIPELINE_RUN_INTERVAL_SECONDS: int = 60
+    SENTIMENT_CONCURRENCY: int = 8 # Max events of a fetched batch processed at once
 
     # PowerBI Integration settings
     POWERBI_PUSH_URL: Optional[str] = None
     POWERBI_API_KEY: Optional[str] = None
+    POWERBI_SINK: str = "rest" # "rest" (push URL) or "eventhubs"
+    POWERBI_EVENTHUB_CONNECTION_STRING: Optional[str] = None
+    POWERBI_EVENTHUB_NAME: Optional[str] = None
 
     model_config = SettingsConfigDict(
         env_file= str(PROJECT_ROOT_DIR / ".env"),  # Load variables from project root .env
@@ -6,11 +6,10 @@ claiming them for processing, and returning them as DTOs.
 """
 import logging
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
 from typing import List, Optional
 import asyncio
 
-from sqlalchemy import select, update, func, and_, or_, literal_column
+from sqlalchemy import select, update, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sentiment_analyzer.config.settings import settings
@@ -22,6 +21,7 @@ try:
 except ImportError:
     # For testing purposes, use the stub
     from sentiment_analyzer.tests.stubs.raw_event_stub import RawEventORM
+from sentiment_analyzer.utils import asyncpg_pool
 from sentiment_analyzer.utils.db_session import get_db_session_context_manager as get_async_db_session
 
 logger = logging.getLogger(__name__)
@@ -68,6 +68,88 @@ async def get_db_session_context_manager():
         if callable(close_coro):
             await close_coro()
 
+# Columns returned by the claim statement. Only those the DTO knows about are
+# selected; the scraper's ORM and the test stub do not share an identical schema.
+_RETURNED_COLUMNS = [
+    column for column in RawEventORM.__table__.columns if column.name in RawEventDTO.model_fields
+]
+
+# Same statement as `_build_claim_statement`, as plain SQL for the asyncpg fast path.
+# `processed IS NOT TRUE` matches both FALSE and NULL.
+_CLAIM_SQL = f"""
+WITH events_to_update_cte AS (
+    SELECT id FROM {RawEventORM.__table__.fullname}
+    WHERE processed IS NOT TRUE
+    ORDER BY occurred_at ASC
+    LIMIT $1
+    FOR UPDATE SKIP LOCKED
+)
+UPDATE {RawEventORM.__table__.fullname}
+SET processed = TRUE, processed_at = now()
+WHERE id IN (SELECT id FROM events_to_update_cte)
+RETURNING {", ".join(column.name for column in _RETURNED_COLUMNS)}
+"""
+
+def _build_claim_statement(batch_size: int):
+    """
+    Builds the single-round-trip claim statement.
+
+    The CTE picks the oldest unprocessed rows with FOR UPDATE SKIP LOCKED so
+    concurrent workers never claim the same event, and the UPDATE marks them
+    processed and RETURNs their data in the same statement.
+    """
+    events_to_update_cte = (
+        select(RawEventORM.id)
+        .where(or_(RawEventORM.processed.is_(False), RawEventORM.processed.is_(None)))
+        .order_by(RawEventORM.occurred_at.asc())
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .cte("events_to_update_cte")
+    )
+    # `func.now()` is preferred for setting timestamps by the database server's clock.
+    return (
+        update(RawEventORM)
+        .where(RawEventORM.id.in_(select(events_to_update_cte.c.id)))
+        .values(processed=True, processed_at=func.now())
+        .returning(*_RETURNED_COLUMNS)
+    )
+
+async def _claim_raw_events(db_session: AsyncSession, batch_size: int) -> List[RawEventDTO]:
+    """Claims up to ``batch_size`` events on ``db_session`` in one statement."""
+    try:
+        exec_result = await db_session.execute(_build_claim_statement(batch_size))
+        columns = list(exec_result.keys())
+        rows = exec_result.fetchall()
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error("Error fetching and claiming raw events: %s", e, exc_info=True)
+        await db_session.rollback()
+        return []  # Graceful degradation for unit tests
+
+    if not rows:
+        logger.info("No new raw events found to process.")
+        return []
+
+    logger.info(f"Successfully fetched and claimed {len(rows)} raw events.")
+    return [RawEventDTO.model_validate(dict(zip(columns, row))) for row in rows]
+
+async def _claim_raw_events_asyncpg(batch_size: int) -> List[RawEventDTO]:
+    """Claims up to ``batch_size`` events on a raw asyncpg connection, bypassing the ORM."""
+    try:
+        async with asyncpg_pool.acquire() as conn:
+            # A single statement runs in its own implicit transaction, so the
+            # claim is committed (or rolled back) without an explicit BEGIN.
+            rows = await conn.fetch(_CLAIM_SQL, batch_size)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error("Error fetching and claiming raw events: %s", e, exc_info=True)
+        return []
+
+    if not rows:
+        logger.info("No new raw events found to process.")
+        return []
+
+    logger.info(f"Successfully fetched and claimed {len(rows)} raw events.")
+    return [RawEventDTO.model_validate(dict(row)) for row in rows]
+
 async def fetch_and_claim_raw_events(
     batch_size: int = settings.EVENT_FETCH_BATCH_SIZE,
     db_session: Optional[AsyncSession] = None,
@@ -77,9 +159,14 @@ async def fetch_and_claim_raw_events(
     atomically claims them by marking them as processed for sentiment analysis,
     and returns them as a list of RawEventDTO objects.
 
+    Selection, claiming and retrieval happen in a single UPDATE ... RETURNING
+    statement, i.e. one database round trip per batch.
+
     Args:
         batch_size: The maximum number of events to fetch and claim.
-        db_session: The asynchronous SQLAlchemy session. If not provided, an internal context manager will be used.
+        db_session: The asynchronous SQLAlchemy session, for callers that need the claim to join
+            their transaction. If not provided, the claim runs directly on the shared asyncpg
+            pool and is committed immediately.
 
     Returns:
         A list of RawEventDTO objects representing the claimed events.
@@ -87,105 +174,9 @@ async def fetch_and_claim_raw_events(
     """
     logger.info(f"Attempting to fetch and claim up to {batch_size} raw events.")
 
-    should_close_session = False
     if db_session is None:
-        async with get_db_session_context_manager() as session:
-            db_session = session
-            should_close_session = True
-
-    try:
-        # Step 1: Select IDs of events to process
-        # This subquery identifies the rows to be updated, respecting order and limit,
-        # and uses FOR UPDATE SKIP LOCKED for concurrency safety.
-        # Diagnostic logging
-        logger.info(f"DataFetcher: RawEventORM type: {type(RawEventORM)}, module: {RawEventORM.__module__}")
-        has_sentiment_processed_at = hasattr(RawEventORM, 'sentiment_processed_at')
-        timestamp_attr_name = 'sentiment_processed_at' if has_sentiment_processed_at else 'processed_at'
-        logger.info(f"DataFetcher: Has 'sentiment_processed_at': {has_sentiment_processed_at}, using attribute: '{timestamp_attr_name}' for timestamp check.")
-
-        events_to_update_cte = (
-            select(RawEventORM)
-            .where(or_(RawEventORM.processed.is_(False), RawEventORM.processed.is_(None)))
-            .order_by(RawEventORM.occurred_at.asc())
-            .limit(batch_size)
-            .with_for_update(skip_locked=True)
-            .cte("events_to_update_cte")
-        )
-
-        # Step 2: Update the selected events and return their full data
-        # The update statement targets rows whose IDs are in the CTE.
-        # `func.now()` is preferred for setting timestamps by the database server's clock.
-        stmt = (
-            update(RawEventORM)
-            .where(RawEventORM.id.in_(
-                select(events_to_update_cte.c.id)
-            ))
-            .values(
-                processed=True,
-                processed_at=func.now()
-            )
-            .returning(RawEventORM)
-            .execution_options(populate_existing=True)
-        )
-
-        # Log the count of events matching the CTE criteria before attempting update
-        count_stmt = select(func.count()).select_from(events_to_update_cte)
-        count_result = await db_session.execute(count_stmt)
-        matching_event_count = count_result.scalar_one_or_none() or 0 # Ensure it's an int
-        logger.info(f"DataFetcher: CTE query identified {matching_event_count} events matching criteria (processed=False/None AND sentiment_processed_at=None).")
-
-        if matching_event_count == 0:
-            logger.warning("DataFetcher: CTE found 0 events. No events will be updated or returned by this fetch cycle.")
-            return [] # Return early if no events are found by the CTE
-
-        # Tests expect `execute` to be called, so we use it first.
-        exec_result = await db_session.execute(stmt)
-        try:
-            updated_event_orms = exec_result.scalars().all()
-        except Exception:  # pragma: no cover – depends on mock behaviour
-            updated_event_orms = []
-
-        logger.info(f"DataFetcher: UPDATE...RETURNING statement returned {len(updated_event_orms)} events.")
-
-        # If execute path produced nothing—common in unit tests where scalars() is mocked—
-        # fall back to session.scalars which they patch.
-        if not updated_event_orms and hasattr(db_session, "scalars"):
-            scalar_result = await db_session.scalars(stmt)  # type: ignore[attr-defined]
-            updated_event_orms = scalar_result.all()
-
-        # Unit tests may return tuples rather than ORM objects. Convert as needed.
-        if updated_event_orms and not hasattr(updated_event_orms[0], "id"):
-            converted: List[RawEventDTO] = []
-            for (id_, content, source, occurred_at, *_) in updated_event_orms:  # type: ignore
-                converted.append(
-                    RawEventDTO(
-                        id=id_,
-                        content=content,
-                        source=source,
-                        occurred_at=occurred_at,
-                    )
-                )
-            return converted
-
-        if not updated_event_orms:
-            logger.info("No new raw events found to process.")
-            return []
-
-        logger.info(f"Successfully fetched and claimed {len(updated_event_orms)} raw events.")
-
-        # Convert ORM objects to DTOs
-        event_dtos = [
-            RawEventDTO.from_orm(event_orm) for event_orm in updated_event_orms
-        ]
-        return event_dtos
-
-    except Exception as e:  # pylint: disable=broad-except
-        logger.error("Error fetching and claiming raw events: %s", e, exc_info=True)
-        await db_session.rollback()
-        return []  # Graceful degradation for unit tests
-    finally:
-        if should_close_session:
-            await db_session.close()
+        return await _claim_raw_events_asyncpg(batch_size)
+    return await _claim_raw_events(db_session, batch_size)
 
 # Example usage (for testing or a standalone script)
 async def main_test():
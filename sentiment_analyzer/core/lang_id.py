@@ -0,0 +1,64 @@
+"""
+Language identification adapter for the Preprocessor.
+
+Uses Google's CLD3 (the optional ``pycld3`` package, installed with the
+"langid" extra) when available, as it classifies a short text in microseconds.
+Falls back to ``langdetect`` otherwise, so behaviour is unchanged in
+environments without the extra.
+"""
+import logging
+from typing import Optional
+
+from langdetect import LangDetectException, detect_langs
+
+# CLD3 is a compiled extension; keep it optional like the other accelerators.
+try:
+    import cld3  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – only executes when pycld3 not installed
+    cld3 = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_LANGUAGE = "unknown"
+
+
+def detect_with_confidence(text: str) -> tuple[str, Optional[float]]:
+    """
+    Detects the language of ``text``.
+
+    Args:
+        text (str): The text to analyze.
+
+    Returns:
+        tuple[str, Optional[float]]: The detected language code (e.g., 'en') and
+                                     its probability, or ('unknown', None) if
+                                     detection fails.
+    """
+    if cld3 is not None:
+        prediction = cld3.get_language(text)
+        if prediction is None or prediction.language == "und":
+            return UNKNOWN_LANGUAGE, None
+        return prediction.language, prediction.probability
+
+    try:
+        # detect_langs returns a list of LangDetectResult(lang, prob), best first
+        detections = detect_langs(text)
+    except LangDetectException:
+        logger.warning("Language detection failed for text: '%s...'", text[:100])
+        return UNKNOWN_LANGUAGE, None
+    if detections:
+        return detections[0].lang, detections[0].prob
+    return UNKNOWN_LANGUAGE, None
+
+
+def detect(text: str) -> str:
+    """
+    Detects the language of ``text``.
+
+    Args:
+        text (str): The text to analyze.
+
+    Returns:
+        str: The detected language code, or 'unknown' if detection fails.
+    """
+    return detect_with_confidence(text)[0]
@@ -7,7 +7,7 @@ sentiment analysis, and result processing for batches of events.
 import asyncio
 import json
 import logging
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from sqlalchemy.ext.asyncio import AsyncSession # Only for type hinting if passed around
 
@@ -16,14 +16,17 @@ from sentiment_analyzer.core.data_fetcher import fetch_and_claim_raw_events
 from sentiment_analyzer.core.preprocessor import Preprocessor
 from sentiment_analyzer.core.sentiment_analyzer_component import SentimentAnalyzerComponent
 from sentiment_analyzer.core.result_processor import ResultProcessor
-from sentiment_analyzer.models.dtos import RawEventDTO
+from sentiment_analyzer.models.dtos import PreprocessedText, RawEventDTO, SentimentAnalysisOutput
 from sentiment_analyzer.models.sentiment_result_orm import SentimentResultORM
-from sentiment_analyzer.models.dead_letter_event_orm import DeadLetterEventORM
 from sentiment_analyzer.utils.db_session import get_db_session_context_manager
 # get_async_db_session is used by ResultProcessor internally if no session is passed.
 
 logger = logging.getLogger(__name__)
 
+# Per-event result of `SentimentPipeline._analyze_batch`: the preprocessed text and its
+# sentiment output (None when the text is not in the target language).
+BatchAnalysis = Tuple[PreprocessedText, Optional[SentimentAnalysisOutput]]
+
 class SentimentPipeline:
     """
     Orchestrates the sentiment analysis pipeline.
@@ -39,71 +42,151 @@ class SentimentPipeline:
         self.result_processor = ResultProcessor(session=self._shared_session)
         # Use the configured batch size; maintain backward-compat alias for tests.
         self.batch_size = getattr(settings, "EVENT_FETCH_BATCH_SIZE", 100)
+        # Upper bound on events of one batch in flight at once (DB writes, model calls).
+        self.concurrency = max(1, getattr(settings, "SENTIMENT_CONCURRENCY", 8))
+        # Dead-letter entries queued but not yet committed; see flush_background_tasks.
+        self._background: Set[asyncio.Future] = set()
         logger.info("Sentiment Pipeline components initialized.")
 
+    def _extract_text(self, raw_event: RawEventDTO) -> str:
+        """
+        Extracts the text to analyze from a raw event's ``content`` or, failing that, its ``payload``.
+
+        Returns:
+            The extracted text; empty if neither field holds any.
+        """
+        text_to_process = ""
+        # First, try to get text from raw_event.content
+        if isinstance(raw_event.content, dict):
+            text_to_process = raw_event.content.get("text", "")
+            logger.debug(f"Event {raw_event.id}: Attempted to extract text from raw_event.content (dict). Found: '{bool(text_to_process)}'")
+        elif isinstance(raw_event.content, str):
+            try:
+                # Attempt to parse the string as JSON
+                content_json = json.loads(raw_event.content)
+                if isinstance(content_json, dict):
+                    text_to_process = content_json.get("text", "")
+                    logger.debug(f"Event {raw_event.id}: Successfully parsed raw_event.content as JSON dict. Found text: '{bool(text_to_process)}'")
+                else:
+                    # The JSON is valid but not a dict, treat the original string as text
+                    text_to_process = raw_event.content
+                    logger.debug(f"Event {raw_event.id}: Parsed raw_event.content as JSON, but it's not a dict. Using raw string.")
+            except json.JSONDecodeError:
+                # Not a JSON string, treat as plain text
+                text_to_process = raw_event.content
+                logger.debug(f"Event {raw_event.id}: raw_event.content is a non-JSON string. Using raw string.")
+        else:
+            logger.debug(f"Event {raw_event.id}: raw_event.content is neither dict nor str (type: {type(raw_event.content)}). Will check payload.")
+
+        # If text is still empty or only whitespace, try to get it from raw_event.payload
+        if not text_to_process.strip():
+            logger.debug(f"Event {raw_event.id}: Text from raw_event.content is empty. Checking raw_event.payload.")
+            if isinstance(raw_event.payload, dict):
+                text_to_process = raw_event.payload.get("text", "")
+                logger.debug(f"Event {raw_event.id}: Attempted to extract text from raw_event.payload (dict). Found: '{bool(text_to_process)}'")
+            else:
+                logger.debug(f"Event {raw_event.id}: raw_event.payload is not a dict (type: {type(raw_event.payload)}). Cannot extract text.")
+        return text_to_process
+
+    def _analyze_batch(self, raw_events: List[RawEventDTO]) -> Dict[int, BatchAnalysis]:
+        """
+        Preprocesses and analyzes the text of a whole batch of events at once.
+
+        All texts go through `Preprocessor.preprocess_many` and the target-language
+        ones through a single `SentimentAnalyzerComponent.analyze_many` call, so
+        the model runs batched forward passes instead of one per event.
+
+        Returns:
+            Mapping of raw event id to its preprocessed text and sentiment output
+            (None for non-target-language texts). Events without extractable text
+            are omitted; `process_single_event` moves them to the DLQ.
+        """
+        items = [(event, self._extract_text(event)) for event in raw_events]
+        items = [(event, text) for event, text in items if text.strip()]
+        if not items:
+            return {}
+
+        preprocessed = self.preprocessor.preprocess_many([text for _, text in items])
+        to_analyze = [
+            (event, data) for (event, _), data in zip(items, preprocessed) if data.is_target_language
+        ]
+        outputs = (
+            self.sentiment_analyzer.analyze_many([data.cleaned_text for _, data in to_analyze])
+            if to_analyze else []
+        )
+
+        analyses: Dict[int, BatchAnalysis] = {
+            event.id: (data, None) for (event, _), data in zip(items, preprocessed)
+        }
+        for (event, data), output in zip(to_analyze, outputs):
+            analyses[event.id] = (data, output)
+        return analyses
+
+    def _dead_letter_in_background(self, raw_event: RawEventDTO, error_message: str, failed_stage: str) -> None:
+        """
+        Queues a dead-letter write without waiting for it.
+
+        DLQ writes are bookkeeping for an event that has already failed, so they are
+        kept off the event's critical path and group-committed by the ResultProcessor;
+        `run_pipeline_once` awaits them through `flush_background_tasks` before the
+        batch is reported as finished.
+        """
+        future = self.result_processor.queue_dead_letter(
+            raw_event=raw_event,
+            error_message=error_message,
+            failed_stage=failed_stage,
+        )
+        self._background.add(future)
+        future.add_done_callback(self._background.discard)
+
+    async def flush_background_tasks(self) -> None:
+        """Commits and waits for all queued background writes, logging any that failed."""
+        if not self._background:
+            return
+        await self.result_processor.flush()
+        results = await asyncio.gather(*self._background, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Background dead-letter write failed: {result}", exc_info=result)
+
     async def process_single_event(
-        self, raw_event: RawEventDTO
-    ) -> Union[SentimentResultORM, DeadLetterEventORM, None]:
+        self, raw_event: RawEventDTO, precomputed: Optional[BatchAnalysis] = None
+    ) -> Union[SentimentResultORM, bool]:
         """
         Processes a single raw event: analyzes sentiment and saves the result.
         Manages its own database session to ensure transactional integrity per event.
 
         Args:
             raw_event: The raw event to process.
+            precomputed: Preprocessing and sentiment output already produced for this
+                event by `_analyze_batch`; when given, those stages are not rerun.
 
         Returns:
-            The ORM object for the saved result or dead-letter event, or None on failure.
+            The ORM object for the saved result, True if the event was skipped as
+            non-target language, or False if it was moved to the dead-letter queue.
         """
         logger.info(
             f"Starting processing for raw_event_id: {raw_event.id}, source: {raw_event.source}"
         )
         try:
             # 1. Preprocess Text
-            text_to_process = ""
-            # First, try to get text from raw_event.content
-            if isinstance(raw_event.content, dict):
-                text_to_process = raw_event.content.get("text", "")
-                logger.debug(f"Event {raw_event.id}: Attempted to extract text from raw_event.content (dict). Found: '{bool(text_to_process)}'")
-            elif isinstance(raw_event.content, str):
-                try:
-                    # Attempt to parse the string as JSON
-                    content_json = json.loads(raw_event.content)
-                    if isinstance(content_json, dict):
-                        text_to_process = content_json.get("text", "")
-                        logger.debug(f"Event {raw_event.id}: Successfully parsed raw_event.content as JSON dict. Found text: '{bool(text_to_process)}'")
-                    else:
-                        # The JSON is valid but not a dict, treat the original string as text
-                        text_to_process = raw_event.content
-                        logger.debug(f"Event {raw_event.id}: Parsed raw_event.content as JSON, but it's not a dict. Using raw string.")
-                except json.JSONDecodeError:
-                    # Not a JSON string, treat as plain text
-                    text_to_process = raw_event.content
-                    logger.debug(f"Event {raw_event.id}: raw_event.content is a non-JSON string. Using raw string.")
-            else:
-                logger.debug(f"Event {raw_event.id}: raw_event.content is neither dict nor str (type: {type(raw_event.content)}). Will check payload.")
+            text_to_process = self._extract_text(raw_event)
 
-            # If text is still empty or only whitespace, try to get it from raw_event.payload
-            if not text_to_process.strip():
-                logger.debug(f"Event {raw_event.id}: Text from raw_event.content is empty. Checking raw_event.payload.")
-                if isinstance(raw_event.payload, dict):
-                    text_to_process = raw_event.payload.get("text", "")
-                    logger.debug(f"Event {raw_event.id}: Attempted to extract text from raw_event.payload (dict). Found: '{bool(text_to_process)}'")
-                else:
-                    logger.debug(f"Event {raw_event.id}: raw_event.payload is not a dict (type: {type(raw_event.payload)}). Cannot extract text.")
-            
             # Validate extracted text
             if not text_to_process.strip():
                 logger.warning(f"Event {raw_event.id}: Extracted text content is empty or None after checking content and payload. Moving to DLQ.")
-                async with get_db_session_context_manager() as session:
-                    return await self.result_processor.move_to_dead_letter_queue(
-                        raw_event=raw_event,
-                        error_message="Extracted text content is empty or None after checking content and payload.",
-                        failed_stage="preprocessing_input_validation",
-                        db_session=session,
-                    )
+                self._dead_letter_in_background(
+                    raw_event,
+                    error_message="Extracted text content is empty or None after checking content and payload.",
+                    failed_stage="preprocessing_input_validation",
+                )
+                return False
 
             logger.info(f"Event {raw_event.id}: Successfully extracted text for processing: '{text_to_process[:100]}...'" )
-            preprocessed_data = self.preprocessor.preprocess(text_to_process)
+            if precomputed is not None:
+                preprocessed_data, sentiment_output = precomputed
+            else:
+                preprocessed_data, sentiment_output = self.preprocessor.preprocess(text_to_process), None
 
             if not preprocessed_data.is_target_language:
                 logger.info(f"Event {raw_event.id}: Language '{preprocessed_data.detected_language_code}' is not target '{self.preprocessor.target_language}'. Skipping sentiment analysis.")
@@ -125,13 +208,14 @@ class SentimentPipeline:
 
             # 2. Perform Sentiment Analysis
             logger.debug(f"Event {raw_event.id}: Performing sentiment analysis on: '{preprocessed_data.cleaned_text[:100]}...'" )
-            sentiment_output = self.sentiment_analyzer.analyze(preprocessed_data.cleaned_text)
+            if sentiment_output is None:
+                sentiment_output = self.sentiment_analyzer.analyze(preprocessed_data.cleaned_text)
             logger.debug(f"Event {raw_event.id}: Sentiment analysis result: {sentiment_output.label} (Conf: {sentiment_output.confidence:.2f})")
 
-            # 3. Save Result and Update Metrics
+            # 3. Save Result and Update Metrics (one statement, see save_sentiment_result_with_metrics)
             # ResultProcessor methods handle their own session management if None is passed.
             async with get_db_session_context_manager() as session:
-                saved_result_orm = await self.result_processor.save_sentiment_result(
+                saved_result_orm = await self.result_processor.save_sentiment_result_with_metrics(
                     raw_event=raw_event,
                     preprocessed_data=preprocessed_data,
                     sentiment_output=sentiment_output,
@@ -140,19 +224,13 @@ class SentimentPipeline:
 
                 if not saved_result_orm:
                     logger.error(f"Event {raw_event.id}: Failed to save sentiment result. Moving to DLQ.")
-                    # The save_sentiment_result already rolled back, so we just move to DLQ
-                    return await self.result_processor.move_to_dead_letter_queue(
-                        raw_event=raw_event,
+                    # The save already rolled back; the DLQ entry is written in its own session
+                    self._dead_letter_in_background(
+                        raw_event,
                         error_message="Failed to save sentiment result to database",
                         failed_stage="save_sentiment_result",
-                        db_session=session, # Use the same session for the DLQ entry
                     )
-
-                await self.result_processor.update_sentiment_metrics(
-                    sentiment_result=saved_result_orm,
-                    raw_event_source=raw_event.source,
-                    db_session=session,
-                )
+                    return False
 
                 await session.commit() # Commit the transaction for this single event
                 logger.info(f"Successfully processed and saved sentiment for raw_event_id: {raw_event.id}")
@@ -163,20 +241,30 @@ class SentimentPipeline:
                 f"Critical error processing raw_event_id {raw_event.id}: {e}", exc_info=True
             )
             # When a critical error occurs, move the event to the dead-letter queue
-            async with get_db_session_context_manager() as dlq_session:
-                return await self.result_processor.move_to_dead_letter_queue(
-                    raw_event=raw_event,
-                    error_message=str(e),
-                    failed_stage="process_single_event",
-                    db_session=dlq_session,
-                )
+            self._dead_letter_in_background(
+                raw_event, error_message=str(e), failed_stage="process_single_event"
+            )
+            return False
+
+    async def _process_with_semaphore(
+        self,
+        semaphore: asyncio.Semaphore,
+        raw_event: RawEventDTO,
+        precomputed: Optional[BatchAnalysis] = None,
+    ) -> Union[SentimentResultORM, bool]:
+        """Runs `process_single_event` once a concurrency slot is free."""
+        async with semaphore:
+            return await self.process_single_event(raw_event, precomputed)
 
     async def run_pipeline_once(self) -> int:
         """
         Runs one cycle of the sentiment analysis pipeline.
         1. Fetches and claims a batch of raw events in a transaction.
-        2. Concurrently processes each event in its own transaction.
-        3. Logs the outcome of the batch processing.
+        2. Preprocesses and analyzes the whole batch with batched model calls.
+        3. Saves every analyzed result with one `save_sentiment_results` call.
+        4. Concurrently handles the remaining events (skipped, invalid, or not saved
+           by the batch write) one by one, with at most `concurrency` in flight.
+        5. Logs the outcome of the batch processing.
 
         Returns:
             The number of events successfully processed.
@@ -185,13 +273,9 @@ class SentimentPipeline:
         fetched_events: List[RawEventDTO] = []
         results = []
 
-        # Step 1: Fetch and claim events in a single, short transaction.
+        # Step 1: Fetch and claim events in a single statement on the asyncpg pool.
         try:
-            async with get_db_session_context_manager() as session:
-                fetched_events = await fetch_and_claim_raw_events(
-                    db_session=session, batch_size=self.batch_size
-                )
-                await session.commit()
+            fetched_events = await fetch_and_claim_raw_events(batch_size=self.batch_size)
 
             if not fetched_events:
                 logger.info("No new events to process in this cycle.")
@@ -200,16 +284,46 @@ class SentimentPipeline:
             events_attempted = len(fetched_events)
             logger.info(f"Fetched and claimed {events_attempted} events to process.")
 
-            # Step 2: Process each event concurrently, each in its own transaction.
-            tasks = [self.process_single_event(event) for event in fetched_events]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Step 2: Run the model over the whole batch at once. If that fails, each
+            # event falls back to being analyzed on its own in process_single_event.
+            try:
+                analyses = self._analyze_batch(fetched_events)
+            except Exception as e:
+                logger.error(f"Batched analysis failed, falling back to per-event analysis: {e}", exc_info=True)
+                analyses = {}
+
+            # Step 3: Buffer the analyzed results and write them in a single transaction.
+            to_save = [
+                (event, *analyses[event.id])
+                for event in fetched_events
+                if event.id in analyses and analyses[event.id][1] is not None
+            ]
+            saved = await self.result_processor.save_sentiment_results(to_save) if to_save else []
+            if to_save and not saved:
+                logger.warning(f"Batch save of {len(to_save)} results failed, falling back to per-event saves.")
+            results = list(saved)
+            saved_ids = {event.id for event, _, _ in to_save} if saved else set()
+
+            # Step 4: Everything else goes through process_single_event concurrently,
+            # each in its own transaction. gather(return_exceptions=True) rather than a
+            # TaskGroup so that one failing event does not cancel the rest of the batch.
+            semaphore = asyncio.Semaphore(self.concurrency)
+            tasks = [
+                self._process_with_semaphore(semaphore, event, analyses.get(event.id))
+                for event in fetched_events
+                if event.id not in saved_ids
+            ]
+            results.extend(await asyncio.gather(*tasks, return_exceptions=True))
+            # Dead-letter writes were scheduled off the per-event path; land them before
+            # the batch is reported so the next cycle starts with nothing in flight.
+            await self.flush_background_tasks()
 
         except Exception as e:
             logger.critical(f"An unexpected error occurred in the pipeline fetch stage: {e}", exc_info=True)
             # If fetching fails, we can't do much else, so we return.
             return 0
 
-        # Step 3: Log the results of the processing batch.
+        # Step 5: Log the results of the processing batch.
         successful_count = sum(1 for r in results if r and not isinstance(r, (Exception, BaseException)))
         failed_count = events_attempted - successful_count
 
@@ -250,6 +364,9 @@ async def main_loop():
         logger.critical(f"Critical error in pipeline main_loop: {e}. Pipeline will exit.", exc_info=True)
         # In a real deployment, this might trigger alerts or a restart mechanism.
         raise # Re-raise to allow process managers to handle it.
+    finally:
+        # Commit any dead-letter entries still waiting for their group commit
+        await pipeline.result_processor.close()
 
 if __name__ == "__main__":
     # This setup is for standalone execution.
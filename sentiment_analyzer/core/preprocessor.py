@@ -11,7 +11,6 @@ import types
 from typing import Any, Optional
 
 import emoji
-from langdetect import LangDetectException, detect_langs
 from langdetect.detector_factory import DetectorFactory # For seeding
 
 # ---------------------------------------------------------------------------
@@ -57,6 +56,7 @@ except ModuleNotFoundError:  # pragma: no cover – only executes when spaCy not
     Doc = _DummyDoc  # type: ignore
 
 from sentiment_analyzer.config.settings import settings
+from sentiment_analyzer.core import lang_id
 from sentiment_analyzer.models.dtos import PreprocessedText
 
 logger = logging.getLogger(__name__)
@@ -64,12 +64,28 @@ logger = logging.getLogger(__name__)
 # Ensure langdetect is deterministic for tests if needed by seeding the factory
 # DetectorFactory.seed = 0 # Uncomment if strict reproducibility is required for langdetect
 
+# Cleaning patterns are compiled once at import time. They are applied one after
+# another, in this order: each pass sees the previous pass's output (e.g. a URL is
+# removed before the email pattern runs), which a single fused alternation would not.
+_URL_RE = re.compile(r"http\S+|www\S+|https\S+", re.MULTILINE)
+_EMAIL_RE = re.compile(r"\S*@\S*\s?")
+_MENTION_RE = re.compile(r"@\w+")
+# An alternative is to keep the word: re.sub(r"#(\w+)", r"\1", text)
+_HASHTAG_RE = re.compile(r"#\w+")
+_NOISE_PATTERNS = (_URL_RE, _EMAIL_RE, _MENTION_RE, _HASHTAG_RE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Texts shorter than this (after basic cleaning) skip language identification.
+_MIN_LANG_ID_CHARS = 10
+
 class Preprocessor:
     """
     Handles text preprocessing tasks including language detection, cleaning, 
     lemmatization, and stop-word removal.
     """
 
+    _NOISE_PATTERNS = _NOISE_PATTERNS
+
     def __init__(
         self,
         spacy_model_name: str = settings.SPACY_MODEL_NAME,
@@ -102,18 +118,13 @@ class Preprocessor:
         """
         Performs basic text cleaning: URL, email, mention, hashtag removal, and emoji demojization.
         """
-        # Remove URLs
-        text = re.sub(r"http\S+|www\S+|https\S+", "", text, flags=re.MULTILINE)
-        # Remove emails
-        text = re.sub(r"\S*@\S*\s?", "", text)
-        # Remove mentions (@username)
-        text = re.sub(r"@\w+", "", text)
-        # Remove hashtags (#hashtag) - an alternative is to keep the word: re.sub(r"#(\w+)", r"\1", text)
-        text = re.sub(r"#\w+", "", text)
+        # Remove URLs, emails, mentions and hashtags, in that order
+        for pattern in self._NOISE_PATTERNS:
+            text = pattern.sub("", text)
         # Convert emojis to text representation (e.g., 😊 -> :smiling_face_with_smiling_eyes:)
         text = emoji.demojize(text, delimiters=(" :", ": "))
         # Remove extra whitespace that might have been introduced
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE_RE.sub(" ", text).strip()
         return text
 
     def _lemmatize_and_filter_tokens(self, doc) -> str:
@@ -170,16 +181,23 @@ class Preprocessor:
         """
         if not text or text.isspace():
             return "unknown", None
-        try:
-            # detect_langs returns a list of LangDetectResult(lang, prob)
-            detections = detect_langs(text)
-            if detections:
-                best_detection = detections[0]
-                return best_detection.lang, best_detection.prob
-            return "unknown", None
-        except LangDetectException:
-            logger.warning(f"Language detection failed for text: '{text[:100]}...'", exc_info=False) # exc_info=True for full stack trace
-            return "unknown", None
+        if len(text) < _MIN_LANG_ID_CHARS:
+            # Too short for a reliable guess; assume the target language rather
+            # than paying for detection and likely discarding the text.
+            return self.target_language, None
+        return lang_id.detect_with_confidence(text)
+
+    @staticmethod
+    def _empty_result(text: Any) -> PreprocessedText:
+        """Builds the DTO returned for empty, whitespace-only or non-string input."""
+        logger.warning("Received empty or non-string input for preprocessing.")
+        return PreprocessedText(
+            original_text=str(text),  # Ensure original_text is a string
+            cleaned_text="",
+            detected_language_code="unknown",
+            detected_language_confidence=None,
+            is_target_language=True,  # treat empty as neutral target for tests
+        )
 
     def preprocess(self, text: str) -> PreprocessedText:
         """
@@ -193,14 +211,7 @@ class Preprocessor:
                               detected language, and target language status.
         """
         if not isinstance(text, str) or not text.strip():
-            logger.warning("Received empty or non-string input for preprocessing.")
-            return PreprocessedText(
-                original_text=str(text),  # Ensure original_text is a string
-                cleaned_text="",
-                detected_language_code="unknown",
-                detected_language_confidence=None,
-                is_target_language=True,  # treat empty as neutral target for tests
-            )
+            return self._empty_result(text)
 
         # Perform basic cleaning first (URLs, emojis, etc.)
         partially_cleaned_text = self._clean_text_basic(text)
@@ -236,6 +247,65 @@ class Preprocessor:
             is_target_language=is_target,
         )
 
+    def preprocess_many(self, texts: list[str], batch_size: int = 64) -> list[PreprocessedText]:
+        """
+        Applies the preprocessing pipeline to a batch of texts.
+
+        Cleaning and language detection run per text, but all target-language
+        texts are tokenized together through ``nlp.pipe`` so spaCy's pipeline
+        overhead is paid once per batch rather than once per document.
+
+        Args:
+            texts (list[str]): The raw input texts.
+            batch_size (int): Number of documents spaCy buffers per internal batch.
+
+        Returns:
+            list[PreprocessedText]: One DTO per input text, in input order.
+        """
+        results: list[Optional[PreprocessedText]] = [None] * len(texts)
+        # (index, partially cleaned text, language code, confidence) awaiting spaCy
+        pending: list[tuple[int, str, str, Optional[float]]] = []
+
+        for idx, text in enumerate(texts):
+            if not isinstance(text, str) or not text.strip():
+                results[idx] = self._empty_result(text)
+                continue
+
+            partially_cleaned_text = self._clean_text_basic(text)
+            lang_code, lang_confidence = self.detect_language(partially_cleaned_text)
+            is_target = lang_code == self.target_language
+
+            if is_target and not self._use_fallback:
+                pending.append((idx, partially_cleaned_text, lang_code, lang_confidence))
+                continue
+
+            if is_target:
+                final_cleaned_text = self._lemmatize_and_filter_tokens(partially_cleaned_text)
+            else:
+                final_cleaned_text = partially_cleaned_text.lower()
+            results[idx] = PreprocessedText(
+                original_text=text,
+                cleaned_text=final_cleaned_text,
+                detected_language_code=lang_code,
+                detected_language_confidence=lang_confidence,
+                is_target_language=is_target,
+            )
+
+        if pending:
+            docs = self.nlp.pipe(
+                [cleaned for _, cleaned, _, _ in pending], batch_size=batch_size, n_process=1
+            )
+            for (idx, _, lang_code, lang_confidence), doc in zip(pending, docs):
+                results[idx] = PreprocessedText(
+                    original_text=texts[idx],
+                    cleaned_text=self._lemmatize_and_filter_tokens(doc),
+                    detected_language_code=lang_code,
+                    detected_language_confidence=lang_confidence,
+                    is_target_language=True,
+                )
+
+        return results  # type: ignore[return-value] – every slot is filled above
+
 # Example Usage (for testing or demonstration)
 if __name__ == "__main__":
     # Configure basic logging for the example
@@ -5,11 +5,14 @@ This component is responsible for saving the results of sentiment analysis
 to the database and updating any relevant aggregated metrics.
 It also handles moving failed events to a dead-letter queue.
 """
+import asyncio
+import contextlib
 import logging
 from datetime import datetime, timezone
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
-from sqlalchemy import select, update # SQLAlchemy 2.0 style
+import orjson
+from sqlalchemy import literal, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert # For ON CONFLICT DO UPDATE
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,23 +21,49 @@ from sentiment_analyzer.models.dtos import (
     RawEventDTO,
     PreprocessedText,
     SentimentAnalysisOutput,
+    SentimentResultDTO,
 )
 from sentiment_analyzer.models import (
+    SentimentLabel,
     SentimentResultORM,
     SentimentMetricORM,
     DeadLetterEventORM,
 )
-from sentiment_analyzer.models.dtos import SentimentResultDTO
+from sentiment_analyzer.config.settings import settings
 from sentiment_analyzer.utils.db_session import get_db_session_context_manager as get_async_db_session
 from sentiment_analyzer.integrations.powerbi import PowerBIClient
 
 logger = logging.getLogger(__name__)
 
+# Column order of the records passed to COPY in save_sentiment_results_bulk
+_COPY_COLUMNS = (
+    "event_id",
+    "occurred_at",
+    "source",
+    "source_id",
+    "sentiment_score",
+    "sentiment_label",
+    "confidence",
+    "sentiment_scores_json",
+    "processed_at",
+    "model_version",
+    "raw_text",
+)
+
+# A dead-letter entry waiting for the group commit, and the future resolved once it ran
+_PendingDeadLetter = Tuple[DeadLetterEventORM, "asyncio.Future[Optional[DeadLetterEventORM]]"]
+
 class ResultProcessor:
     """
     Handles saving sentiment analysis results, updating metrics, and managing dead-letter events.
     """
-    def __init__(self, session: Optional[AsyncSession] = None, powerbi_client: Optional[PowerBIClient] = None):
+    def __init__(
+        self,
+        session: Optional[AsyncSession] = None,
+        powerbi_client: Optional[PowerBIClient] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+    ):
         """
         Initializes the ResultProcessor.
 
@@ -42,9 +71,225 @@ class ResultProcessor:
             session: An optional SQLAlchemy AsyncSession to use for database operations.
                      If None, a new session will be created for each operation.
             powerbi_client: An optional PowerBI client for real-time streaming.
+            batch_size: Max dead-letter entries per group commit;
+                        defaults to settings.DLQ_GROUP_COMMIT_BATCH_SIZE.
+            flush_interval_ms: How long the flusher waits for more entries before committing;
+                               defaults to settings.DLQ_GROUP_COMMIT_INTERVAL_MS.
         """
         self._shared_session = session
         self._powerbi_client = powerbi_client
+        # Group commit for dead-letter writes, see queue_dead_letter
+        self._pending_dlq: "asyncio.Queue[_PendingDeadLetter]" = asyncio.Queue()
+        self._group_commit_size = batch_size or settings.DLQ_GROUP_COMMIT_BATCH_SIZE
+        self._flush_interval = (
+            flush_interval_ms if flush_interval_ms is not None else settings.DLQ_GROUP_COMMIT_INTERVAL_MS
+        ) / 1000
+        self._flusher: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _build_result_values(
+        raw_event: RawEventDTO,
+        preprocessed_data: PreprocessedText,
+        sentiment_output: SentimentAnalysisOutput,
+    ) -> Dict:
+        """Column values for a new `sentiment_results` row."""
+        return dict(
+            event_id=raw_event.id,  # Always use internal numeric id for DB column (BIGINT)
+            occurred_at=raw_event.occurred_at if raw_event.occurred_at else datetime.now(timezone.utc),
+            source=raw_event.source if raw_event.source else "unknown",
+            source_id=raw_event.source_id if raw_event.source_id else "unknown",
+            sentiment_label=sentiment_output.label,
+            sentiment_score=sentiment_output.confidence, # Assuming this is the primary score for the label
+            confidence=sentiment_output.confidence,
+            sentiment_scores_json=sentiment_output.scores,
+            model_version=sentiment_output.model_version,
+            raw_text=preprocessed_data.original_text,
+            processed_at=datetime.now(timezone.utc),
+        )
+
+    @staticmethod
+    def _upsert_metric(insert_stmt):
+        """
+        Adds the metric aggregation conflict clause to an INSERT into `sentiment_metrics`.
+
+        Backed by pk_sentiment_metric; a single-statement upsert avoids a SELECT
+        plus an UPDATE that has to plan across every hypertable chunk. The inserted
+        row may already aggregate several results (``count`` > 1), in which case it
+        is merged into the stored average weighted by its count.
+        """
+        metrics_table = SentimentMetricORM.__table__
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["time_bucket", "source", "source_id", "label"],
+            set_={
+                "count": metrics_table.c.count + insert_stmt.excluded.count,
+                "avg_score": (
+                    metrics_table.c.avg_score * metrics_table.c.count
+                    + insert_stmt.excluded.avg_score * insert_stmt.excluded.count
+                ) / (metrics_table.c.count + insert_stmt.excluded.count),
+            },
+        )
+
+    @staticmethod
+    def _copy_record(values: Dict) -> Tuple:
+        """A `sentiment_results` row as a COPY record, in `_COPY_COLUMNS` order."""
+        # COPY bypasses the column types, so encode the label and the scores JSON here
+        encoded = {
+            **values,
+            "sentiment_label": SentimentLabel.from_label(values["sentiment_label"]).value,
+            "sentiment_scores_json": orjson.dumps(values["sentiment_scores_json"]).decode(),
+        }
+        return tuple(encoded[column] for column in _COPY_COLUMNS)
+
+    @classmethod
+    def _batch_metric_upsert(cls, rows: List[Dict]) -> Tuple:
+        """
+        Builds one multi-row metric upsert covering a batch of `sentiment_results` rows.
+
+        Rows are pre-aggregated per (hour, source, source_id, label): ON CONFLICT
+        cannot update the same row twice in one statement.
+
+        Returns:
+            The upsert statement and the number of metric rows it writes.
+        """
+        # (count, score sum) per metric row
+        buckets: Dict[Tuple, List[float]] = {}
+        for values in rows:
+            key = (
+                values["processed_at"].replace(minute=0, second=0, microsecond=0),
+                values["source"],
+                values["source_id"],
+                values["sentiment_label"],
+            )
+            bucket = buckets.setdefault(key, [0, 0.0])
+            bucket[0] += 1
+            bucket[1] += values["sentiment_score"]
+
+        upsert = cls._upsert_metric(
+            pg_insert(SentimentMetricORM).values([
+                dict(
+                    time_bucket=time_bucket,
+                    source=source,
+                    source_id=source_id,
+                    label=label,
+                    count=count,
+                    avg_score=score_sum / count,
+                )
+                for (time_bucket, source, source_id, label), (count, score_sum) in buckets.items()
+            ])
+        )
+        return upsert, len(buckets)
+
+    async def _stream_to_powerbi(self, result_orm: SentimentResultORM, raw_event_id: int) -> None:
+        """Pushes a saved result to PowerBI, if configured, without failing the caller."""
+        if not self._powerbi_client:
+            return
+        try:
+            # Convert ORM to DTO for PowerBI streaming
+            result_dto = SentimentResultDTO.from_orm_fast(result_orm)
+
+            # Stream to PowerBI (non-blocking)
+            await self._powerbi_client.push_row(result_dto)
+            logger.debug(f"Streamed sentiment result to PowerBI for event_id: {raw_event_id}")
+        except Exception as powerbi_error:
+            # Don't fail the entire operation if PowerBI streaming fails
+            logger.warning(
+                f"Failed to stream result to PowerBI for event_id {raw_event_id}: {powerbi_error}"
+            )
+
+    async def _stream_many_to_powerbi(self, result_orms: List[SentimentResultORM]) -> None:
+        """Pushes a batch of saved results to PowerBI in one request, without failing the caller."""
+        if not self._powerbi_client or not result_orms:
+            return
+        try:
+            await self._powerbi_client.push_rows(
+                [SentimentResultDTO.from_orm_fast(result_orm) for result_orm in result_orms]
+            )
+            logger.debug(f"Streamed {len(result_orms)} sentiment results to PowerBI")
+        except Exception as powerbi_error:
+            logger.warning(f"Failed to stream {len(result_orms)} results to PowerBI: {powerbi_error}")
+
+    async def save_sentiment_result_with_metrics(
+        self,
+        raw_event: RawEventDTO,
+        preprocessed_data: PreprocessedText,
+        sentiment_output: SentimentAnalysisOutput,
+        db_session: Optional[AsyncSession] = None,
+    ) -> Optional[SentimentResultORM]:
+        """
+        Saves a sentiment result and updates its hourly metric in one statement.
+
+        Equivalent to save_sentiment_result followed by update_sentiment_metrics,
+        but issued as a single round-trip:
+        ``WITH inserted_result AS (INSERT INTO sentiment_results ... RETURNING *),
+        upserted_metric AS (INSERT INTO sentiment_metrics ... SELECT ... FROM
+        inserted_result ON CONFLICT ... DO UPDATE ...) SELECT * FROM inserted_result``,
+        so a result can never be committed without its metric.
+
+        Args:
+            raw_event: The original raw event DTO.
+            preprocessed_data: The DTO containing preprocessed text and language info.
+            sentiment_output: The DTO containing sentiment analysis output.
+            db_session: Optional existing database session. If None, a new one is created.
+
+        Returns:
+            The saved SentimentResultORM object (detached from the session) if successful, else None.
+        """
+        session_manager = get_async_db_session(
+            existing_session=db_session or self._shared_session
+        )
+        async with session_manager as session:
+            try:
+                values = self._build_result_values(raw_event, preprocessed_data, sentiment_output)
+                metric_ts = values["processed_at"].replace(minute=0, second=0, microsecond=0)
+
+                results_table = SentimentResultORM.__table__
+                inserted = (
+                    results_table.insert()
+                    .values(**values)
+                    .returning(*results_table.c)
+                    .cte("inserted_result")
+                )
+                upserted = self._upsert_metric(
+                    pg_insert(SentimentMetricORM.__table__).from_select(
+                        ["time_bucket", "source", "source_id", "label", "count", "avg_score"],
+                        select(
+                            literal(metric_ts, SentimentMetricORM.__table__.c.time_bucket.type),
+                            inserted.c.source,
+                            inserted.c.source_id,
+                            # Metrics keep the text label; the result row stores its SMALLINT code
+                            literal(sentiment_output.label, SentimentMetricORM.__table__.c.label.type),
+                            literal(1),
+                            inserted.c.sentiment_score,
+                        ).select_from(inserted),
+                    )
+                ).cte("upserted_metric")
+
+                row = (
+                    await session.execute(select(inserted).add_cte(upserted))
+                ).one()
+                new_result_orm = SentimentResultORM(**row._mapping)
+
+                if not db_session:
+                    await session.commit()
+                logger.info(f"Saved sentiment result and metrics for raw_event_id: {raw_event.id}")
+
+                await self._stream_to_powerbi(new_result_orm, raw_event.id)
+
+                return new_result_orm
+            except SQLAlchemyError as e:
+                logger.error(
+                    f"Database error saving sentiment result and metrics for raw_event_id {raw_event.id}: {e}",
+                    exc_info=True
+                )
+                await session.rollback()
+                return None
+            except Exception as e:
+                logger.error(
+                    f"Unexpected error saving sentiment result and metrics for raw_event_id {raw_event.id}: {e}",
+                    exc_info=True
+                )
+                await session.rollback()
+                return None
 
     async def save_sentiment_result(
         self,
@@ -72,18 +317,7 @@ class ResultProcessor:
         async with session_manager as session:
             try:
                 new_result_orm = SentimentResultORM(
-                    # Use internal numeric id for DB column (BIGINT)
-                    event_id=raw_event.id,  # Always use internal numeric id for DB column (BIGINT)
-                    occurred_at=raw_event.occurred_at if raw_event.occurred_at else datetime.now(timezone.utc),
-                    source=raw_event.source if raw_event.source else "unknown",
-                    source_id=raw_event.source_id if raw_event.source_id else "unknown",
-                    sentiment_label=sentiment_output.label,
-                    sentiment_score=sentiment_output.confidence, # Assuming this is the primary score for the label
-                    confidence=sentiment_output.confidence, # Added mapping for the explicit confidence field
-                    sentiment_scores_json=sentiment_output.scores,
-                    model_version=sentiment_output.model_version,
-                    raw_text=preprocessed_data.original_text, # Added, using original_text for raw_text field
-                    processed_at=datetime.now(timezone.utc)
+                    **self._build_result_values(raw_event, preprocessed_data, sentiment_output)
                 )
                 session.add(new_result_orm)
 
@@ -99,32 +333,7 @@ class ResultProcessor:
                 await session.refresh(new_result_orm)
                 logger.info(f"Saved sentiment result for raw_event_id: {raw_event.id}")
                 
-                # Stream to PowerBI if client is available
-                if self._powerbi_client:
-                    try:
-                        # Convert ORM to DTO for PowerBI streaming
-                        result_dto = SentimentResultDTO(
-                            id=new_result_orm.id,
-                            event_id=str(new_result_orm.event_id),  # Convert to string for DTO
-                            occurred_at=new_result_orm.occurred_at,
-                            source=new_result_orm.source,
-                            source_id=new_result_orm.source_id,
-                            sentiment_score=new_result_orm.sentiment_score,
-                            sentiment_label=new_result_orm.sentiment_label,
-                            confidence=new_result_orm.confidence,
-                            processed_at=new_result_orm.processed_at,
-                            model_version=new_result_orm.model_version,
-                            raw_text=new_result_orm.raw_text
-                        )
-                        
-                        # Stream to PowerBI (non-blocking)
-                        await self._powerbi_client.push_row(result_dto)
-                        logger.debug(f"Streamed sentiment result to PowerBI for event_id: {raw_event.id}")
-                    except Exception as powerbi_error:
-                        # Don't fail the entire operation if PowerBI streaming fails
-                        logger.warning(
-                            f"Failed to stream result to PowerBI for event_id {raw_event.id}: {powerbi_error}"
-                        )
+                await self._stream_to_powerbi(new_result_orm, raw_event.id)
                 
                 return new_result_orm
             except SQLAlchemyError as e:
@@ -142,6 +351,130 @@ class ResultProcessor:
                 await session.rollback()
                 return None
 
+    async def save_sentiment_results(
+        self,
+        batch: List[Tuple[RawEventDTO, PreprocessedText, SentimentAnalysisOutput]],
+        db_session: Optional[AsyncSession] = None,
+    ) -> List[SentimentResultORM]:
+        """
+        Saves a batch of sentiment results and their hourly metrics in one transaction.
+
+        The batched counterpart of save_sentiment_result_with_metrics: all rows go
+        out in one multi-row ``INSERT ... RETURNING`` (SQLAlchemy's insertmanyvalues),
+        and the metrics are pre-aggregated per (hour, source, source_id, label) so a
+        single multi-row upsert updates them. A whole batch therefore costs two
+        statements and one commit instead of one round-trip and commit per event.
+        Either every row of the batch is saved or none is.
+
+        Args:
+            batch: (raw event, preprocessed text, sentiment output) triples to persist.
+            db_session: Optional existing database session. If None, a new one is created.
+
+        Returns:
+            The saved SentimentResultORM objects (detached from the session), in
+            batch order, or an empty list if the operation failed.
+        """
+        if not batch:
+            return []
+
+        session_manager = get_async_db_session(
+            existing_session=db_session or self._shared_session
+        )
+        async with session_manager as session:
+            try:
+                rows = [self._build_result_values(*item) for item in batch]
+                metric_upsert, metric_rows = self._batch_metric_upsert(rows)
+
+                results_table = SentimentResultORM.__table__
+                inserted = await session.execute(
+                    results_table.insert().returning(*results_table.c, sort_by_parameter_order=True),
+                    rows,
+                )
+                saved = [SentimentResultORM(**row._mapping) for row in inserted.all()]
+                await session.execute(metric_upsert)
+
+                if not db_session:
+                    await session.commit()
+                logger.info(f"Saved {len(saved)} sentiment results and {metric_rows} metric rows")
+
+                await self._stream_many_to_powerbi(saved)
+
+                return saved
+            except SQLAlchemyError as e:
+                logger.error(f"Database error saving batch of {len(batch)} sentiment results: {e}", exc_info=True)
+                await session.rollback()
+                return []
+            except Exception as e:
+                logger.error(f"Unexpected error saving batch of {len(batch)} sentiment results: {e}", exc_info=True)
+                await session.rollback()
+                return []
+
+    async def save_sentiment_results_bulk(
+        self,
+        results: List[Tuple[RawEventDTO, PreprocessedText, SentimentAnalysisOutput]],
+        db_session: Optional[AsyncSession] = None,
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """
+        Saves many sentiment analysis results using PostgreSQL COPY, with their metrics.
+
+        Rows are streamed with asyncpg's binary ``copy_records_to_table`` on the
+        session's own connection, in one transaction with the same pre-aggregated
+        metric upsert save_sentiment_results issues: either every row and its
+        metrics are saved or nothing is. Unlike
+        save_sentiment_results, no ORM objects are returned and nothing is
+        streamed to PowerBI, since COPY does not return generated ids; the
+        pipeline therefore uses save_sentiment_results, and this method is meant
+        for backfills where neither is needed.
+
+        Args:
+            results: (raw event, preprocessed text, sentiment output) triples to persist.
+            db_session: Optional existing database session. If None, a new one is created.
+            batch_size: Rows per COPY; defaults to settings.RESULT_COPY_BATCH_SIZE.
+
+        Returns:
+            The number of rows written, or 0 if the operation failed.
+        """
+        if not results:
+            return 0
+        batch_size = batch_size or settings.RESULT_COPY_BATCH_SIZE
+
+        session_manager = get_async_db_session(
+            existing_session=db_session or self._shared_session
+        )
+        async with session_manager as session:
+            try:
+                rows = [self._build_result_values(*item) for item in results]
+
+                # The metric upsert goes first: SQLAlchemy's asyncpg adapter only sends
+                # BEGIN on its first statement, and COPY on the raw driver connection
+                # would otherwise run (and commit each chunk) in autocommit mode.
+                metric_upsert, _ = self._batch_metric_upsert(rows)
+                await session.execute(metric_upsert)
+
+                connection = await session.connection()
+                raw_connection = await connection.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+
+                written = 0
+                for start in range(0, len(rows), batch_size):
+                    records = [self._copy_record(values) for values in rows[start:start + batch_size]]
+                    await driver_connection.copy_records_to_table(
+                        SentimentResultORM.__tablename__,
+                        records=records,
+                        columns=_COPY_COLUMNS,
+                    )
+                    written += len(records)
+
+                if not db_session:
+                    await session.commit()
+                logger.info(f"Saved {written} sentiment results via COPY")
+                return written
+            except Exception as e:
+                logger.error(f"Error bulk saving {len(results)} sentiment results: {e}", exc_info=True)
+                await session.rollback()
+                return 0
+
     async def update_sentiment_metrics(
         self,
         sentiment_result: SentimentResultORM,
@@ -168,41 +501,17 @@ class ResultProcessor:
                 metric_ts = sentiment_result.processed_at.replace(minute=0, second=0, microsecond=0)
                 source_id_value = getattr(sentiment_result, "source_id", "unknown")
 
-                existing_stmt = select(SentimentMetricORM).where(
-                    (SentimentMetricORM.time_bucket == metric_ts) &
-                    (SentimentMetricORM.source == raw_event_source) &
-                    (SentimentMetricORM.source_id == source_id_value) &
-                    (SentimentMetricORM.label == sentiment_result.sentiment_label)
-                )
-
-                existing_metric_result = await session.execute(existing_stmt)
-                existing_metric = existing_metric_result.scalars().first()
-
-                if existing_metric:
-                    new_count = existing_metric.count + 1
-                    new_avg = ((existing_metric.avg_score * existing_metric.count) + sentiment_result.sentiment_score) / new_count
-
-                    await session.execute(
-                        update(SentimentMetricORM)
-                        .where(
-                            (SentimentMetricORM.time_bucket == metric_ts) &
-                            (SentimentMetricORM.source == raw_event_source) &
-                            (SentimentMetricORM.source_id == source_id_value) &
-                            (SentimentMetricORM.label == sentiment_result.sentiment_label)
-                        )
-                        .values(count=new_count, avg_score=new_avg)
-                    )
-                else:
-                    await session.execute(
-                        pg_insert(SentimentMetricORM).values(
-                            time_bucket=metric_ts,
-                            source=raw_event_source,
-                            source_id=source_id_value,
-                            label=sentiment_result.sentiment_label,
-                            count=1,
-                            avg_score=sentiment_result.sentiment_score,
-                        )
+                upsert_stmt = self._upsert_metric(
+                    pg_insert(SentimentMetricORM).values(
+                        time_bucket=metric_ts,
+                        source=raw_event_source,
+                        source_id=source_id_value,
+                        label=sentiment_result.sentiment_label,
+                        count=1,
+                        avg_score=sentiment_result.sentiment_score,
                     )
+                )
+                await session.execute(upsert_stmt)
                 if not db_session:
                     await session.commit()
                 logger.info(f"Updated sentiment metrics for result_id: {sentiment_result.id}, source: {raw_event_source}")
@@ -222,6 +531,119 @@ class ResultProcessor:
                 await session.rollback()
                 return False
 
+    @staticmethod
+    def _build_dead_letter(raw_event: RawEventDTO, error_message: str, failed_stage: str) -> DeadLetterEventORM:
+        """A new `dead_letter_events` row for a failed raw event."""
+        content_json: Dict = raw_event.model_dump(mode="json") if raw_event else {}
+        return DeadLetterEventORM(
+            event_id=raw_event.event_id if raw_event.event_id is not None else str(raw_event.id),
+            occurred_at=raw_event.occurred_at if raw_event and raw_event.occurred_at else datetime.now(timezone.utc), # Added
+            source=raw_event.source if raw_event and raw_event.source else "unknown", # Added
+            source_id=raw_event.source_id if raw_event and raw_event.source_id else "unknown", # Added
+            event_payload=content_json,
+            error_msg=error_message,  # Corrected: failure_reason to error_msg
+            processing_component=failed_stage,  # Corrected: failed_stage to processing_component
+            failed_at=datetime.now(timezone.utc),
+        )
+
+    def start(self) -> None:
+        """Starts the background task that group-commits queued dead-letter entries."""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """Stops the background flusher and commits whatever is still queued."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush()
+
+    def queue_dead_letter(
+        self,
+        raw_event: RawEventDTO,
+        error_message: str,
+        failed_stage: str,
+    ) -> "asyncio.Future[Optional[DeadLetterEventORM]]":
+        """
+        Queues a failed event for the dead-letter queue without writing it yet.
+
+        Entries are committed in groups by a background flusher (started on first
+        use): it waits up to the flush interval for more entries to arrive, then
+        writes up to `batch_size` of them with one ``add_all`` and one commit, so a
+        burst of failures pays for one WAL flush rather than one per event.
+
+        Args:
+            raw_event: The DTO of the raw event that failed.
+            error_message: A description of the error.
+            failed_stage: The pipeline stage where the failure occurred.
+
+        Returns:
+            A future resolved with the saved DeadLetterEventORM object once its
+            group is committed, or with None if that commit failed.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_dlq.put_nowait(
+            (self._build_dead_letter(raw_event, error_message, failed_stage), future)
+        )
+        self.start()
+        return future
+
+    async def flush(self) -> None:
+        """
+        Commits every queued dead-letter entry now.
+
+        Entries the background flusher has already taken are committed by it;
+        their futures resolve once that commit finishes.
+        """
+        while not self._pending_dlq.empty():
+            await self._commit_dead_letters(self._drain_dead_letters())
+
+    def _drain_dead_letters(self, first: Optional[_PendingDeadLetter] = None) -> List[_PendingDeadLetter]:
+        """Takes up to one group's worth of queued entries."""
+        batch = [first] if first is not None else []
+        while len(batch) < self._group_commit_size and not self._pending_dlq.empty():
+            batch.append(self._pending_dlq.get_nowait())
+        return batch
+
+    async def _flush_loop(self) -> None:
+        """Background writer: commits queued dead-letter entries in groups."""
+        while True:
+            first = await self._pending_dlq.get()
+            try:
+                # Let entries queued by concurrently failing events join this commit
+                await asyncio.sleep(self._flush_interval)
+            finally:
+                # Also on cancellation (close()), so a taken entry is never dropped
+                await self._commit_dead_letters(self._drain_dead_letters(first))
+
+    async def _commit_dead_letters(self, batch: List[_PendingDeadLetter]) -> None:
+        """Writes a group of dead-letter entries in one transaction and resolves their futures."""
+        if not batch:
+            return
+        committed = False
+        try:
+            session_manager = get_async_db_session(existing_session=self._shared_session)
+            async with session_manager as session:
+                try:
+                    session.add_all([dle_orm for dle_orm, _ in batch])
+                    await session.commit()
+                    committed = True
+                    logger.info(f"Moved {len(batch)} events to dead-letter queue")
+                except Exception as e:
+                    logger.error(f"Error committing {len(batch)} dead-letter events: {e}", exc_info=True)
+                    await session.rollback()
+        except Exception as e:
+            # Opening or closing the session failed; the entries are not persisted
+            committed = False
+            logger.error(f"Session error committing {len(batch)} dead-letter events: {e}", exc_info=True)
+        finally:
+            # Always resolve, so waiters (e.g. flush_background_tasks) never hang
+            for dle_orm, future in batch:
+                if not future.done():
+                    future.set_result(dle_orm if committed else None)
+
     async def move_to_dead_letter_queue(
         self,
         raw_event: RawEventDTO,
@@ -246,18 +668,7 @@ class ResultProcessor:
         )
         async with session_manager as session:
             try:
-                content_json: Dict = raw_event.model_dump(mode="json") if raw_event else {}
-
-                new_dle_orm = DeadLetterEventORM(
-                    event_id=raw_event.event_id if raw_event.event_id is not None else str(raw_event.id),
-                    occurred_at=raw_event.occurred_at if raw_event and raw_event.occurred_at else datetime.now(timezone.utc), # Added
-                    source=raw_event.source if raw_event and raw_event.source else "unknown", # Added
-                    source_id=raw_event.source_id if raw_event and raw_event.source_id else "unknown", # Added
-                    event_payload=content_json,
-                    error_msg=error_message,  # Corrected: failure_reason to error_msg
-                    processing_component=failed_stage,  # Corrected: failed_stage to processing_component
-                    failed_at=datetime.now(timezone.utc),
-                )
+                new_dle_orm = self._build_dead_letter(raw_event, error_message, failed_stage)
                 session.add(new_dle_orm)
 
                 if not db_session:
@@ -267,7 +678,8 @@ class ResultProcessor:
                     # without committing the transaction.
                     await session.flush()
 
-                await session.refresh(new_dle_orm)
+                # No refresh: failed_at is set client-side and the id comes back
+                # from INSERT ... RETURNING, so the row is already complete.
                 logger.info(
                     f"Moved event (raw_event_id: {raw_event.id if raw_event else 'N/A'}) to dead-letter queue. Stage: {failed_stage}"
                 )
@@ -300,13 +712,11 @@ async def example_usage():
     mock_raw_event = RawEventDTO(
         id=101,
         source="example_source",
-        author="example_author",
         content="This is a test content for result processing! It's quite positive.",
-        created_at_external=datetime.now(timezone.utc),
+        occurred_at=datetime.now(timezone.utc),
         # These would be set by DataFetcher in a real scenario
-        claimed_at=None, 
-        processed_at=None, 
-        processing_status="unprocessed"
+        processed=False,
+        processed_at=None
     )
     mock_preprocessed = PreprocessedText(
         original_text=mock_raw_event.content,
@@ -345,10 +755,9 @@ async def example_usage():
     failed_event_data = RawEventDTO(
         id=102, # Different ID for DLQ example
         source="another_source",
-        author="another_author",
         content="This event failed processing due to some error.",
-        created_at_external=datetime.now(timezone.utc),
-        claimed_at=None, processed_at=None, processing_status="unprocessed"
+        occurred_at=datetime.now(timezone.utc),
+        processed=False, processed_at=None
     )
     moved_to_dlq = await processor.move_to_dead_letter_queue(
         raw_event=failed_event_data,
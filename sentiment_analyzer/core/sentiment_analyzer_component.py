@@ -6,7 +6,7 @@ to perform sentiment analysis on preprocessed text.
 """
 import importlib
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from sentiment_analyzer.config.settings import settings
 from sentiment_analyzer.models.dtos import SentimentAnalysisOutput
@@ -37,6 +37,7 @@ class SentimentAnalyzerComponent:
         self,
         model_name: str = settings.FINBERT_MODEL_NAME,
         use_gpu_if_available: bool = settings.USE_GPU_IF_AVAILABLE,
+        quantized: bool = settings.SENTIMENT_MODEL_INT8,
     ):
         """
         Initializes the SentimentAnalyzerComponent, loading the model and tokenizer.
@@ -44,6 +45,8 @@ class SentimentAnalyzerComponent:
         Args:
             model_name (str): The name or path of the Hugging Face model to load.
             use_gpu_if_available (bool): Whether to use GPU if available.
+            quantized (bool): Whether to apply dynamic int8 quantization to the model's
+                              Linear layers. Only takes effect on CPU.
         """
         global torch, AutoTokenizer, AutoModelForSequenceClassification, PreTrainedModel, PreTrainedTokenizerBase
 
@@ -89,6 +92,8 @@ class SentimentAnalyzerComponent:
             self.model: PreTrainedModel = AutoModelForSequenceClassification.from_pretrained(self.model_name)
             self.model.to(self.device)
             self.model.eval()  # Set model to evaluation mode
+            if quantized:
+                self.model = self._quantize_int8(self.model)
             logger.info("Successfully loaded model '%s' and tokenizer.", self.model_name)
         except Exception as e:
             logger.error(
@@ -109,6 +114,63 @@ class SentimentAnalyzerComponent:
             logger.info("Using CPU for sentiment analysis.")
         return torch.device("cpu")
 
+    def _quantize_int8(self, model):
+        """
+        Applies post-training dynamic int8 quantization to the model's Linear layers.
+
+        Weights are stored as int8 and activations quantized on the fly, which cuts
+        the model's memory roughly 4x and speeds up CPU inference on hardware with
+        int8 dot-product instructions (e.g. AVX512-VNNI). PyTorch's dynamic quantized
+        kernels are CPU-only, so the model is returned unchanged on GPU.
+        """
+        if self.device.type != "cpu":
+            logger.warning("Int8 quantization is only supported on CPU; keeping the model in full precision.")
+            return model
+        quantized_model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        logger.info("Applied dynamic int8 quantization to model '%s'.", self.model_name)
+        return quantized_model
+
+    def _empty_input_output(self) -> SentimentAnalysisOutput:
+        """Default neutral sentiment returned for empty or non-string input."""
+        return SentimentAnalysisOutput(
+            label="neutral", 
+            confidence=1.0, 
+            scores={"positive": 0.0, "negative": 0.0, "neutral": 1.0},
+            model_version=self.model_name
+        )
+
+    def _error_output(self) -> SentimentAnalysisOutput:
+        """Default neutral sentiment returned when inference fails; zero confidence marks the error."""
+        return SentimentAnalysisOutput(
+            label="neutral", 
+            confidence=0.0,  # Indicate low confidence due to error
+            scores={"positive": 0.0, "negative": 0.0, "neutral": 0.0},
+            model_version=self.model_name
+        )
+
+    def _output_from_probabilities(self, probabilities) -> SentimentAnalysisOutput:
+        """
+        Builds the output DTO from one row of class probabilities.
+
+        Args:
+            probabilities: 1-D tensor of softmax probabilities, indexed by class id.
+        """
+        # Get the ID to label mapping from the model's config
+        # FinBERT (ProsusAI/finbert) labels: 0: positive, 1: negative, 2: neutral
+        id2label = self.model.config.id2label
+
+        predicted_class_id = torch.argmax(probabilities, dim=-1).item()
+        all_scores: Dict[str, float] = {
+            id2label[i]: probabilities[i].item() for i in range(probabilities.shape[0])
+        }
+
+        return SentimentAnalysisOutput(
+            label=id2label[predicted_class_id],
+            confidence=probabilities[predicted_class_id].item(),
+            scores=all_scores,
+            model_version=self.model_name
+        )
+
     def analyze(self, text: str) -> SentimentAnalysisOutput:
         """
         Performs sentiment analysis on the given text.
@@ -123,12 +185,7 @@ class SentimentAnalyzerComponent:
         if not isinstance(text, str) or not text.strip():
             logger.warning("Received empty or non-string input for sentiment analysis. Returning neutral default.")
             # Return a default neutral sentiment or handle as an error based on requirements
-            return SentimentAnalysisOutput(
-                label="neutral", 
-                confidence=1.0, 
-                scores={"positive": 0.0, "negative": 0.0, "neutral": 1.0},
-                model_version=self.model_name
-            )
+            return self._empty_input_output()
 
         try:
             inputs = self.tokenizer(text, return_tensors="pt", truncation=True, padding=True, max_length=512)
@@ -137,38 +194,60 @@ class SentimentAnalyzerComponent:
             with torch.no_grad(): # Disable gradient calculations for inference
                 outputs = self.model(**inputs)
             
-            logits = outputs.logits
-            probabilities = torch.nn.functional.softmax(logits, dim=-1)
-            
-            # Get the ID to label mapping from the model's config
-            # FinBERT (ProsusAI/finbert) labels: 0: positive, 1: negative, 2: neutral
-            id2label = self.model.config.id2label
-            
-            predicted_class_id = torch.argmax(probabilities, dim=-1).item()
-            predicted_label = id2label[predicted_class_id]
-            confidence = probabilities[0, predicted_class_id].item()
-            
-            all_scores: Dict[str, float] = {
-                id2label[i]: probabilities[0, i].item() for i in range(probabilities.shape[1])
-            }
-
-            return SentimentAnalysisOutput(
-                label=predicted_label,
-                confidence=confidence,
-                scores=all_scores,
-                model_version=self.model_name
-            )
+            probabilities = torch.nn.functional.softmax(outputs.logits, dim=-1)
+            return self._output_from_probabilities(probabilities[0])
 
         except Exception as e:
             logger.error(f"Error during sentiment analysis for text '{text[:100]}...': {e}", exc_info=True)
             # Fallback or re-raise based on error handling strategy
             # For now, return a default neutral sentiment on error
-            return SentimentAnalysisOutput(
-                label="neutral", 
-                confidence=0.0,  # Indicate low confidence due to error
-                scores={"positive": 0.0, "negative": 0.0, "neutral": 0.0},
-                model_version=self.model_name
-            )
+            return self._error_output()
+
+    def analyze_many(self, texts: List[str], batch_size: int = 32) -> List[SentimentAnalysisOutput]:
+        """
+        Performs sentiment analysis on a batch of texts.
+
+        Non-empty texts are tokenized together and pushed through the model in
+        one forward pass per ``batch_size`` chunk, which is far cheaper per text
+        than calling :meth:`analyze` in a loop.
+
+        Args:
+            texts (List[str]): The preprocessed texts to analyze.
+            batch_size (int): Maximum number of texts per forward pass.
+
+        Returns:
+            List[SentimentAnalysisOutput]: One output per input text, in input order.
+            Empty inputs get the neutral default; a failed chunk gets the error default.
+        """
+        results: List[Optional[SentimentAnalysisOutput]] = [None] * len(texts)
+        pending: List[int] = []
+        for idx, text in enumerate(texts):
+            if isinstance(text, str) and text.strip():
+                pending.append(idx)
+            else:
+                results[idx] = self._empty_input_output()
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            try:
+                inputs = self.tokenizer(
+                    [texts[idx] for idx in chunk],
+                    return_tensors="pt", truncation=True, padding=True, max_length=512,
+                )
+                inputs = {k: v.to(self.device) for k, v in inputs.items()}
+
+                with torch.inference_mode():
+                    outputs = self.model(**inputs)
+
+                probabilities = torch.nn.functional.softmax(outputs.logits, dim=-1)
+                for row, idx in enumerate(chunk):
+                    results[idx] = self._output_from_probabilities(probabilities[row])
+            except Exception as e:
+                logger.error(f"Error during batched sentiment analysis of {len(chunk)} texts: {e}", exc_info=True)
+                for idx in chunk:
+                    results[idx] = self._error_output()
+
+        return results  # type: ignore[return-value] – every slot is filled above
 
 # Example Usage (for testing or demonstration)
 if __name__ == "__main__":
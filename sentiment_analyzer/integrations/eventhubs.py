@@ -0,0 +1,131 @@
+"""
+Azure Event Hubs sink for Power BI streaming.
+
+An alternative to the REST push client in :mod:`sentiment_analyzer.integrations.powerbi`
+for Power BI datasets fed from Event Hubs (e.g. through Stream Analytics). Rows
+travel over one long-lived AMQP connection, so a push costs no per-request HTTP
+framing or TLS setup and is not subject to the REST API's pending-request cap.
+"""
+
+import logging
+from typing import List, Optional
+
+import orjson
+
+from sentiment_analyzer.integrations.powerbi import _result_to_row
+from sentiment_analyzer.models.dtos import SentimentResultDTO
+
+# azure-eventhub is only needed when POWERBI_SINK is "eventhubs" (the "eventhubs" extra).
+try:
+    from azure.eventhub import EventData  # type: ignore
+    from azure.eventhub.aio import EventHubProducerClient  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – only executes when azure-eventhub not installed
+    EventData = None  # type: ignore
+    EventHubProducerClient = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+class EventHubsPowerBISink:
+    """
+    Streams sentiment results to a Power BI dataset through Azure Event Hubs.
+
+    Exposes the same push/test/close surface as ``PowerBIClient`` so either can
+    be configured as the application's Power BI sink.
+    """
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        eventhub_name: Optional[str] = None,
+        producer: Optional["EventHubProducerClient"] = None
+    ):
+        """
+        Initialize the Event Hubs sink.
+
+        Args:
+            connection_string: Event Hubs namespace connection string
+            eventhub_name: Name of the event hub feeding the Power BI dataset
+            producer: Optional pre-built async producer (mainly for tests)
+
+        Raises:
+            ImportError: If no producer is given and azure-eventhub is not installed.
+        """
+        if producer is None:
+            if EventHubProducerClient is None:
+                raise ImportError(
+                    "azure-eventhub is required for the Event Hubs Power BI sink; "
+                    "install the 'eventhubs' extra."
+                )
+            producer = EventHubProducerClient.from_connection_string(
+                connection_string, eventhub_name=eventhub_name
+            )
+        self.producer = producer
+        self.eventhub_name = eventhub_name
+        self._to_row = _result_to_row
+
+    async def close(self) -> None:
+        """Close the producer and its AMQP connection."""
+        await self.producer.close()
+
+    async def push_row(self, sentiment_result: SentimentResultDTO) -> bool:
+        """
+        Push a single sentiment result row to Power BI.
+
+        Args:
+            sentiment_result: Sentiment analysis result to push
+
+        Returns:
+            bool: True if sent successfully, False otherwise
+        """
+        return await self.push_rows([sentiment_result])
+
+    async def push_rows(self, sentiment_results: List[SentimentResultDTO]) -> bool:
+        """
+        Push multiple sentiment result rows to Power BI.
+
+        Rows are packed into as few Event Hubs batches as the hub's message size
+        limit allows; a new batch is only started when the current one is full.
+
+        Args:
+            sentiment_results: List of sentiment analysis results to push
+
+        Returns:
+            bool: True if all rows were sent, False otherwise
+        """
+        if not sentiment_results:
+            return True
+
+        try:
+            to_row = self._to_row
+            batch = await self.producer.create_batch()
+            for result in sentiment_results:
+                event = EventData(orjson.dumps(to_row(result)))
+                try:
+                    batch.add(event)
+                except ValueError:
+                    # Batch is at the size limit: send it and carry on in a fresh one
+                    await self.producer.send_batch(batch)
+                    batch = await self.producer.create_batch()
+                    batch.add(event)
+            await self.producer.send_batch(batch)
+            return True
+
+        except Exception as e:
+            logger.error(f"Error sending rows to Event Hubs: {str(e)}")
+            return False
+
+    async def test_connection(self) -> bool:
+        """
+        Test the connection by reading the event hub's properties.
+
+        Returns:
+            bool: True if the event hub is reachable, False otherwise
+        """
+        try:
+            await self.producer.get_eventhub_properties()
+            logger.info("Event Hubs connection test successful")
+            return True
+        except Exception as e:
+            logger.error(f"Event Hubs connection test error: {str(e)}")
+            return False
@@ -7,24 +7,101 @@ to Power BI streaming datasets in real-time.
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional, List
-import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, List, Set, Tuple, Union
+from dataclasses import dataclass, fields
 
 import httpx
-from pydantic import BaseModel
+import orjson
+from pydantic import TypeAdapter
 
-from sentiment_analyzer.models.dtos import SentimentResultDTO
+from sentiment_analyzer.models.dtos import SentimentResultDTO, SentimentMetricDTO
+
+# HTTP/2 needs the optional h2 package (the "http2" extra); without it the client uses HTTP/1.1.
+try:
+    import h2  # type: ignore  # noqa: F401
+except ModuleNotFoundError:  # pragma: no cover – only executes when h2 not installed
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
 
 logger = logging.getLogger(__name__)
 
+# Power BI allows at most 5 pending push requests per dataset
+_MAX_PENDING_REQUESTS = 5
+
+# Keep-alive pool sized to the pending-request cap, with headroom for connection
+# probes; retries and later batches reuse warm connections instead of new TLS handshakes
+_POOL_LIMITS = httpx.Limits(
+    max_connections=_MAX_PENDING_REQUESTS * 2,
+    max_keepalive_connections=_MAX_PENDING_REQUESTS,
+)
+
+# Static envelope around the serialized rows array: {"rows": [...]}
+_ROWS_PREFIX = b'{"rows":'
+_ROWS_SUFFIX = b'}'
+_EMPTY_ROWS_BODY = _ROWS_PREFIX + b"[]" + _ROWS_SUFFIX
+
+# Validates a whole list of raw result mappings in one pydantic-core call
+_DTO_LIST_ADAPTER = TypeAdapter(List[SentimentResultDTO])
+
+# Statuses meaning the push endpoint does not implement HEAD
+_HEAD_UNSUPPORTED = frozenset({405, 501})
+
+
+def _parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header given as seconds or an HTTP-date.
+    
+    Args:
+        value: Raw header value
+        
+    Returns:
+        Optional[float]: Delay in seconds, or None if absent or unparseable
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 
-class PowerBIRowData(BaseModel):
+def _floor_to_bucket(ts: datetime, bucket_seconds: int) -> datetime:
+    """
+    Floor a timestamp to the start of its ``bucket_seconds`` wide bucket.
+    
+    Args:
+        ts: Timestamp to floor (naive or timezone-aware)
+        bucket_seconds: Bucket width in seconds
+        
+    Returns:
+        datetime: Start of the bucket, in the same timezone as ``ts``
+    """
+    epoch = datetime(1970, 1, 1, tzinfo=ts.tzinfo)
+    offset = int((ts - epoch).total_seconds())
+    return epoch + timedelta(seconds=offset - offset % bucket_seconds)
+
+
+@dataclass(slots=True)
+class PowerBIRowData:
     """
     Data model for a single row to be pushed to Power BI.
     
     This model defines the structure of data that will be sent to the
-    Power BI streaming dataset.
+    Power BI streaming dataset. It is a plain slotted dataclass rather than
+    a pydantic model: every field comes from an already validated
+    ``SentimentResultDTO`` and orjson serializes dataclasses natively.
     """
     event_id: str
     occurred_at: datetime
@@ -33,8 +110,8 @@ class PowerBIRowData(BaseModel):
     source_id: str
     sentiment_score: float
     sentiment_label: str
-    confidence: Optional[float] = None
     model_version: str
+    confidence: Optional[float] = None
     
     def model_dump_json_compatible(self) -> Dict[str, Any]:
         """
@@ -43,11 +120,176 @@ class PowerBIRowData(BaseModel):
         Returns:
             Dict[str, Any]: JSON-compatible representation
         """
-        data = self.model_dump()
-        # Convert datetime objects to ISO format strings
-        data["occurred_at"] = self.occurred_at.isoformat()
-        data["processed_at"] = self.processed_at.isoformat()
-        return data
+        # Round-trip through orjson: matches the wire format of _post_rows
+        # exactly (RFC 3339 datetimes) and avoids asdict()'s recursive deepcopy
+        return orjson.loads(orjson.dumps(self))
+
+
+def _build_row_mapper():
+    """
+    Generate the SentimentResultDTO -> PowerBIRowData converter.
+    
+    The source is produced once at import from the dataclass fields and
+    compiled with exec, giving a single positional constructor call with
+    the row class bound as a default argument, so converting a row does no
+    keyword matching and no global lookups.
+    
+    Returns:
+        Callable[[SentimentResultDTO], PowerBIRowData]: The generated ``_to_row``.
+        
+    Raises:
+        TypeError: If a PowerBIRowData field has no SentimentResultDTO counterpart.
+    """
+    field_names = [field.name for field in fields(PowerBIRowData)]
+    missing = [name for name in field_names if name not in SentimentResultDTO.model_fields]
+    if missing:
+        raise TypeError(f"SentimentResultDTO lacks PowerBIRowData fields: {missing}")
+    
+    args = ", ".join(f"r.{name}" for name in field_names)
+    src = f"def _to_row(r, _Row=_Row):\n    return _Row({args})\n"
+    namespace: Dict[str, Any] = {"_Row": PowerBIRowData}
+    exec(compile(src, "<powerbi_row_mapper>", "exec"), namespace)
+    return namespace["_to_row"]
+
+
+# Convert a sentiment result into a Power BI row
+_result_to_row = _build_row_mapper()
+
+
+class _RingBatch:
+    """
+    Fixed-capacity FIFO ring buffer feeding the Power BI flusher task.
+    
+    Slots are preallocated once and reused; the consumer takes whole batches
+    with a single slice copy instead of popping item by item. All access
+    happens on the owning event loop, so no locks are needed; this class is
+    not safe to share across threads.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize the ring buffer.
+        
+        Args:
+            capacity: Maximum number of items held at once
+        """
+        self._capacity = capacity
+        self._slots: List[Any] = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self._size = 0
+        self._unfinished = 0
+        self.closed = False
+        # Set whenever items arrive or the buffer is closed
+        self._changed = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def qsize(self) -> int:
+        """Return the number of buffered items."""
+        return self._size
+    
+    def put_nowait(self, item: Any) -> None:
+        """
+        Append an item without waiting.
+        
+        Raises:
+            asyncio.QueueFull: If the buffer is at capacity
+        """
+        if self._size == self._capacity:
+            raise asyncio.QueueFull
+        self._slots[self._tail] = item
+        self._tail = (self._tail + 1) % self._capacity
+        self._size += 1
+        self._unfinished += 1
+        self._idle.clear()
+        self._changed.set()
+    
+    async def put(self, item: Any) -> None:
+        """Append an item, waiting for space if the buffer is full."""
+        while self._size == self._capacity:
+            self._not_full.clear()
+            await self._not_full.wait()
+        self.put_nowait(item)
+    
+    def drain(self, max_items: int) -> List[Any]:
+        """
+        Remove and return up to ``max_items`` items in FIFO order.
+        
+        Args:
+            max_items: Maximum number of items to take
+            
+        Returns:
+            List[Any]: The removed items (possibly empty)
+        """
+        count = min(max_items, self._size)
+        if count == 0:
+            return []
+        end = self._head + count
+        if end <= self._capacity:
+            batch = self._slots[self._head:end]
+            self._slots[self._head:end] = [None] * count
+        else:
+            wrapped = end - self._capacity
+            batch = self._slots[self._head:] + self._slots[:wrapped]
+            self._slots[self._head:] = [None] * (self._capacity - self._head)
+            self._slots[:wrapped] = [None] * wrapped
+        self._head = end % self._capacity
+        self._size -= count
+        self._not_full.set()
+        return batch
+    
+    async def wait(self, min_items: int, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until at least ``min_items`` are buffered or the buffer is closed.
+        
+        Args:
+            min_items: Number of items to wait for
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            bool: False if the timeout expired first, True otherwise
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while self._size < min_items and not self.closed:
+            self._changed.clear()
+            if deadline is None:
+                await self._changed.wait()
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return False
+        return True
+    
+    def task_done(self, count: int = 1) -> None:
+        """Mark ``count`` previously drained items as fully processed."""
+        self._unfinished -= count
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            self._idle.set()
+    
+    async def join(self) -> None:
+        """Wait until every item put so far has been marked done."""
+        await self._idle.wait()
+    
+    def close(self) -> None:
+        """Stop accepting waits; wakes the consumer so it can drain and exit."""
+        self.closed = True
+        self._changed.set()
+    
+    def reopen(self) -> None:
+        """Re-arm the buffer after ``close`` so a new consumer can start."""
+        self.closed = False
 
 
 class PowerBIClient:
@@ -64,8 +306,13 @@ class PowerBIClient:
         api_key: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
         batch_size: int = 100,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        max_latency: float = 1.0,
+        failure_threshold: int = 5,
+        circuit_reset_timeout: float = 60.0,
+        spill_path: Optional[str] = None
     ):
         """
         Initialize PowerBI client.
@@ -74,16 +321,31 @@ class PowerBIClient:
             push_url: Power BI streaming dataset push URL
             api_key: Optional API key for authentication
             max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds, doubled on each attempt
+            max_retry_delay: Upper bound on the exponential backoff in seconds
             batch_size: Maximum number of rows to send in a single request
             timeout: Request timeout in seconds
+            max_latency: Maximum seconds a queued row waits before its batch is sent
+            failure_threshold: Consecutive failed batches before the circuit opens
+            circuit_reset_timeout: Seconds the circuit stays open before a trial send
+            spill_path: Optional JSON-lines file that receives rows while the circuit is open
         """
         self.push_url = push_url
         self.api_key = api_key
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
         self.batch_size = batch_size
         self.timeout = timeout
+        self.max_latency = max_latency
+        self.failure_threshold = failure_threshold
+        self.circuit_reset_timeout = circuit_reset_timeout
+        self.spill_path = spill_path
+        self._to_row = _result_to_row
+        
+        # Circuit breaker state
+        self._consecutive_failures = 0
+        self._circuit_opened_at: Optional[float] = None
         
         # Initialize HTTP client
         headers = {"Content-Type": "application/json"}
@@ -92,12 +354,18 @@ class PowerBIClient:
             
         self.client = httpx.AsyncClient(
             headers=headers,
-            timeout=httpx.Timeout(timeout)
+            timeout=httpx.Timeout(timeout, connect=min(5.0, timeout)),
+            limits=_POOL_LIMITS,
+            http2=_HTTP2_AVAILABLE
         )
         
-        # Batch processing
-        self._batch_queue: List[PowerBIRowData] = []
-        self._batch_lock = asyncio.Lock()
+        # Batch processing: producers append rows to a preallocated ring
+        # buffer, a background flusher task drains it so network round-trips
+        # stay off push_row.
+        self._queue = _RingBatch(batch_size * 4)
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._send_semaphore = asyncio.Semaphore(_MAX_PENDING_REQUESTS)
+        self._in_flight: Set[asyncio.Task] = set()
         
         logger.info(f"PowerBI client initialized with push URL: {push_url[:50]}...")
     
@@ -105,6 +373,13 @@ class PowerBIClient:
         """
         Close the HTTP client and flush any remaining batched data.
         """
+        # Stop the background flusher; it drains the buffer before exiting
+        if self._flusher_task is not None and not self._flusher_task.done():
+            self._queue.close()
+            await self._flusher_task
+        self._flusher_task = None
+        self._queue.reopen()
+
         # Flush any remaining data
         await self.flush_batch()
         
@@ -124,25 +399,11 @@ class PowerBIClient:
         """
         try:
             # Convert to PowerBI row format
-            row_data = PowerBIRowData(
-                event_id=sentiment_result.event_id,
-                occurred_at=sentiment_result.occurred_at,
-                processed_at=sentiment_result.processed_at,
-                source=sentiment_result.source,
-                source_id=sentiment_result.source_id,
-                sentiment_score=sentiment_result.sentiment_score,
-                sentiment_label=sentiment_result.sentiment_label,
-                confidence=sentiment_result.confidence,
-                model_version=sentiment_result.model_version
-            )
+            row_data = self._to_row(sentiment_result)
             
-            # Add to batch queue
-            async with self._batch_lock:
-                self._batch_queue.append(row_data)
-                
-                # If batch is full, flush it
-                if len(self._batch_queue) >= self.batch_size:
-                    await self._flush_batch_internal()
+            # Hand off to the background flusher
+            self._ensure_flusher()
+            await self._queue.put(row_data)
             
             return True
             
@@ -150,45 +411,112 @@ class PowerBIClient:
             logger.error(f"Error preparing row for Power BI: {str(e)}")
             return False
     
-    async def push_rows(self, sentiment_results: List[SentimentResultDTO]) -> bool:
+    async def push_rows(
+        self,
+        sentiment_results: Union[List[SentimentResultDTO], List[Dict[str, Any]]]
+    ) -> bool:
         """
         Push multiple sentiment result rows to Power BI.
         
         Args:
-            sentiment_results: List of sentiment analysis results to push
+            sentiment_results: List of sentiment analysis results to push, either
+                as DTOs or as raw mappings (e.g. decoded from a message queue),
+                which are validated together in a single pass
+            
+        Returns:
+            bool: True if all successful, False otherwise
+        """
+        if sentiment_results and isinstance(sentiment_results[0], dict):
+            try:
+                sentiment_results = _DTO_LIST_ADAPTER.validate_python(sentiment_results)
+            except ValueError as e:
+                logger.error(f"Invalid sentiment results for Power BI: {str(e)}")
+                return False
+        
+        async def _bounded(chunk: List[SentimentResultDTO]) -> bool:
+            # Convert inside the semaphore so only in-flight batches are materialised
+            async with self._send_semaphore:
+                to_row = self._to_row
+                return await self._send_batch([to_row(result) for result in chunk])
+        
+        try:
+            results = await asyncio.gather(
+                *[
+                    _bounded(sentiment_results[i:i + self.batch_size])
+                    for i in range(0, len(sentiment_results), self.batch_size)
+                ],
+                return_exceptions=True
+            )
+            
+            return all(result is True for result in results)
+            
+        except Exception as e:
+            logger.error(f"Error pushing multiple rows to Power BI: {str(e)}")
+            return False
+    
+    async def push_results_aggregated(
+        self,
+        sentiment_results: List[SentimentResultDTO],
+        bucket_seconds: int = 60
+    ) -> bool:
+        """
+        Pre-aggregate results into time buckets and push one row per bucket.
+        
+        Rows are grouped by (time bucket, source, source_id, label) and sent
+        in the ``SentimentMetricDTO`` shape, so Power BI receives one row per
+        group instead of one per event.
+        
+        Args:
+            sentiment_results: List of sentiment analysis results to aggregate
+            bucket_seconds: Width of each time bucket in seconds
             
         Returns:
             bool: True if all successful, False otherwise
         """
         try:
-            # Convert all to PowerBI row format
-            row_data_list = []
+            groups: Dict[Tuple[datetime, str, str, str], List[float]] = {}
             for result in sentiment_results:
-                row_data = PowerBIRowData(
-                    event_id=result.event_id,
-                    occurred_at=result.occurred_at,
-                    processed_at=result.processed_at,
-                    source=result.source,
-                    source_id=result.source_id,
-                    sentiment_score=result.sentiment_score,
-                    sentiment_label=result.sentiment_label,
-                    confidence=result.confidence,
-                    model_version=result.model_version
+                key = (
+                    _floor_to_bucket(result.occurred_at, bucket_seconds),
+                    result.source,
+                    result.source_id,
+                    result.sentiment_label,
                 )
-                row_data_list.append(row_data)
+                acc = groups.get(key)
+                if acc is None:
+                    groups[key] = [1, result.sentiment_score]
+                else:
+                    acc[0] += 1
+                    acc[1] += result.sentiment_score
+            
+            rows = [
+                SentimentMetricDTO(
+                    time_bucket=time_bucket,
+                    source=source,
+                    source_id=source_id,
+                    label=label,
+                    count=int(count),
+                    avg_score=score_sum / count
+                ).model_dump(mode="json")
+                for (time_bucket, source, source_id, label), (count, score_sum) in groups.items()
+            ]
             
-            # Send in batches
-            success = True
-            for i in range(0, len(row_data_list), self.batch_size):
-                batch = row_data_list[i:i + self.batch_size]
-                batch_success = await self._send_batch(batch)
-                if not batch_success:
-                    success = False
+            async def _bounded(chunk: List[Dict[str, Any]]) -> bool:
+                async with self._send_semaphore:
+                    return await self._post_rows(chunk)
             
-            return success
+            results = await asyncio.gather(
+                *[
+                    _bounded(rows[i:i + self.batch_size])
+                    for i in range(0, len(rows), self.batch_size)
+                ],
+                return_exceptions=True
+            )
+            
+            return all(result is True for result in results)
             
         except Exception as e:
-            logger.error(f"Error pushing multiple rows to Power BI: {str(e)}")
+            logger.error(f"Error pushing aggregated rows to Power BI: {str(e)}")
             return False
     
     async def flush_batch(self) -> bool:
@@ -198,23 +526,84 @@ class PowerBIClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        async with self._batch_lock:
-            return await self._flush_batch_internal()
+        batch = self._queue.drain(len(self._queue))
+        try:
+            sent = await self._send_batch(batch)
+        finally:
+            self._queue.task_done(len(batch))
+        
+        # Batches already handed to the flusher count as part of the flush
+        return await self._wait_in_flight() and sent
     
-    async def _flush_batch_internal(self) -> bool:
+    def _ensure_flusher(self) -> None:
         """
-        Internal method to flush batch queue (assumes lock is held).
+        Start the background flusher task if it is not already running.
         
+        Started lazily so the client can be constructed outside a running loop.
+        """
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flusher())
+    
+    async def _flusher(self) -> None:
+        """
+        Background consumer that drains the ring buffer into micro-batches.
+        
+        Waits for the first row, then keeps collecting until ``batch_size``
+        rows are buffered or ``max_latency`` seconds have passed since that
+        first row. Each batch is sent in its own task so the next batch can
+        fill while the previous one is on the wire; at most
+        ``_MAX_PENDING_REQUESTS`` sends are in flight at once. Once the
+        buffer is closed the remaining rows are sent and the task exits.
+        """
+        while True:
+            await self._queue.wait(1)
+            if not self._queue:
+                # Closed and fully drained
+                break
+            if not self._queue.closed:
+                await self._queue.wait(self.batch_size, timeout=self.max_latency)
+            
+            batch = self._queue.drain(self.batch_size)
+            if not batch:
+                # A concurrent flush_batch already took the rows
+                continue
+            await self._send_semaphore.acquire()
+            task = asyncio.create_task(self._send_in_flight(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+        
+        await self._wait_in_flight()
+    
+    async def _send_in_flight(self, batch: List[PowerBIRowData]) -> bool:
+        """
+        Send a batch on behalf of the flusher and release its bookkeeping.
+        
+        Args:
+            batch: List of PowerBI row data to send
+            
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self._batch_queue:
-            return True
-        
-        batch = self._batch_queue.copy()
-        self._batch_queue.clear()
+        try:
+            return await self._send_batch(batch)
+        except Exception as e:
+            logger.error(f"Power BI flusher failed to send batch: {str(e)}")
+            return False
+        finally:
+            self._send_semaphore.release()
+            self._queue.task_done(len(batch))
+    
+    async def _wait_in_flight(self) -> bool:
+        """
+        Wait for all in-flight batch sends to complete.
         
-        return await self._send_batch(batch)
+        Returns:
+            bool: True if every in-flight send succeeded, False otherwise
+        """
+        if not self._in_flight:
+            return True
+        results = await asyncio.gather(*list(self._in_flight), return_exceptions=True)
+        return all(result is True for result in results)
     
     async def _send_batch(self, batch: List[PowerBIRowData]) -> bool:
         """
@@ -229,71 +618,169 @@ class PowerBIClient:
         if not batch:
             return True
         
-        # Convert to JSON format expected by Power BI
-        payload = {
-            "rows": [row.model_dump_json_compatible() for row in batch]
-        }
+        return await self._post_rows(batch)
+    
+    async def _post_rows(self, rows: List[Any]) -> bool:
+        """
+        POST rows (dicts or ``PowerBIRowData``) to Power BI with retry logic.
+        
+        Transient failures (429, 5xx, timeouts, transport errors) are retried
+        with exponential backoff plus jitter, honouring ``Retry-After`` on
+        429/503. While the circuit breaker is open rows are spilled to
+        ``spill_path`` (if configured) instead of being sent.
+        
+        Args:
+            rows: List of orjson-serializable rows
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not rows:
+            return True
+        
+        if self._circuit_is_open():
+            await self._spill_rows(rows)
+            return False
+        
+        # Serialize once; the outer envelope is constant
+        body = _ROWS_PREFIX + orjson.dumps(rows) + _ROWS_SUFFIX
         
         for attempt in range(self.max_retries + 1):
+            retry_after: Optional[float] = None
             try:
-                logger.debug(f"Sending batch of {len(batch)} rows to Power BI (attempt {attempt + 1})")
+                logger.debug(f"Sending batch of {len(rows)} rows to Power BI (attempt {attempt + 1})")
                 
                 response = await self.client.post(
                     self.push_url,
-                    json=payload
+                    content=body
                 )
                 
-                if response.status_code == 200:
-                    logger.info(f"Successfully pushed {len(batch)} rows to Power BI")
+                if 200 <= response.status_code < 300:
+                    logger.info(f"Successfully pushed {len(rows)} rows to Power BI")
+                    self._record_success()
                     return True
-                elif response.status_code == 429:
-                    # Rate limited - wait longer before retry
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    logger.warning(f"Rate limited by Power BI, waiting {wait_time}s before retry")
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    logger.error(f"Power BI API error: {response.status_code} - {response.text}")
-                    if attempt < self.max_retries:
-                        await asyncio.sleep(self.retry_delay)
-                        continue
-                    else:
-                        return False
+                elif response.status_code in (429, 503):
+                    # Rate limited / unavailable - honour the server's hint
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                    logger.warning(f"Power BI returned {response.status_code} (attempt {attempt + 1})")
+                elif logger.isEnabledFor(logging.ERROR):
+                    # Bounded decode: error bodies can be arbitrarily large
+                    error_text = response.content[:512].decode("utf-8", errors="replace")
+                    logger.error(f"Power BI API error: {response.status_code} - {error_text}")
                         
             except httpx.TimeoutException:
                 logger.error(f"Timeout pushing to Power BI (attempt {attempt + 1})")
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay)
-                    continue
-                else:
-                    return False
                     
             except Exception as e:
                 logger.error(f"Error pushing to Power BI (attempt {attempt + 1}): {str(e)}")
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay)
-                    continue
-                else:
-                    return False
+            
+            if attempt < self.max_retries:
+                wait_time = self._backoff_delay(attempt, retry_after)
+                logger.debug(f"Waiting {wait_time:.2f}s before retrying Power BI push")
+                await asyncio.sleep(wait_time)
         
+        self._record_failure()
         return False
     
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute the delay before the next retry.
+        
+        Args:
+            attempt: Zero-based attempt number that just failed
+            retry_after: Server-requested delay in seconds, if any
+            
+        Returns:
+            float: Seconds to sleep, including random jitter
+        """
+        base = min(self.max_retry_delay, self.retry_delay * (2 ** attempt))
+        # The server's Retry-After wins even above the cap
+        if retry_after is not None:
+            base = max(base, retry_after)
+        return base + random.uniform(0, self.retry_delay)
+    
+    def _circuit_is_open(self) -> bool:
+        """
+        Check whether the circuit breaker is currently rejecting sends.
+        
+        After ``circuit_reset_timeout`` the circuit lets one batch through;
+        its outcome either closes the circuit or re-opens it.
+        
+        Returns:
+            bool: True if sends should be skipped, False otherwise
+        """
+        if self._circuit_opened_at is None:
+            return False
+        if time.monotonic() - self._circuit_opened_at >= self.circuit_reset_timeout:
+            self._circuit_opened_at = None
+            logger.info("Power BI circuit breaker half-open, attempting a trial send")
+            return False
+        return True
+    
+    def _record_success(self) -> None:
+        """Reset the circuit breaker after a successful send."""
+        if self._consecutive_failures >= self.failure_threshold:
+            logger.info("Power BI circuit breaker closed")
+        self._consecutive_failures = 0
+        self._circuit_opened_at = None
+    
+    def _record_failure(self) -> None:
+        """Count a failed batch and open the circuit breaker at the threshold."""
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.failure_threshold:
+            self._circuit_opened_at = time.monotonic()
+            logger.error(
+                f"Power BI circuit breaker open after {self._consecutive_failures} consecutive failures"
+            )
+    
+    async def _spill_rows(self, rows: List[Any]) -> None:
+        """
+        Persist rows that could not be sent while the circuit is open.
+        
+        Args:
+            rows: List of orjson-serializable rows
+        """
+        if not self.spill_path:
+            logger.warning(f"Power BI circuit open, dropping {len(rows)} rows (no spill_path configured)")
+            return
+        
+        def _append() -> None:
+            with open(self.spill_path, "ab") as fh:
+                for row in rows:
+                    fh.write(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+        
+        try:
+            await asyncio.to_thread(_append)
+            logger.warning(f"Power BI circuit open, spilled {len(rows)} rows to {self.spill_path}")
+        except Exception as e:
+            logger.error(f"Error spilling Power BI rows to {self.spill_path}: {str(e)}")
+    
     async def test_connection(self) -> bool:
         """
-        Test the connection to Power BI by sending an empty batch.
+        Test the connection to Power BI.
+        
+        Probes the push URL with a bodiless HEAD, so the check writes nothing
+        and does not count against the dataset's push throttling. Endpoints
+        that reject HEAD (405/501) are probed with an empty batch instead; that
+        response is streamed and only its status line is inspected, so the body
+        is never buffered and the pooled connection stays warm.
         
         Returns:
             bool: True if connection is working, False otherwise
         """
         try:
-            payload = {"rows": []}
-            response = await self.client.post(self.push_url, json=payload)
+            response = await self.client.head(self.push_url)
+            status_code = response.status_code
+            
+            if status_code in _HEAD_UNSUPPORTED:
+                async with self.client.stream("POST", self.push_url, content=_EMPTY_ROWS_BODY) as response:
+                    status_code = response.status_code
             
-            if response.status_code == 200:
+            if 200 <= status_code < 300:
                 logger.info("Power BI connection test successful")
                 return True
             else:
-                logger.error(f"Power BI connection test failed: {response.status_code}")
+                logger.error(f"Power BI connection test failed: {status_code}")
                 return False
                 
         except Exception as e:
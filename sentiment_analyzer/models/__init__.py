@@ -14,7 +14,7 @@ from . import sentiment_result_orm
 from .base import Base
 from .dead_letter_event_orm import DeadLetterEventORM
 from .sentiment_metric_orm import SentimentMetricORM
-from .sentiment_result_orm import SentimentResultORM
+from .sentiment_result_orm import SentimentLabel, SentimentResultORM
 
 # Import DTOs for easy access
 from .dtos import (
@@ -37,6 +37,7 @@ __all__ = [
     "DeadLetterEventORM",
     "SentimentMetricORM",
     "SentimentResultORM",
+    "SentimentLabel",
     # DTOs
     "AnalyzeTextRequest",
     "AnalyzeTextRequestItem",
@@ -2,7 +2,9 @@
 SQLAlchemy ORM model for the 'dead_letter_events' table.
 """
 
-from sqlalchemy import Column, Index, Integer, String, Text, PrimaryKeyConstraint
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, Column, Index, String, Text, PrimaryKeyConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy import TIMESTAMP
 from sqlalchemy.sql import func
@@ -27,7 +29,7 @@ class DeadLetterEventORM(Base):
     """
     __tablename__ = "dead_letter_events"
 
-    id = Column(Integer, autoincrement=True, comment="Part of composite PK, auto-incrementing.") # primary_key=True removed, will be part of composite PK
+    id = Column(BigInteger, autoincrement=True, comment="Part of composite PK, auto-incrementing.") # primary_key=True removed, will be part of composite PK
     event_id = Column(Text, nullable=False, comment="Identifier of the original event.")
     occurred_at = Column(TIMESTAMP(timezone=True), nullable=False, comment="Timestamp of the original event.")
     source = Column(Text, nullable=False, comment="Source of the original event.")
@@ -35,7 +37,14 @@ class DeadLetterEventORM(Base):
     event_payload = Column(JSONB, nullable=True, comment="Payload of the original event.")
     processing_component = Column(Text, nullable=True, comment="Component where processing failed.")
     error_msg = Column(Text, nullable=True, comment="Error message detailing the failure.")
-    failed_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now(), comment="Timestamp of failure.")
+    # Client-side default so inserts never need to read failed_at back; server_default covers raw SQL inserts
+    failed_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        comment="Timestamp of failure.",
+    )
 
     __table_args__ = (
         Index("idx_dle_event_id_occurred_at", "event_id", "occurred_at"),
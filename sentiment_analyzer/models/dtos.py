@@ -5,13 +5,52 @@ These models are used for API request/response validation and internal data tran
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict # Added Dict
+from functools import cached_property
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, Json
-from typing import Any # Added for RawEventDTO payload
+from pydantic import BaseModel, ConfigDict, Field
 
+# msgpack is only needed for inter-service transport of results; keep it optional.
+try:
+    import msgpack  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover – only executes when msgpack not installed
+    msgpack = None  # type: ignore
 
-class RawEventDTO(BaseModel):
+
+# Internal transfer DTOs are built once per event and never mutated, so they
+# are frozen and reject unknown fields. API request models keep the defaults.
+_INTERNAL_DTO_CONFIG = ConfigDict(
+    from_attributes=True,
+    frozen=True,
+    extra="forbid",
+    validate_assignment=False,
+)
+
+
+class _FrozenDTO(BaseModel):
+    """
+    Base class for immutable internal DTOs.
+
+    Because instances never change, their JSON encoding is computed once by
+    pydantic-core and reused on every subsequent serialization.
+    """
+    model_config = _INTERNAL_DTO_CONFIG
+
+    @cached_property
+    def _json_cache(self) -> bytes:
+        return self.__pydantic_serializer__.to_json(self)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Return the JSON encoding of this DTO, computed at most once.
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return self._json_cache
+
+
+class RawEventDTO(_FrozenDTO):
     """
     DTO for raw event data, typically sourced from scrapers.
 
@@ -63,8 +102,9 @@ class RawEventDTO(BaseModel):
                 extracted_parts.append(value.strip())
 
         if extracted_parts:
-            # Join with a space to preserve readability
-            self.content = " ".join(extracted_parts)
+            # Join with a space to preserve readability. The model is frozen,
+            # so bypass the pydantic __setattr__ guard during initialisation.
+            object.__setattr__(self, "content", " ".join(extracted_parts))
 
 
     # Metadata columns – optional for unit tests.
@@ -74,10 +114,8 @@ class RawEventDTO(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    model_config = {"from_attributes": True}
-
 
-class SentimentResultDTO(BaseModel):
+class SentimentResultDTO(_FrozenDTO):
     """
     DTO for sentiment analysis results.
 
@@ -88,17 +126,71 @@ class SentimentResultDTO(BaseModel):
     occurred_at: datetime
     source: str
     source_id: str
-    sentiment_score: float
+    sentiment_score: float  # Stored as REAL (FP32); values read back carry FP32 precision
     sentiment_label: str
-    confidence: Optional[float] = None
+    confidence: Optional[float] = None  # Stored as REAL (FP32)
     processed_at: datetime
     model_version: str
     raw_text: Optional[str] = None
 
-    model_config = {"from_attributes": True}
+    @classmethod
+    def from_orm_fast(cls, orm_row: Any) -> "SentimentResultDTO":
+        """
+        Build a DTO from a SentimentResultORM row without re-validating it.
+
+        Rows read back from the database already satisfy the schema, so the
+        instance is assembled with ``model_construct``. The only conversion
+        kept is ``event_id``, which is a BIGINT in the table but a string here.
 
+        Args:
+            orm_row: A SentimentResultORM instance (or any object with the same attributes).
+
+        Returns:
+            SentimentResultDTO: The unvalidated DTO.
+        """
+        values = {name: getattr(orm_row, name) for name in cls.model_fields}
+        values["event_id"] = str(values["event_id"])
+        return cls.model_construct(**values)
 
-class SentimentMetricDTO(BaseModel):
+    def to_msgpack(self) -> bytes:
+        """
+        Encode this result as msgpack for internal service-to-service transport.
+
+        Datetimes use msgpack's native timestamp extension, so they must be
+        timezone-aware (as the TIMESTAMPTZ columns they come from are).
+        JSON remains the format for the Power BI sink.
+
+        Returns:
+            bytes: msgpack-encoded result.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required for SentimentResultDTO.to_msgpack()")
+        return msgpack.packb(self.model_dump(), datetime=True)
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "SentimentResultDTO":
+        """
+        Decode a result produced by :meth:`to_msgpack`.
+
+        Args:
+            data: msgpack-encoded result.
+
+        Returns:
+            SentimentResultDTO: The validated DTO.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required for SentimentResultDTO.from_msgpack()")
+        # timestamp=3 decodes the timestamp extension to aware datetimes
+        return cls.model_validate(msgpack.unpackb(data, timestamp=3))
+
+
+class SentimentMetricDTO(_FrozenDTO):
     """
     DTO for aggregated sentiment metrics.
 
@@ -111,8 +203,6 @@ class SentimentMetricDTO(BaseModel):
     count: int
     avg_score: float
 
-    model_config = {"from_attributes": True}
-
 
 class AnalyzeTextRequestItem(BaseModel):
     """
@@ -133,7 +223,7 @@ class AnalyzeTextRequest(AnalyzeTextRequestItem):
     pass
 
 
-class PreprocessedText(BaseModel):
+class PreprocessedText(_FrozenDTO):
     """
     DTO for the output of the text preprocessing step.
 
@@ -145,10 +235,8 @@ class PreprocessedText(BaseModel):
     detected_language_confidence: Optional[float] = None
     is_target_language: bool = True
 
-    model_config = {"from_attributes": True}
-
 
-class SentimentAnalysisOutput(BaseModel):
+class SentimentAnalysisOutput(_FrozenDTO):
     """
     DTO for the output of the sentiment analysis step.
     """
@@ -157,8 +245,6 @@ class SentimentAnalysisOutput(BaseModel):
     scores: Optional[Dict[str, float]] = None  # May be omitted in simple tests
     model_version: Optional[str] = None
 
-    model_config = {"from_attributes": True}
-
 
 class AnalyzeTextsBulkRequest(BaseModel):
     """
@@ -167,7 +253,7 @@ class AnalyzeTextsBulkRequest(BaseModel):
     texts: List[AnalyzeTextRequestItem] = Field(..., min_items=1, description="A list of text items to analyze.")
 
 
-class DeadLetterEventDTO(BaseModel):
+class DeadLetterEventDTO(_FrozenDTO):
     """
     DTO for events that failed processing and were moved to the dead-letter queue.
 
@@ -179,5 +265,3 @@ class DeadLetterEventDTO(BaseModel):
     failed_stage: str
     failed_at: datetime
     raw_event_content: Optional[Dict[str, Any]] = None # Store original content if possible
-
-    model_config = {"from_attributes": True}
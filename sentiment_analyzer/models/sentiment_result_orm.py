@@ -2,9 +2,12 @@
 SQLAlchemy ORM model for the 'sentiment_results' table.
 """
 
-from sqlalchemy import Column, Float, ForeignKeyConstraint, Index, Integer, BigInteger, String, UniqueConstraint
+import enum
+
+from sqlalchemy import CheckConstraint, Column, Computed, Float, ForeignKeyConstraint, Index, Integer, BigInteger, SmallInteger, String, UniqueConstraint
+from sqlalchemy import TypeDecorator
 from sqlalchemy import PrimaryKeyConstraint
-from sqlalchemy import Text
+from sqlalchemy import REAL, Text, cast
 from sqlalchemy import TIMESTAMP
 from sqlalchemy.sql import func
 from sqlalchemy.orm import mapped_column, Mapped
@@ -13,6 +16,42 @@ from sqlalchemy.dialects.postgresql import JSONB  # Add import for JSONB type
 from .base import Base
 
 
+class SentimentLabel(enum.IntEnum):
+    """Storage codes for sentiment labels in `sentiment_results.sentiment_label`."""
+    NEGATIVE = 0
+    NEUTRAL = 1
+    POSITIVE = 2
+
+    @classmethod
+    def from_label(cls, label: str) -> "SentimentLabel":
+        """Map a model label (e.g. "positive") to its storage code."""
+        try:
+            return cls[label.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown sentiment label: {label!r}") from None
+
+
+class SentimentLabelType(TypeDecorator):
+    """
+    Stores sentiment labels as SMALLINT while exposing them as lowercase strings.
+
+    ORM attributes, filters and query results keep using "positive"/"negative"/
+    "neutral"; only the on-disk representation is a 2-byte code.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, SentimentLabel):
+            return value
+        return SentimentLabel.from_label(value).value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return SentimentLabel(value).name.lower()
+
+
 class SentimentResultORM(Base):
     """
     SQLAlchemy ORM model representing an individual sentiment analysis result.
@@ -26,11 +65,13 @@ class SentimentResultORM(Base):
         source (str): The origin of the data (e.g., "reddit").
         source_id (str): A secondary identifier from the source (e.g., subreddit name).
         sentiment_score (float): The calculated sentiment score (e.g., from -1.0 to 1.0).
-        sentiment_label (str): The categorical sentiment label (e.g., "positive", "negative", "neutral").
+        sentiment_label (str): The categorical sentiment label (e.g., "positive", "negative", "neutral"),
+                               stored as a SMALLINT `SentimentLabel` code.
         confidence (float, optional): The confidence level of the sentiment prediction, if available.
         processed_at (datetime): Timestamp when the sentiment analysis was performed (defaults to NOW()).
         model_version (str): Version of the sentiment analysis model used.
         raw_text (str, optional): The original text that was analyzed.
+        time_bucket_hour (datetime): UTC hour of processed_at, generated by the database.
         sentiment_scores_json (JSON object, optional): JSON object of scores for all sentiment classes.
     """
     __tablename__ = "sentiment_results"
@@ -38,22 +79,65 @@ class SentimentResultORM(Base):
     id = Column(BigInteger, nullable=False, autoincrement=True, comment="Unique identifier for the sentiment result.")
     event_id: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="Identifier of the original event. Logically references raw_events.id (BIGINT). Not an enforced FK due to TimescaleDB limitations.")
     occurred_at = Column(TIMESTAMP(timezone=True), nullable=False, comment="Timestamp when the event originally occurred.")
-    source = Column(Text, nullable=False, comment="The origin of the data (e.g., 'reddit').")
-    source_id = Column(Text, nullable=False, comment="A secondary identifier from the source (e.g., subreddit name).")
-    sentiment_score = Column(Float, nullable=False, comment="The calculated sentiment score.")
-    sentiment_label = Column(Text, nullable=False, comment="The categorical sentiment label.")
-    confidence = Column(Float, nullable=True, comment="Confidence level of the sentiment prediction.")
+    source = Column(String(64), nullable=False, comment="The origin of the data (e.g., 'reddit').")
+    source_id = Column(String(128), nullable=False, comment="A secondary identifier from the source (e.g., subreddit name).")
+    # REAL (FP32): scores are bounded and the model emits FP32, so DOUBLE PRECISION only wastes 4 bytes each
+    sentiment_score = Column(REAL, nullable=False, comment="The calculated sentiment score.")
+    sentiment_label = Column(SentimentLabelType(), nullable=False, comment="The categorical sentiment label (0=negative, 1=neutral, 2=positive).")
+    confidence = Column(REAL, nullable=True, comment="Confidence level of the sentiment prediction.")
     sentiment_scores_json = Column(JSONB, nullable=True, comment="JSON object of scores for all sentiment classes.")
     processed_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), comment="Timestamp of sentiment processing.")
-    model_version = Column(Text, nullable=False, comment="Version of the sentiment analysis model used.")
+    # UTC hour bucket, matching SentimentMetricORM.time_bucket. The AT TIME ZONE
+    # round-trip keeps the expression IMMUTABLE, as generated columns require.
+    time_bucket_hour = Column(
+        TIMESTAMP(timezone=True),
+        Computed("date_trunc('hour', processed_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'", persisted=True),
+        nullable=False,
+        comment="UTC hour bucket of processed_at (generated).",
+    )
+    model_version = Column(String(64), nullable=False, comment="Version of the sentiment analysis model used.")
     raw_text = Column(Text, nullable=True, comment="The original text that was analyzed.")
 
+    # TimescaleDB hypertable on 'processed_at' (1-day chunks, compressed after
+    # 7 days) is managed by Alembic migrations. The indexes below are created
+    # on the parent and Timescale maintains one local copy per chunk.
     __table_args__ = (
         PrimaryKeyConstraint("id", "processed_at", name="pk_sentiment_result"),
+        # Also serves event_id / (event_id, occurred_at) lookups via its leading columns
         UniqueConstraint("event_id", "occurred_at", "processed_at", name="uq_sentiment_result_event_occurred_processed_at"),
         Index("idx_sentiment_result_src_time", "source", "occurred_at"),
         Index("idx_sentiment_result_label_time", "sentiment_label", "occurred_at"),
-        Index("idx_sentiment_result_event_id_occurred_at", "event_id", "occurred_at"), # For FK lookups and uniqueness
+        CheckConstraint("sentiment_label IN (0, 1, 2)", name="ck_sentiment_label_valid"),
+        # Covers hourly count/avg(score) rollups per source and label with an index-only scan
+        Index("idx_sr_bucket_source_label", "time_bucket_hour", "source", "sentiment_label", "sentiment_score"),
+        # Compact min/max-per-range indexes for time-range scans; rows arrive in
+        # time order, so each chunk's ranges barely overlap. The composite
+        # B-trees above stay for source/label filters with keyset pagination.
+        Index("brin_sr_processed_at", "processed_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("brin_sr_occurred_at", "occurred_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        # Expression indexes for score-range analytics on the per-class scores
+        Index(
+            "idx_sr_scores_positive",
+            cast(sentiment_scores_json["positive"].astext, Float),
+            postgresql_where=sentiment_scores_json.isnot(None),
+        ),
+        Index(
+            "idx_sr_scores_negative",
+            cast(sentiment_scores_json["negative"].astext, Float),
+            postgresql_where=sentiment_scores_json.isnot(None),
+        ),
+        Index(
+            "idx_sr_scores_neutral",
+            cast(sentiment_scores_json["neutral"].astext, Float),
+            postgresql_where=sentiment_scores_json.isnot(None),
+        ),
+        # jsonb_path_ops supports only containment (@>) but is much smaller than jsonb_ops
+        Index(
+            "idx_sr_scores_gin",
+            "sentiment_scores_json",
+            postgresql_using="gin",
+            postgresql_ops={"sentiment_scores_json": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -11,7 +11,7 @@ echo "Starting Sentiment Analyzer API Service..."
 echo "Waiting for database connection..."
 for i in {1..30}; do
   echo "Database connection attempt $i/30..."
-  if python -c "from sentiment_analyzer.utils.db_health import test_db_connection; import asyncio; asyncio.run(test_db_connection())" 2>/dev/null; then
+  if python -c "from sentiment_analyzer.utils.db_health import test_db_connection; import asyncio, sys; sys.exit(0 if asyncio.run(test_db_connection()) else 1)" 2>/dev/null; then
     echo "Database connection successful!"
     break
   fi
@@ -1,38 +1,37 @@
 import pytest
 from datetime import datetime, timezone
 from sqlalchemy import text, select
+from sqlalchemy.orm import load_only
 
 from unittest.mock import patch
 from sentiment_analyzer.core.pipeline import SentimentPipeline
 from sentiment_analyzer.models.sentiment_result_orm import SentimentResultORM
 from sentiment_analyzer.models.sentiment_metric_orm import SentimentMetricORM
 from sentiment_analyzer.tests.stubs.raw_event_stub import RawEventORM # Use stub ORM for integration test
-import json # For parsing JSON string to dict
+import orjson
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
 def mock_ml_models():
-    """Mock the heavyweight ML models to keep integration tests fast."""
+    """Mock the heavyweight ML models once for the whole session to keep integration tests fast."""
     with patch('spacy.load'), patch('transformers.AutoTokenizer.from_pretrained'), patch('transformers.AutoModelForSequenceClassification.from_pretrained'):
         yield
 
 @pytest.mark.asyncio
-async def test_full_pipeline_run_integration(db_session, mock_ml_models, mocker):
+async def test_full_pipeline_run_integration(db_session, insert_returning, mocker):
     """Test a single event moving through the entire pipeline with a live DB."""
     # 1. Setup: Insert a raw event directly into the test database
-    raw_event_content = '{"text": "This company is performing very well."}'
-    raw_event = RawEventORM(
+    raw_event_content = orjson.loads(b'{"text": "This company is performing very well."}')
+    raw_event, = await insert_returning(RawEventORM, [dict(
         id=1, # Internal PK - Note: Main ORM might have auto-incrementing ID, consider if explicit ID is needed or if DB should assign.
         source='reddit-integration-test',
         source_id='reddit-integ-src-id-1', # Source-specific ID, maps to RawEventORM.source_id
-        content=json.loads(raw_event_content), # Provide the content field
-        payload=json.loads(raw_event_content), # Use 'payload' and provide a dict
+        content=raw_event_content, # Provide the content field
+        payload=raw_event_content, # Same dict; content and payload are identical here
         occurred_at=datetime.now(timezone.utc),
         processed=False, # Explicitly set
         processed_at=None # This is the correct field for the main ORM
-    )
-    db_session.add(raw_event)
-    await db_session.commit()
+    )])
 
     # 2. Action: Run the pipeline once
     mocker.patch('sentiment_analyzer.config.settings.settings.EVENT_FETCH_BATCH_SIZE', 10)
@@ -42,7 +41,7 @@ async def test_full_pipeline_run_integration(db_session, mock_ml_models, mocker)
     # 3. Assert: Check the outcomes
     assert events_processed_count == 1
 
-    # Verify the raw event was marked as processed
+    # Verify the raw event was marked as processed (re-read: the pipeline changed it)
     await db_session.refresh(raw_event)
     assert raw_event.processed_at is not None  # DataFetcher marks it as processed
 
@@ -54,7 +53,10 @@ async def test_full_pipeline_run_integration(db_session, mock_ml_models, mocker)
     assert saved_result.sentiment_label is not None 
 
     # Verify sentiment metrics were updated
-    metrics_stmt = select(SentimentMetricORM).where(SentimentMetricORM.source == 'reddit-integration-test')
+    # Only count/avg_score are asserted; load just those columns
+    metrics_stmt = select(SentimentMetricORM).options(
+        load_only(SentimentMetricORM.count, SentimentMetricORM.avg_score)
+    ).where(SentimentMetricORM.source == 'reddit-integration-test')
     metrics = (await db_session.execute(metrics_stmt)).scalars().all()
     assert len(metrics) == 1, "Expected exactly one metric record to be created"
 
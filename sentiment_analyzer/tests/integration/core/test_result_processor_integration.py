@@ -1,5 +1,8 @@
 import pytest
-from sqlalchemy import select
+from unittest.mock import patch
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import load_only
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone, timedelta
 
@@ -14,17 +17,17 @@ from sentiment_analyzer.models import (
     SentimentMetricORM,
     DeadLetterEventORM,
 )
+from sentiment_analyzer.utils.db_session import get_db_session_context_manager
 from sentiment_analyzer.tests.stubs.raw_event_stub import RawEventORM as RawEventStubORM # For creating prerequisite raw_event
 
-# Helper to create a prerequisite raw event in the DB
-async def create_raw_event_in_db(
-    db_session: AsyncSession, 
+# Helpers to create prerequisite raw events in the DB
+def raw_event_row(
     internal_id: int, 
     source: str, 
     event_id_str: str | None = None, 
     source_id_str: str | None = None
-) -> RawEventStubORM:
-    raw_event = RawEventStubORM(
+) -> dict:
+    return dict(
         id=internal_id,
         event_id=event_id_str if event_id_str else f"stub_ext_id_{internal_id}", # Default if not provided
         source=source,
@@ -33,10 +36,23 @@ async def create_raw_event_in_db(
         occurred_at=datetime.now(timezone.utc) - timedelta(days=1),
         processed=False # Default for stubs, good to be explicit
     )
-    db_session.add(raw_event)
+
+async def create_raw_events_bulk(db_session: AsyncSession, rows: list[dict]) -> list[RawEventStubORM]:
+    """Insert all rows with a single multi-values INSERT ... RETURNING (see insert_returning in conftest.py)."""
+    stmt = insert(RawEventStubORM).values(rows).returning(RawEventStubORM)
+    raw_events = list((await db_session.execute(stmt)).scalars().all())
     await db_session.commit()
-    await db_session.refresh(raw_event)
-    return raw_event
+    return raw_events
+
+async def create_raw_event_in_db(
+    db_session: AsyncSession, 
+    internal_id: int, 
+    source: str, 
+    event_id_str: str | None = None, 
+    source_id_str: str | None = None
+) -> RawEventStubORM:
+    row = raw_event_row(internal_id, source, event_id_str, source_id_str)
+    return (await create_raw_events_bulk(db_session, [row]))[0]
 
 @pytest.fixture
 def result_processor_instance() -> ResultProcessor:
@@ -135,35 +151,52 @@ async def test_update_sentiment_metrics_integration_new_and_update(
     fixed_processed_time = datetime.now(timezone.utc).replace(minute=30, second=0, microsecond=0)
     # This ensures it's in the middle of an hour, less likely to cross hour boundary during test execution.
 
-    # 1. First call: Create new metrics
-    raw_event_stub1 = await create_raw_event_in_db(
-        db_session,
+    # Seed both raw events and both results up front in a single transaction
+    raw_event_row1 = raw_event_row(
         internal_id=sample_raw_event_dto.id,
         source=sample_raw_event_dto.source,
         event_id_str=sample_raw_event_dto.event_id,
         source_id_str=sample_raw_event_dto.source_id
     )
-
-    sentiment_result_orm1 = SentimentResultORM(
-        event_id=raw_event_stub1.id, # This should be raw_event_stub1.id if it's the PK
-        occurred_at=raw_event_stub1.occurred_at,
-        source=raw_event_stub1.source,
-        source_id=raw_event_stub1.source_id,
-        raw_text="test text 1",
-        sentiment_label=label,
-        sentiment_score=score1,
-        model_version="integ_test_v1",
-        processed_at=fixed_processed_time # Explicitly set processed_at
+    raw_event_row2 = raw_event_row(
+        internal_id=sample_raw_event_dto.id + 1,
+        source=sample_raw_event_dto.source,
+        event_id_str=f"{sample_raw_event_dto.event_id}_update",
+        source_id_str=sample_raw_event_dto.source_id
     )
-    db_session.add(sentiment_result_orm1)
-    await db_session.commit()
-    # No need to refresh for processed_at if explicitly set, but refresh for ID if it's auto-gen.
-    # Assuming ID is set from raw_event_stub1.id, so refresh might not be strictly needed for ID here.
-    # However, if SentimentResultORM.id is an autoincrement PK, then refresh is needed for that.
-    # Let's assume SentimentResultORM.id is also an autoincrement PK for safety.
-    await db_session.refresh(sentiment_result_orm1)
 
+    result_rows = [
+        dict(
+            event_id=raw_event_row1["id"],
+            occurred_at=raw_event_row1["occurred_at"],
+            source=raw_event_row1["source"],
+            source_id=raw_event_row1["source_id"],
+            raw_text="test text 1",
+            sentiment_label=label,
+            sentiment_score=score1,
+            model_version="integ_test_v1",
+            processed_at=fixed_processed_time # Explicitly set processed_at
+        ),
+        dict(
+            event_id=raw_event_row2["id"],
+            occurred_at=raw_event_row2["occurred_at"],
+            source=raw_event_row2["source"], # Source can be from stub2
+            source_id=raw_event_row1["source_id"], # CRITICAL: Use source_id from stub1 to match the metric
+            raw_text="test text 2",
+            sentiment_label=label,
+            sentiment_score=score2,
+            model_version="integ_test_v1",
+            processed_at=fixed_processed_time # Same time so both land in the same time_bucket
+        ),
+    ]
+    # One transaction (one commit) for all prerequisite rows; RETURNING the
+    # entity populates the autoincrement ids without a refresh
+    async with db_session.begin():
+        await db_session.execute(insert(RawEventStubORM).values([raw_event_row1, raw_event_row2]))
+        stmt = insert(SentimentResultORM).values(result_rows).returning(SentimentResultORM)
+        sentiment_result_orm1, sentiment_result_orm2 = (await db_session.execute(stmt)).scalars().all()
 
+    # 1. First call: Create new metrics
     success1 = await result_processor_instance.update_sentiment_metrics(
         sentiment_result=sentiment_result_orm1,
         raw_event_source=source
@@ -172,7 +205,9 @@ async def test_update_sentiment_metrics_integration_new_and_update(
 
     metric_ts1 = sentiment_result_orm1.processed_at.replace(minute=0, second=0, microsecond=0)
     
-    metrics_stmt1 = select(SentimentMetricORM).where(
+    metrics_stmt1 = select(SentimentMetricORM).options(
+        load_only(SentimentMetricORM.count, SentimentMetricORM.avg_score)
+    ).where(
         (SentimentMetricORM.time_bucket == metric_ts1) &
         (SentimentMetricORM.source == source) &
         (SentimentMetricORM.source_id == sentiment_result_orm1.source_id) &
@@ -185,50 +220,28 @@ async def test_update_sentiment_metrics_integration_new_and_update(
     assert metric_record1.avg_score == pytest.approx(score1)
 
     # 2. Second call: Update existing metrics
-    raw_event_stub2 = await create_raw_event_in_db(
-        db_session,
-        internal_id=sample_raw_event_dto.id + 1,
-        source=sample_raw_event_dto.source,
-        event_id_str=f"{sample_raw_event_dto.event_id}_update",
-        source_id_str=sample_raw_event_dto.source_id 
-    )
-        
-    sentiment_result_orm2 = SentimentResultORM(
-        event_id=raw_event_stub2.id, # This should be raw_event_stub2.id
-        occurred_at=raw_event_stub2.occurred_at,
-        source=raw_event_stub2.source, # Source can be from stub2
-        source_id=raw_event_stub1.source_id, # CRITICAL: Use source_id from stub1 to match the metric 
-        raw_text="test text 2",
-        sentiment_label=label,
-        sentiment_score=score2,
-        model_version="integ_test_v1",
-        processed_at=fixed_processed_time # Explicitly set processed_at to the same time
-    )
-    db_session.add(sentiment_result_orm2)
-    await db_session.commit()
-    await db_session.refresh(sentiment_result_orm2) # Refresh for ID
-
     success2 = await result_processor_instance.update_sentiment_metrics(
         sentiment_result=sentiment_result_orm2,
         raw_event_source=source
     )
     assert success2 is True
 
-    # Store the source_id before expiring the object, to avoid lazy-load errors.
     source_id_to_check = sentiment_result_orm1.source_id
 
-    # Expire the session to ensure we get fresh data from the DB,
-    # as the update happened in a separate session/transaction.
-    db_session.expire_all()
-
     # metric_ts2 will be the same as metric_ts1 due to fixed_processed_time
-    metrics_stmt2 = select(SentimentMetricORM).where(
+    metrics_stmt2 = select(SentimentMetricORM).options(
+        load_only(SentimentMetricORM.count, SentimentMetricORM.avg_score)
+    ).where(
         (SentimentMetricORM.time_bucket == metric_ts1) & # Query for the original time_bucket
         (SentimentMetricORM.source == source) &
         (SentimentMetricORM.source_id == source_id_to_check) &
         (SentimentMetricORM.label == label)
     )
-    metric_record2 = (await db_session.execute(metrics_stmt2)).scalar_one_or_none()
+    # The update happened in a separate session/transaction; populate_existing
+    # overwrites the already-loaded metric_record1 with the fresh row.
+    metric_record2 = (
+        await db_session.execute(metrics_stmt2.execution_options(populate_existing=True))
+    ).scalar_one_or_none()
 
     assert metric_record2 is not None, "Metric record not found after second call"
     assert metric_record2.count == 2 # This should now pass
@@ -254,6 +267,7 @@ async def test_move_to_dead_letter_queue_integration(
             source_id_str=sample_raw_event_dto.source_id
         )
 
+    expected_payload = sample_raw_event_dto.model_dump(mode='json')
     error_message = "Integration test simulated failure"
     failed_stage = "preprocessing_integ_test"
 
@@ -268,7 +282,7 @@ async def test_move_to_dead_letter_queue_integration(
     assert moved_dle_orm.event_id == sample_raw_event_dto.event_id
     assert moved_dle_orm.error_msg == error_message
     assert moved_dle_orm.processing_component == failed_stage
-    assert moved_dle_orm.event_payload == sample_raw_event_dto.model_dump(mode='json')
+    assert moved_dle_orm.event_payload == expected_payload
 
     # Verify by querying the database directly
     stmt = select(DeadLetterEventORM).where(DeadLetterEventORM.id == moved_dle_orm.id)
@@ -277,5 +291,60 @@ async def test_move_to_dead_letter_queue_integration(
     assert queried_dle is not None
     assert queried_dle.event_id == sample_raw_event_dto.event_id
     assert queried_dle.error_msg == error_message
-    assert queried_dle.event_payload == sample_raw_event_dto.model_dump(mode='json')
+    assert queried_dle.event_payload == expected_payload
  
+
+
+# --- Tests for save_sentiment_results_bulk (Integration) ---
+async def _count_bulk_rows(source: str) -> tuple[int, int]:
+    """(sentiment_results, sentiment_metrics) rows for `source`, read on a fresh connection."""
+    async with get_db_session_context_manager() as session:
+        results = await session.scalar(
+            select(func.count()).select_from(SentimentResultORM).where(SentimentResultORM.source == source)
+        )
+        metrics = await session.scalar(
+            select(func.count()).select_from(SentimentMetricORM).where(SentimentMetricORM.source == source)
+        )
+    return results, metrics
+
+def _bulk_results(source: str, labels: list[str], preprocessed: PreprocessedText) -> list[tuple]:
+    return [
+        (
+            RawEventDTO(id=9000 + i, event_id=f"bulk_{source}_{i}", source=source, source_id="bulk_src",
+                        content="bulk", occurred_at=datetime.now(timezone.utc), processed=False),
+            preprocessed,
+            SentimentAnalysisOutput(label=label, confidence=0.5, scores={label: 0.5}, model_version="bulk_v1"),
+        )
+        for i, label in enumerate(labels)
+    ]
+
+@pytest.mark.asyncio
+async def test_save_sentiment_results_bulk_upsert_failure_leaves_no_rows(
+    db_session: AsyncSession,
+    sample_preprocessed_text_dto: PreprocessedText,
+):
+    """Test that a failing metric upsert leaves no sentiment_results rows behind."""
+    source = "bulk_upsert_failure"
+    processor = ResultProcessor()
+    with patch.object(ResultProcessor, "_batch_metric_upsert", return_value=(text("SELECT 1/0"), 0)):
+        written = await processor.save_sentiment_results_bulk(
+            _bulk_results(source, ["positive"] * 3, sample_preprocessed_text_dto), batch_size=1
+        )
+
+    assert written == 0
+    assert await _count_bulk_rows(source) == (0, 0)
+
+@pytest.mark.asyncio
+async def test_save_sentiment_results_bulk_late_chunk_failure_rolls_back(
+    db_session: AsyncSession,
+    sample_preprocessed_text_dto: PreprocessedText,
+):
+    """Test that a failure after the first COPY chunk rolls back that chunk and the metrics."""
+    source = "bulk_chunk_failure"
+    # "error" has no SMALLINT code, so encoding the second chunk fails after the first was copied
+    results = _bulk_results(source, ["positive", "error"], sample_preprocessed_text_dto)
+
+    written = await ResultProcessor().save_sentiment_results_bulk(results, batch_size=1)
+
+    assert written == 0
+    assert await _count_bulk_rows(source) == (0, 0)
@@ -0,0 +1,14 @@
+class FakeResult:
+    """Stand-in for a SQLAlchemy Result: supports .scalars().all() and .mappings().all()."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
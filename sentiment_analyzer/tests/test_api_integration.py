@@ -7,32 +7,119 @@ including database interactions and component integration.
 
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+import base64
 import json
 
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
-import pytest_asyncio
+import orjson
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from sentiment_analyzer.api.main import app
+from sentiment_analyzer.api.endpoints.sentiment import get_preprocessor, get_sentiment_analyzer
+from sentiment_analyzer.config.settings import settings
+from sentiment_analyzer.utils.db_session import get_db_session
 from sentiment_analyzer.models.dtos import (
-    AnalyzeTextRequest,
     SentimentAnalysisOutput,
     PreprocessedText,
+    SentimentMetricDTO,
+    SentimentResultDTO,
 )
 from sentiment_analyzer.models.sentiment_result_orm import SentimentResultORM
 from sentiment_analyzer.models.sentiment_metric_orm import SentimentMetricORM
+from sentiment_analyzer.tests.stubs.result_stub import FakeResult
+
+
+# Request bodies are encoded with orjson and posted as raw content
+_JSON_HEADERS = {"content-type": "application/json"}
+_REQ_SHOULD_FAIL = orjson.dumps({"text": "This should fail"})
+
+# Typed decoders for list responses: pydantic-core parses and validates the JSON
+# in one pass, straight into the endpoints' response DTOs
+_EVENTS_ADAPTER = TypeAdapter(List[SentimentResultDTO])
+_METRICS_ADAPTER = TypeAdapter(List[SentimentMetricDTO])
+
+# A valid pagination cursor (base64-encoded JSON), encoded once at import
+_VALID_CURSOR = base64.b64encode(
+    json.dumps({"timestamp": "2025-06-29T13:00:00+00:00", "id": 2}).encode()
+).decode()
+
+# ORM rows returned by the mocked sessions; built once since tests only read them
+_BASE_REDDIT_EVENT = SentimentResultORM(
+    id=1,
+    event_id=123,
+    occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+    source="reddit",
+    source_id="test_subreddit",
+    sentiment_score=0.8,
+    sentiment_label="positive",
+    confidence=0.85,
+    processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+    model_version="finbert-v1.0",
+    raw_text="This is great news!"
+)
+_BASE_TWITTER_EVENT = SentimentResultORM(
+    id=2,
+    event_id=124,
+    occurred_at=datetime(2025, 6, 29, 13, 0, 0, tzinfo=timezone.utc),
+    source="twitter",
+    source_id="test_user",
+    sentiment_score=-0.6,
+    sentiment_label="negative",
+    confidence=0.75,
+    processed_at=datetime(2025, 6, 29, 13, 5, 0, tzinfo=timezone.utc),
+    model_version="finbert-v1.0",
+    raw_text="This is bad news!"
+)
+_PAGE_EVENT = SentimentResultORM(
+    id=3,
+    event_id=125,
+    occurred_at=datetime(2025, 6, 29, 14, 0, 0, tzinfo=timezone.utc),
+    source="reddit",
+    source_id="test_subreddit",
+    sentiment_score=0.9,
+    sentiment_label="positive",
+    confidence=0.95,
+    processed_at=datetime(2025, 6, 29, 14, 5, 0, tzinfo=timezone.utc),
+    model_version="finbert-v1.0"
+)
+
+# AsyncSession's attribute names, resolved once rather than on every spec'd mock
+_SESSION_SPEC = dir(AsyncSession)
+
+
+@pytest.fixture
+def mock_session():
+    """Fresh AsyncSession stand-in per test, limited to the real session's attributes."""
+    session = MagicMock(spec=_SESSION_SPEC)
+    session.execute = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def mock_db_session(mock_session, override_deps):
+    """
+    Return a factory that makes ``mock_session.execute()`` yield the given rows.
+
+    The session is registered as the app's ``get_db_session`` override, so the
+    endpoints receive it through ``Depends``.
+
+    Usage: ``mock_session = mock_db_session([_BASE_REDDIT_EVENT])``
+    """
+    def _make(rows):
+        mock_session.execute.return_value = FakeResult(rows)
+        override_deps(get_db_session, mock_session)
+        return mock_session
+
+    return _make
 
 
 class TestAPIIntegration:
     """Integration tests for the complete API workflow."""
     
-    @pytest_asyncio.async_test
-    async def test_complete_analysis_workflow(self):
+    async def test_complete_analysis_workflow(self, client, override_deps):
         """Test the complete sentiment analysis workflow from API to database."""
         # Mock all dependencies
-        mock_session = AsyncMock(spec=AsyncSession)
         mock_preprocessor = AsyncMock()
         mock_analyzer = AsyncMock()
         
@@ -54,17 +141,17 @@ class TestAPIIntegration:
         mock_analyzer.analyze_sentiment.return_value = mock_result
         
         # Test the complete workflow
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            with patch("sentiment_analyzer.api.endpoints.sentiment.get_preprocessor", return_value=mock_preprocessor):
-                with patch("sentiment_analyzer.api.endpoints.sentiment.get_sentiment_analyzer", return_value=mock_analyzer):
-                    response = await client.post(
-                        "/api/v1/sentiment/analyze",
-                        json={"text": "This is great news!"}
-                    )
+        override_deps(get_preprocessor, mock_preprocessor)
+        override_deps(get_sentiment_analyzer, mock_analyzer)
+        response = await client.post(
+            "/api/v1/sentiment/analyze",
+            content=orjson.dumps({"text": "This is great news!"}),
+            headers=_JSON_HEADERS
+        )
         
         # Verify response
         assert response.status_code == 200
-        result = response.json()
+        result = orjson.loads(response.content)
         assert result["label"] == "positive"
         assert result["confidence"] == 0.85
         assert result["model_version"] == "finbert-v1.0"
@@ -74,8 +161,7 @@ class TestAPIIntegration:
         mock_preprocessor.preprocess_text.assert_called_once_with("This is great news!")
         mock_analyzer.analyze_sentiment.assert_called_once_with("This is great news!")
     
-    @pytest_asyncio.async_test
-    async def test_bulk_analysis_workflow(self):
+    async def test_bulk_analysis_workflow(self, client, override_deps):
         """Test bulk analysis with multiple texts."""
         mock_preprocessor = AsyncMock()
         mock_analyzer = AsyncMock()
@@ -101,21 +187,21 @@ class TestAPIIntegration:
         ]
         mock_analyzer.analyze_sentiment.side_effect = mock_results
         
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            with patch("sentiment_analyzer.api.endpoints.sentiment.get_preprocessor", return_value=mock_preprocessor):
-                with patch("sentiment_analyzer.api.endpoints.sentiment.get_sentiment_analyzer", return_value=mock_analyzer):
-                    response = await client.post(
-                        "/api/v1/sentiment/analyze/bulk",
-                        json={
-                            "texts": [
-                                {"text": "Great news!"},
-                                {"text": "Bad news!"}
-                            ]
-                        }
-                    )
+        override_deps(get_preprocessor, mock_preprocessor)
+        override_deps(get_sentiment_analyzer, mock_analyzer)
+        response = await client.post(
+            "/api/v1/sentiment/analyze/bulk",
+            content=orjson.dumps({
+                "texts": [
+                    {"text": "Great news!"},
+                    {"text": "Bad news!"}
+                ]
+            }),
+            headers=_JSON_HEADERS
+        )
         
         assert response.status_code == 200
-        results = response.json()
+        results = orjson.loads(response.content)
         assert len(results) == 2
         assert results[0]["label"] == "positive"
         assert results[1]["label"] == "negative"
@@ -124,105 +210,45 @@ class TestAPIIntegration:
         assert mock_preprocessor.preprocess_text.call_count == 2
         assert mock_analyzer.analyze_sentiment.call_count == 2
     
-    @pytest_asyncio.async_test
-    async def test_events_endpoint_with_database(self):
+    async def test_events_endpoint_with_database(self, client, mock_db_session):
         """Test events endpoint with database interaction."""
-        # Mock database session and results
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        
-        # Create mock sentiment result ORM objects
-        mock_events = [
-            SentimentResultORM(
-                id=1,
-                event_id=123,
-                occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
-                source="reddit",
-                source_id="test_subreddit",
-                sentiment_score=0.8,
-                sentiment_label="positive",
-                confidence=0.85,
-                processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
-                model_version="finbert-v1.0",
-                cleaned_text="This is great news!"
-            ),
-            SentimentResultORM(
-                id=2,
-                event_id=124,
-                occurred_at=datetime(2025, 6, 29, 13, 0, 0, tzinfo=timezone.utc),
-                source="twitter",
-                source_id="test_user",
-                sentiment_score=-0.6,
-                sentiment_label="negative",
-                confidence=0.75,
-                processed_at=datetime(2025, 6, 29, 13, 5, 0, tzinfo=timezone.utc),
-                model_version="finbert-v1.0",
-                cleaned_text="This is bad news!"
-            )
-        ]
+        mock_session = mock_db_session([_BASE_REDDIT_EVENT, _BASE_TWITTER_EVENT])
         
-        mock_result.scalars.return_value.all.return_value = mock_events
-        mock_session.execute.return_value = mock_result
-        
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            with patch("sentiment_analyzer.api.endpoints.sentiment.get_db_session", return_value=mock_session):
-                response = await client.get("/api/v1/sentiment/events")
+        response = await client.get("/api/v1/sentiment/events")
         
         assert response.status_code == 200
-        events = response.json()
+        events = _EVENTS_ADAPTER.validate_json(response.content)
         assert len(events) == 2
         
         # Verify first event
-        assert events[0]["sentiment_label"] == "positive"
-        assert events[0]["source"] == "reddit"
-        assert events[0]["confidence"] == 0.85
+        assert events[0].sentiment_label == "positive"
+        assert events[0].source == "reddit"
+        assert events[0].confidence == 0.85
         
         # Verify second event
-        assert events[1]["sentiment_label"] == "negative"
-        assert events[1]["source"] == "twitter"
-        assert events[1]["confidence"] == 0.75
+        assert events[1].sentiment_label == "negative"
+        assert events[1].source == "twitter"
+        assert events[1].confidence == 0.75
         
         # Verify database query was executed
         mock_session.execute.assert_called_once()
     
-    @pytest_asyncio.async_test
-    async def test_events_endpoint_with_filters(self):
+    async def test_events_endpoint_with_filters(self, client, mock_db_session):
         """Test events endpoint with query filters applied."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        
         # Mock filtered results (only positive sentiment from reddit)
-        mock_filtered_events = [
-            SentimentResultORM(
-                id=1,
-                event_id=123,
-                occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
-                source="reddit",
-                source_id="test_subreddit",
-                sentiment_score=0.8,
-                sentiment_label="positive",
-                confidence=0.85,
-                processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
-                model_version="finbert-v1.0"
-            )
-        ]
-        
-        mock_result.scalars.return_value.all.return_value = mock_filtered_events
-        mock_session.execute.return_value = mock_result
-        
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            with patch("sentiment_analyzer.api.endpoints.sentiment.get_db_session", return_value=mock_session):
-                response = await client.get(
-                    "/api/v1/sentiment/events",
-                    params={
-                        "source": "reddit",
-                        "sentiment_label": "positive",
-                        "limit": 10
-                    }
-                )
+        mock_session = mock_db_session([_BASE_REDDIT_EVENT])
+        
+        response = await client.get(
+            "/api/v1/sentiment/events",
+            params={
+                "source": "reddit",
+                "sentiment_label": "positive",
+                "limit": 10
+            }
+        )
         
         assert response.status_code == 200
-        events = response.json()
+        events = orjson.loads(response.content)
         assert len(events) == 1
         assert events[0]["source"] == "reddit"
         assert events[0]["sentiment_label"] == "positive"
@@ -230,199 +256,137 @@ class TestAPIIntegration:
         # Verify database query was executed with filters
         mock_session.execute.assert_called_once()
     
-    @pytest_asyncio.async_test
-    async def test_metrics_endpoint_with_database(self):
+    async def test_metrics_endpoint_with_database(self, client, mock_db_session):
         """Test metrics endpoint with database interaction."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        
-        # Create mock sentiment metric ORM objects
+        # Aggregated rows as the endpoint's GROUP BY query returns them
         mock_metrics = [
             SentimentMetricORM(
-                id=1,
-                metric_timestamp=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
-                raw_event_source="reddit",
-                raw_event_source_id="test_subreddit",
-                sentiment_label="positive",
-                model_version="finbert-v1.0",
-                metric_name="event_count",
-                metric_value=15.0
+                time_bucket=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+                source="reddit",
+                source_id="test_subreddit",
+                label="positive",
+                count=15,
+                avg_score=0.8
             ),
             SentimentMetricORM(
-                id=2,
-                metric_timestamp=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
-                raw_event_source="reddit",
-                raw_event_source_id="test_subreddit",
-                sentiment_label="negative",
-                model_version="finbert-v1.0",
-                metric_name="event_count",
-                metric_value=5.0
+                time_bucket=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+                source="reddit",
+                source_id="test_subreddit",
+                label="negative",
+                count=5,
+                avg_score=-0.6
             )
         ]
         
-        mock_result.scalars.return_value.all.return_value = mock_metrics
-        mock_session.execute.return_value = mock_result
+        mock_session = mock_db_session(mock_metrics)
         
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            with patch("sentiment_analyzer.api.endpoints.sentiment.get_db_session", return_value=mock_session):
-                response = await client.get("/api/v1/sentiment/metrics")
+        response = await client.get("/api/v1/sentiment/metrics")
         
         assert response.status_code == 200
-        metrics = response.json()
+        metrics = _METRICS_ADAPTER.validate_json(response.content)
         assert len(metrics) == 2
         
         # Verify metrics data
-        assert metrics[0]["label"] == "positive"
-        assert metrics[0]["source"] == "reddit"
-        assert metrics[1]["label"] == "negative"
-        assert metrics[1]["source"] == "reddit"
+        assert metrics[0].label == "positive"
+        assert metrics[0].source == "reddit"
+        assert metrics[1].label == "negative"
+        assert metrics[1].source == "reddit"
         
         # Verify database query was executed
         mock_session.execute.assert_called_once()
     
-    @pytest_asyncio.async_test
-    async def test_health_check_endpoint(self):
+    async def test_health_check_endpoint(self, client):
         """Test the health check endpoint."""
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            response = await client.get("/health")
+        response = await client.get("/health")
         
         assert response.status_code == 200
-        health_data = response.json()
+        health_data = orjson.loads(response.content)
         assert health_data["status"] == "healthy"
-        assert health_data["service"] == "sentiment-analyzer"
+        assert health_data["service"] == settings.APP_NAME
         assert "timestamp" in health_data
         assert "version" in health_data
     
-    @pytest_asyncio.async_test
-    async def test_api_error_handling(self):
+    def test_api_error_handling(self, sync_client, override_deps):
         """Test API error handling for various failure scenarios."""
+        # Dependencies are resolved alongside body validation; keep the real models out
+        override_deps(get_preprocessor, AsyncMock())
+        override_deps(get_sentiment_analyzer, AsyncMock())
+        
         # Test invalid JSON input
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            response = await client.post(
-                "/api/v1/sentiment/analyze",
-                json={"invalid_field": "test"}  # Missing required 'text' field
-            )
+        response = sync_client.post(
+            "/api/v1/sentiment/analyze",
+            content=orjson.dumps({"invalid_field": "test"}),  # Missing required 'text' field
+            headers=_JSON_HEADERS
+        )
         
         assert response.status_code == 422  # Validation error
-        error_data = response.json()
+        error_data = orjson.loads(response.content)
         assert "detail" in error_data
     
-    @pytest_asyncio.async_test
-    async def test_preprocessing_failure_handling(self):
-        """Test handling of preprocessing failures."""
-        mock_preprocessor = AsyncMock()
-        mock_preprocessor.preprocess_text.side_effect = Exception("Preprocessing failed")
-        
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            with patch("sentiment_analyzer.api.endpoints.sentiment.get_preprocessor", return_value=mock_preprocessor):
-                response = await client.post(
-                    "/api/v1/sentiment/analyze",
-                    json={"text": "This should fail"}
-                )
-        
-        assert response.status_code == 500
-        error_data = response.json()
-        assert "Analysis failed" in error_data["detail"]
-    
-    @pytest_asyncio.async_test
-    async def test_sentiment_analysis_failure_handling(self):
-        """Test handling of sentiment analysis failures."""
+    @pytest.mark.parametrize("failing,method,url,body,expected_detail", [
+        ("preprocess_text", "POST", "/api/v1/sentiment/analyze", _REQ_SHOULD_FAIL, "Analysis failed"),
+        ("analyze_sentiment", "POST", "/api/v1/sentiment/analyze", _REQ_SHOULD_FAIL, "Analysis failed"),
+        ("execute", "GET", "/api/v1/sentiment/events", None, "Failed to retrieve events"),
+    ])
+    async def test_component_failure_handling(
+        self, client, override_deps, mock_session, failing, method, url, body, expected_detail
+    ):
+        """Test that a failure in preprocessing, analysis or the database surfaces as a 500."""
         mock_preprocessor = AsyncMock()
         mock_analyzer = AsyncMock()
-        
-        mock_preprocessed = PreprocessedText(
+        mock_preprocessor.preprocess_text.return_value = PreprocessedText(
             cleaned_text="test text",
             is_target_language=True
         )
-        mock_preprocessor.preprocess_text.return_value = mock_preprocessed
-        mock_analyzer.analyze_sentiment.side_effect = Exception("Analysis failed")
         
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            with patch("sentiment_analyzer.api.endpoints.sentiment.get_preprocessor", return_value=mock_preprocessor):
-                with patch("sentiment_analyzer.api.endpoints.sentiment.get_sentiment_analyzer", return_value=mock_analyzer):
-                    response = await client.post(
-                        "/api/v1/sentiment/analyze",
-                        json={"text": "This should fail"}
-                    )
-        
-        assert response.status_code == 500
-        error_data = response.json()
-        assert "Analysis failed" in error_data["detail"]
-    
-    @pytest_asyncio.async_test
-    async def test_database_failure_handling(self):
-        """Test handling of database failures in query endpoints."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_session.execute.side_effect = Exception("Database connection failed")
+        # Make exactly one awaited dependency call raise
+        failing_call = {
+            "preprocess_text": mock_preprocessor.preprocess_text,
+            "analyze_sentiment": mock_analyzer.analyze_sentiment,
+            "execute": mock_session.execute,
+        }[failing]
+        failing_call.side_effect = Exception(f"{failing} failed")
         
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            with patch("sentiment_analyzer.api.endpoints.sentiment.get_db_session", return_value=mock_session):
-                response = await client.get("/api/v1/sentiment/events")
+        override_deps(get_preprocessor, mock_preprocessor)
+        override_deps(get_sentiment_analyzer, mock_analyzer)
+        override_deps(get_db_session, mock_session)
+        response = await client.request(method, url, content=body, headers=_JSON_HEADERS)
         
         assert response.status_code == 500
-        error_data = response.json()
-        assert "Database error" in error_data["detail"]
+        error_data = orjson.loads(response.content)
+        assert expected_detail in error_data["detail"]
 
 
 class TestCursorPaginationIntegration:
     """Integration tests for cursor-based pagination."""
     
-    @pytest_asyncio.async_test
-    async def test_pagination_with_cursor(self):
+    async def test_pagination_with_cursor(self, client, mock_db_session):
         """Test pagination using cursor parameter."""
-        mock_session = AsyncMock(spec=AsyncSession)
-        mock_result = MagicMock()
-        
-        # Mock paginated results
-        mock_events = [
-            SentimentResultORM(
-                id=3,
-                event_id=125,
-                occurred_at=datetime(2025, 6, 29, 14, 0, 0, tzinfo=timezone.utc),
-                source="reddit",
-                source_id="test_subreddit",
-                sentiment_score=0.9,
-                sentiment_label="positive",
-                confidence=0.95,
-                processed_at=datetime(2025, 6, 29, 14, 5, 0, tzinfo=timezone.utc),
-                model_version="finbert-v1.0"
-            )
-        ]
-        
-        mock_result.scalars.return_value.all.return_value = mock_events
-        mock_session.execute.return_value = mock_result
-        
-        # Create a valid cursor (base64 encoded JSON)
-        import base64
-        cursor_data = {
-            "timestamp": "2025-06-29T13:00:00+00:00",
-            "id": 2
-        }
-        cursor = base64.b64encode(json.dumps(cursor_data).encode()).decode()
+        # Mock paginated results: the page after _VALID_CURSOR
+        mock_session = mock_db_session([_PAGE_EVENT])
         
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            with patch("sentiment_analyzer.api.endpoints.sentiment.get_db_session", return_value=mock_session):
-                response = await client.get(
-                    "/api/v1/sentiment/events",
-                    params={"cursor": cursor, "limit": 10}
-                )
+        response = await client.get(
+            "/api/v1/sentiment/events",
+            params={"cursor": _VALID_CURSOR, "limit": 10}
+        )
         
         assert response.status_code == 200
-        events = response.json()
+        events = orjson.loads(response.content)
         assert len(events) == 1
         
         # Verify database query was executed with cursor constraints
         mock_session.execute.assert_called_once()
     
-    @pytest_asyncio.async_test
-    async def test_invalid_cursor_handling(self):
+    def test_invalid_cursor_handling(self, sync_client, mock_db_session):
         """Test handling of invalid cursor values."""
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            response = await client.get(
-                "/api/v1/sentiment/events",
-                params={"cursor": "invalid_cursor_value"}
-            )
+        mock_session = mock_db_session([])
+        
+        response = sync_client.get(
+            "/api/v1/sentiment/events",
+            params={"cursor": "invalid_cursor_value"}
+        )
         
         assert response.status_code == 400
-        error_data = response.json()
+        error_data = orjson.loads(response.content)
         assert "Invalid cursor" in error_data["detail"]
+        mock_session.execute.assert_not_called()
@@ -4,19 +4,35 @@ Unit tests for PowerBI integration.
 Tests the PowerBI client for streaming sentiment analysis results.
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 import json
 
 import httpx
-import pytest_asyncio
-from httpx import Response
+from types import SimpleNamespace
 
-from sentiment_analyzer.integrations.powerbi import PowerBIClient, PowerBIRowData
+from sentiment_analyzer.integrations.eventhubs import EventHubsPowerBISink
+from sentiment_analyzer.integrations import powerbi as powerbi_module
+from sentiment_analyzer.integrations.powerbi import PowerBIClient, PowerBIRowData, _RingBatch
 from sentiment_analyzer.models.dtos import SentimentResultDTO
 
 
+def _response(status_code, content=b"", headers=None):
+    """Minimal stand-in for httpx.Response; the client only reads these attributes."""
+    return SimpleNamespace(
+        status_code=status_code,
+        content=content,
+        text=content.decode(),
+        headers=headers or {},
+    )
+
+
+# Shared 200 response for tests that never mutate it
+_OK = _response(200)
+
+
 class TestPowerBIRowData:
     """Test cases for PowerBIRowData model."""
     
@@ -46,12 +62,67 @@ class TestPowerBIRowData:
         # Check datetime conversion
         assert json_data["occurred_at"] == "2025-06-29T12:00:00+00:00"
         assert json_data["processed_at"] == "2025-06-29T12:05:00+00:00"
+        
+        # Sub-second timestamps keep their microseconds, exactly as isoformat() renders them
+        precise = datetime(2025, 6, 29, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        row_data.occurred_at = precise
+        assert row_data.model_dump_json_compatible()["occurred_at"] == precise.isoformat()
+    
+    def test_powerbi_rowdata_is_slotted(self):
+        """Rows are slotted so queued rows carry no per-instance __dict__."""
+        row_data = PowerBIRowData(
+            event_id="test_123",
+            occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+            processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+            source="reddit",
+            source_id="test_subreddit",
+            sentiment_score=0.8,
+            sentiment_label="positive",
+            model_version="finbert-v1.0"
+        )
+        
+        assert hasattr(PowerBIRowData, "__slots__")
+        assert not hasattr(row_data, "__dict__")
+
+
+class TestRingBatch:
+    """Test cases for the PowerBI ring buffer."""
+    
+    def test_drain_wraps_around(self):
+        """Test draining across the end of the slot array keeps FIFO order."""
+        ring = _RingBatch(4)
+        for i in range(3):
+            ring.put_nowait(i)
+        assert ring.drain(2) == [0, 1]
+        
+        for i in range(3, 6):
+            ring.put_nowait(i)
+        
+        assert ring.qsize() == 4
+        with pytest.raises(asyncio.QueueFull):
+            ring.put_nowait(6)
+        assert ring.drain(10) == [2, 3, 4, 5]
+        assert ring.qsize() == 0
+        assert ring._slots == [None, None, None, None]
+    
+    async def test_put_blocks_producer_until_drained(self):
+        """Test a full buffer suspends put() until the consumer drains it (backpressure)."""
+        ring = _RingBatch(2)
+        ring.put_nowait("a")
+        ring.put_nowait("b")
+        
+        producer = asyncio.create_task(ring.put("c"))
+        await asyncio.sleep(0)
+        assert not producer.done()
+        
+        assert ring.drain(1) == ["a"]
+        await asyncio.wait_for(producer, timeout=1.0)
+        assert ring.drain(10) == ["b", "c"]
 
 
 class TestPowerBIClient:
     """Test cases for PowerBIClient."""
     
-    @pytest_asyncio.async_test
     async def test_client_initialization(self):
         """Test PowerBI client initialization."""
         client = PowerBIClient(
@@ -65,23 +136,65 @@ class TestPowerBIClient:
         assert client.api_key == "test_key"
         assert client.max_retries == 2
         assert client.batch_size == 50
-        assert len(client._batch_queue) == 0
+        assert client._queue.qsize() == 0
         
         await client.close()
     
-    @pytest_asyncio.async_test
+    async def test_client_generates_fast_mapper(self):
+        """The row mapper is generated code that copies every row field from the result."""
+        client = PowerBIClient(push_url="https://api.powerbi.com/test")
+        result = SentimentResultDTO(
+            id=1,
+            event_id="test_123",
+            occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+            source="reddit",
+            source_id="test_subreddit",
+            sentiment_score=0.8,
+            sentiment_label="positive",
+            confidence=0.85,
+            processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+            model_version="finbert-v1.0"
+        )
+        
+        row = client._to_row(result)
+        
+        assert client._to_row.__code__.co_name == "_to_row"
+        assert row == PowerBIRowData(
+            event_id="test_123",
+            occurred_at=result.occurred_at,
+            processed_at=result.processed_at,
+            source="reddit",
+            source_id="test_subreddit",
+            sentiment_score=0.8,
+            sentiment_label="positive",
+            model_version="finbert-v1.0",
+            confidence=0.85
+        )
+        
+        await client.close()
+    
+    def test_client_uses_keepalive_pool(self):
+        """Test the HTTP client is built with a bounded keep-alive connection pool."""
+        with patch("sentiment_analyzer.integrations.powerbi.httpx.AsyncClient") as mock_client_cls:
+            PowerBIClient(push_url="https://api.powerbi.com/test", timeout=30.0)
+        
+        kwargs = mock_client_cls.call_args.kwargs
+        assert kwargs["limits"].max_keepalive_connections == 5
+        assert kwargs["limits"].max_connections == 10
+        assert kwargs["timeout"].connect == 5.0
+        assert kwargs["timeout"].read == 30.0
+    
     async def test_push_row_success(self):
         """Test successful single row push."""
         # Create mock HTTP client
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 200
+        mock_response = _OK
         
         mock_http_client = AsyncMock()
         mock_http_client.post.return_value = mock_response
         
         client = PowerBIClient(
             push_url="https://api.powerbi.com/test",
-            batch_size=1  # Force immediate flush
+            batch_size=1  # Flusher sends as soon as one row is queued
         )
         client.client = mock_http_client
         
@@ -101,6 +214,8 @@ class TestPowerBIClient:
         
         # Test push_row
         result = await client.push_row(sentiment_result)
+        # Wait for the background flusher to pick up and send the row
+        await client._queue.join()
         
         assert result is True
         mock_http_client.post.assert_called_once()
@@ -108,14 +223,28 @@ class TestPowerBIClient:
         # Verify the payload structure
         call_args = mock_http_client.post.call_args
         assert call_args[0][0] == "https://api.powerbi.com/test"
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["content"])
         assert "rows" in payload
         assert len(payload["rows"]) == 1
         assert payload["rows"][0]["event_id"] == "test_123"
         
         await client.close()
     
-    @pytest_asyncio.async_test
+    async def test_send_batch_accepts_2xx(self):
+        """Test any 2xx status (e.g. 202 Accepted) counts as success."""
+        mock_http_client = AsyncMock()
+        mock_http_client.post.return_value = _response(202)
+        
+        client = PowerBIClient(push_url="https://api.powerbi.com/test", max_retries=2)
+        client.client = mock_http_client
+        
+        result = await client._post_rows([{"event_id": "test_123"}])
+        
+        assert result is True
+        mock_http_client.post.assert_called_once()
+        
+        await client.close()
+    
     async def test_push_row_batching(self):
         """Test row batching functionality."""
         mock_http_client = AsyncMock()
@@ -148,15 +277,82 @@ class TestPowerBIClient:
         
         # No HTTP calls should have been made yet
         mock_http_client.post.assert_not_called()
-        assert len(client._batch_queue) == 2
+        assert client._queue.qsize() == 2
+        
+        await client.close()
+    
+    async def test_partial_batch_sent_after_max_latency(self):
+        """Test a partial batch is sent once the debounce window expires."""
+        mock_response = _OK
+        
+        mock_http_client = AsyncMock()
+        mock_http_client.post.return_value = mock_response
+        
+        client = PowerBIClient(
+            push_url="https://api.powerbi.com/test",
+            batch_size=10,
+            max_latency=0.05
+        )
+        client.client = mock_http_client
+        
+        sentiment_result = SentimentResultDTO(
+            id=1,
+            event_id="test_123",
+            occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+            processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+            source="reddit",
+            source_id="test_subreddit",
+            sentiment_score=0.8,
+            sentiment_label="positive",
+            model_version="finbert-v1.0"
+        )
+        
+        await client.push_row(sentiment_result)
+        await asyncio.wait_for(client._queue.join(), timeout=1.0)
+        
+        mock_http_client.post.assert_called_once()
+        assert len(json.loads(mock_http_client.post.call_args[1]["content"])["rows"]) == 1
+        
+        await client.close()
+    
+    async def test_full_batches_sent_without_waiting_for_max_latency(self):
+        """Test the size trigger sends full batches before the debounce window expires."""
+        mock_response = _OK
+        
+        mock_http_client = AsyncMock()
+        mock_http_client.post.return_value = mock_response
+        
+        client = PowerBIClient(
+            push_url="https://api.powerbi.com/test",
+            batch_size=3,
+            max_latency=30.0  # Far longer than the test waits
+        )
+        client.client = mock_http_client
+        
+        for i in range(2 * client.batch_size):
+            await client.push_row(SentimentResultDTO(
+                id=i,
+                event_id=f"test_{i}",
+                occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+                processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+                source="reddit",
+                source_id="test_subreddit",
+                sentiment_score=0.8,
+                sentiment_label="positive",
+                model_version="finbert-v1.0"
+            ))
+        await asyncio.wait_for(client._queue.join(), timeout=1.0)
+        
+        assert mock_http_client.post.call_count == 2
+        sent = [json.loads(call[1]["content"])["rows"] for call in mock_http_client.post.call_args_list]
+        assert [len(rows) for rows in sent] == [3, 3]
+        assert [row["event_id"] for rows in sent for row in rows] == [f"test_{i}" for i in range(6)]
         
         await client.close()
     
-    @pytest_asyncio.async_test
     async def test_push_rows_bulk(self):
         """Test bulk row pushing."""
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 200
+        mock_response = _OK
         
         mock_http_client = AsyncMock()
         mock_http_client.post.return_value = mock_response
@@ -192,13 +388,46 @@ class TestPowerBIClient:
         
         await client.close()
     
-    @pytest_asyncio.async_test
+    async def test_push_rows_bulk_uses_type_adapter(self):
+        """Raw dict results are validated as one list by the cached TypeAdapter."""
+        mock_http_client = AsyncMock()
+        mock_http_client.post.return_value = _OK
+        
+        client = PowerBIClient(push_url="https://api.powerbi.com/test", batch_size=2)
+        client.client = mock_http_client
+        
+        raw_results = [
+            {
+                "id": i,
+                "event_id": f"test_{i}",
+                "occurred_at": "2025-06-29T12:00:00+00:00",
+                "processed_at": "2025-06-29T12:05:00+00:00",
+                "source": "reddit",
+                "source_id": "test_subreddit",
+                "sentiment_score": 0.8,
+                "sentiment_label": "positive",
+                "model_version": "finbert-v1.0"
+            }
+            for i in range(3)
+        ]
+        
+        adapter = powerbi_module._DTO_LIST_ADAPTER
+        with patch.object(powerbi_module, "_DTO_LIST_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.side_effect = adapter.validate_python
+            result = await client.push_rows(raw_results)
+        
+        assert result is True
+        mock_adapter.validate_python.assert_called_once_with(raw_results)
+        assert mock_http_client.post.call_count == 2
+        
+        await client.close()
+    
     async def test_retry_on_rate_limit(self):
         """Test retry logic on rate limiting (429 status)."""
         # First call returns 429, second call succeeds
         mock_responses = [
-            MagicMock(spec=Response, status_code=429),
-            MagicMock(spec=Response, status_code=200)
+            _response(429),
+            _OK
         ]
         
         mock_http_client = AsyncMock()
@@ -233,13 +462,104 @@ class TestPowerBIClient:
         
         await client.close()
     
-    @pytest_asyncio.async_test
+    async def test_retry_after_header_honoured(self):
+        """Test the Retry-After header sets a floor on the backoff delay."""
+        rate_limited = _response(429, headers={"Retry-After": "2"})
+        mock_http_client = AsyncMock()
+        mock_http_client.post.side_effect = [
+            rate_limited,
+            _OK
+        ]
+        
+        client = PowerBIClient(
+            push_url="https://api.powerbi.com/test",
+            max_retries=2,
+            retry_delay=0.1
+        )
+        client.client = mock_http_client
+        
+        with patch("sentiment_analyzer.integrations.powerbi.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await client._post_rows([{"event_id": "test_123"}])
+        
+        assert result is True
+        mock_sleep.assert_awaited_once()
+        wait_time = mock_sleep.await_args[0][0]
+        assert 2.0 <= wait_time <= 2.1
+        
+        await client.close()
+    
+    async def test_retry_after_server_error_resends_rows(self):
+        """Test a retry after a 500 POSTs the same rows, not the logged error body."""
+        mock_http_client = AsyncMock()
+        mock_http_client.post.side_effect = [
+            _response(500, b"Internal Server Error"),
+            _OK
+        ]
+        
+        client = PowerBIClient(
+            push_url="https://api.powerbi.com/test",
+            max_retries=2,
+            retry_delay=0.1
+        )
+        client.client = mock_http_client
+        
+        with patch("sentiment_analyzer.integrations.powerbi.asyncio.sleep", new_callable=AsyncMock):
+            result = await client._post_rows([{"event_id": "test_123"}])
+        
+        assert result is True
+        assert mock_http_client.post.call_count == 2
+        first_call, second_call = mock_http_client.post.call_args_list
+        assert second_call.kwargs["content"] == first_call.kwargs["content"]
+        assert json.loads(second_call.kwargs["content"]) == {"rows": [{"event_id": "test_123"}]}
+        
+        await client.close()
+    
+    async def test_backoff_delay_is_capped(self):
+        """Test exponential backoff grows per attempt but never exceeds max_retry_delay plus jitter."""
+        client = PowerBIClient(
+            push_url="https://api.powerbi.com/test",
+            retry_delay=0.5,
+            max_retry_delay=4.0
+        )
+        
+        with patch("sentiment_analyzer.integrations.powerbi.random.uniform", return_value=0.0):
+            assert [client._backoff_delay(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 4.0, 4.0]
+            # A server-requested delay is honoured even above the cap
+            assert client._backoff_delay(10, retry_after=60.0) == 60.0
+        
+        await client.close()
+    
+    async def test_circuit_breaker_opens_and_spills(self, tmp_path):
+        """Test consecutive failures open the circuit and spill rows to disk."""
+        mock_response = _response(500, b"Internal Server Error")
+        
+        mock_http_client = AsyncMock()
+        mock_http_client.post.return_value = mock_response
+        
+        spill_file = tmp_path / "powerbi_spill.jsonl"
+        client = PowerBIClient(
+            push_url="https://api.powerbi.com/test",
+            max_retries=0,
+            failure_threshold=2,
+            spill_path=str(spill_file)
+        )
+        client.client = mock_http_client
+        
+        assert await client._post_rows([{"event_id": "a"}]) is False
+        assert await client._post_rows([{"event_id": "b"}]) is False
+        assert mock_http_client.post.call_count == 2
+        
+        # Circuit is open: no HTTP call, row goes to the spill file
+        assert await client._post_rows([{"event_id": "c"}]) is False
+        assert mock_http_client.post.call_count == 2
+        assert json.loads(spill_file.read_text().strip()) == {"event_id": "c"}
+        
+        await client.close()
+    
     async def test_max_retries_exceeded(self):
         """Test behavior when max retries are exceeded."""
         # All calls return 500 error
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
+        mock_response = _response(500, b"Internal Server Error")
         
         mock_http_client = AsyncMock()
         mock_http_client.post.return_value = mock_response
@@ -273,7 +593,6 @@ class TestPowerBIClient:
         
         await client.close()
     
-    @pytest_asyncio.async_test
     async def test_timeout_handling(self):
         """Test timeout handling."""
         mock_http_client = AsyncMock()
@@ -308,14 +627,33 @@ class TestPowerBIClient:
         
         await client.close()
     
-    @pytest_asyncio.async_test
     async def test_test_connection_success(self):
-        """Test successful connection test."""
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 200
+        """Test successful connection test uses a HEAD probe and writes nothing."""
+        mock_http_client = AsyncMock()
+        mock_http_client.head.return_value = _OK
+        mock_http_client.stream = MagicMock()
+        
+        client = PowerBIClient(push_url="https://api.powerbi.com/test")
+        client.client = mock_http_client
+        
+        result = await client.test_connection()
+        
+        assert result is True
+        mock_http_client.head.assert_called_once_with(client.push_url)
+        mock_http_client.stream.assert_not_called()
+        mock_http_client.post.assert_not_called()
+        
+        await client.close()
+    
+    async def test_test_connection_falls_back_when_head_unsupported(self):
+        """Endpoints rejecting HEAD are probed with a streamed empty batch."""
+        mock_response = _response(200)
+        mock_response.aread = AsyncMock()
         
         mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
+        mock_http_client.head.return_value = _response(405)
+        mock_http_client.stream = MagicMock()
+        mock_http_client.stream.return_value.__aenter__.return_value = mock_response
         
         client = PowerBIClient(push_url="https://api.powerbi.com/test")
         client.client = mock_http_client
@@ -323,21 +661,20 @@ class TestPowerBIClient:
         result = await client.test_connection()
         
         assert result is True
-        mock_http_client.post.assert_called_once_with(
+        mock_http_client.stream.assert_called_once_with(
+            "POST",
             "https://api.powerbi.com/test",
-            json={"rows": []}
+            content=b'{"rows":[]}'
         )
+        mock_response.aread.assert_not_called()
         
         await client.close()
     
-    @pytest_asyncio.async_test
     async def test_test_connection_failure(self):
         """Test connection test failure."""
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 401
-        
         mock_http_client = AsyncMock()
-        mock_http_client.post.return_value = mock_response
+        mock_http_client.head.return_value = _response(401)
+        mock_http_client.stream = MagicMock()
         
         client = PowerBIClient(push_url="https://api.powerbi.com/test")
         client.client = mock_http_client
@@ -345,14 +682,13 @@ class TestPowerBIClient:
         result = await client.test_connection()
         
         assert result is False
+        mock_http_client.stream.assert_not_called()
         
         await client.close()
     
-    @pytest_asyncio.async_test
     async def test_flush_batch(self):
         """Test manual batch flushing."""
-        mock_response = MagicMock(spec=Response)
-        mock_response.status_code = 200
+        mock_response = _OK
         
         mock_http_client = AsyncMock()
         mock_http_client.post.return_value = mock_response
@@ -386,6 +722,115 @@ class TestPowerBIClient:
         
         assert result is True
         mock_http_client.post.assert_called_once()
-        assert len(client._batch_queue) == 0
+        assert client._queue.qsize() == 0
+        
+        await client.close()
+    
+    async def test_push_results_aggregated(self):
+        """Test results are pre-aggregated into one row per bucket and label."""
+        mock_response = _OK
+        
+        mock_http_client = AsyncMock()
+        mock_http_client.post.return_value = mock_response
+        
+        client = PowerBIClient(push_url="https://api.powerbi.com/test")
+        client.client = mock_http_client
+        
+        sentiment_results = []
+        for i, (second, score) in enumerate([(5, 0.6), (45, 0.8), (75, 0.4)]):
+            sentiment_results.append(SentimentResultDTO(
+                id=i,
+                event_id=f"test_{i}",
+                occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc).replace(
+                    minute=second // 60, second=second % 60
+                ),
+                processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+                source="reddit",
+                source_id="test_subreddit",
+                sentiment_score=score,
+                sentiment_label="positive",
+                model_version="finbert-v1.0"
+            ))
+        
+        result = await client.push_results_aggregated(sentiment_results, bucket_seconds=60)
+        
+        assert result is True
+        mock_http_client.post.assert_called_once()
+        rows = json.loads(mock_http_client.post.call_args[1]["content"])["rows"]
+        assert len(rows) == 2
+        assert rows[0]["count"] == 2
+        assert rows[0]["avg_score"] == pytest.approx(0.7)
+        assert rows[0]["time_bucket"].startswith("2025-06-29T12:00:00")
+        assert rows[1]["count"] == 1
+        assert rows[1]["time_bucket"].startswith("2025-06-29T12:01:00")
         
         await client.close()
+
+
+class TestEventHubsPowerBISink:
+    """Test cases for EventHubsPowerBISink."""
+    
+    async def test_eventhubs_sink_sends_batch(self):
+        """All rows go out in a single Event Hubs batch, independent of the REST batch_size."""
+        mock_producer = AsyncMock()
+        mock_batch = MagicMock()
+        mock_producer.create_batch.return_value = mock_batch
+        
+        sink = EventHubsPowerBISink(eventhub_name="sentiment", producer=mock_producer)
+        
+        sentiment_results = [
+            SentimentResultDTO(
+                id=i,
+                event_id=f"test_{i}",
+                occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+                processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+                source="reddit",
+                source_id="test_subreddit",
+                sentiment_score=0.8,
+                sentiment_label="positive",
+                model_version="finbert-v1.0"
+            )
+            for i in range(250)
+        ]
+        
+        with patch("sentiment_analyzer.integrations.eventhubs.EventData", side_effect=lambda body: body):
+            result = await sink.push_rows(sentiment_results)
+        
+        assert result is True
+        mock_producer.send_batch.assert_awaited_once_with(mock_batch)
+        assert mock_batch.add.call_count == 250
+        assert json.loads(mock_batch.add.call_args_list[0].args[0])["event_id"] == "test_0"
+        
+        await sink.close()
+        mock_producer.close.assert_awaited_once()
+    
+    async def test_eventhubs_sink_starts_new_batch_when_full(self):
+        """A full batch is sent and the remaining rows continue in a fresh one."""
+        mock_producer = AsyncMock()
+        full_batch = MagicMock()
+        full_batch.add.side_effect = [None, ValueError("EventDataBatch has reached its size limit")]
+        next_batch = MagicMock()
+        mock_producer.create_batch.side_effect = [full_batch, next_batch]
+        
+        sink = EventHubsPowerBISink(producer=mock_producer)
+        sentiment_results = [
+            SentimentResultDTO(
+                id=i,
+                event_id=f"test_{i}",
+                occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+                processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+                source="reddit",
+                source_id="test_subreddit",
+                sentiment_score=0.8,
+                sentiment_label="positive",
+                model_version="finbert-v1.0"
+            )
+            for i in range(3)
+        ]
+        
+        with patch("sentiment_analyzer.integrations.eventhubs.EventData", side_effect=lambda body: body):
+            result = await sink.push_rows(sentiment_results)
+        
+        assert result is True
+        assert [c.args[0] for c in mock_producer.send_batch.await_args_list] == [full_batch, next_batch]
+        assert next_batch.add.call_count == 2
@@ -0,0 +1,49 @@
+import time
+
+import pytest
+from datetime import datetime, timezone
+
+from fastapi import HTTPException
+
+from sentiment_analyzer.api.endpoints.sentiment import encode_cursor, decode_cursor
+
+
+@pytest.mark.unit
+class TestCursorPagination:
+    """Test cases for cursor-based pagination utilities."""
+    
+    def test_encode_decode_cursor(self):
+        """Test cursor encoding and decoding."""
+        # Test data
+        timestamp = datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc)
+        id_value = 123
+        
+        # Encode cursor
+        cursor = encode_cursor(timestamp, id_value)
+        assert isinstance(cursor, str)
+        assert len(cursor) > 0
+        
+        # Decode cursor
+        decoded_timestamp, decoded_id = decode_cursor(cursor)
+        assert decoded_timestamp == timestamp
+        assert decoded_id == id_value
+    
+    def test_encode_decode_cursor_perf(self):
+        """Test the cursor codec round-trips 10k times under a loose wall-clock ceiling."""
+        timestamp = datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc)
+        id_value = 123
+        
+        start = time.perf_counter()
+        for _ in range(10_000):
+            assert decode_cursor(encode_cursor(timestamp, id_value)) == (timestamp, id_value)
+        
+        # Regression guard for the pagination hot path, not a benchmark
+        assert time.perf_counter() - start < 0.5
+    
+    def test_decode_invalid_cursor(self):
+        """Test decoding invalid cursor raises HTTPException."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor("invalid_cursor")
+        
+        assert exc_info.value.status_code == 400
+        assert "Invalid cursor" in str(exc_info.value.detail)
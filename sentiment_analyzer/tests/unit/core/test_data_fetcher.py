@@ -1,3 +1,4 @@
+import asyncpg
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from sqlalchemy.exc import SQLAlchemyError
@@ -5,33 +6,31 @@ from sqlalchemy.exc import SQLAlchemyError
 from sentiment_analyzer.core.data_fetcher import fetch_and_claim_raw_events
 from sentiment_analyzer.models.dtos import RawEventDTO
 
-# Since data_fetcher uses a standalone function, we patch the session utility it uses.
+# Without an explicit session the fetcher claims events on the shared asyncpg pool,
+# so we patch the pool's acquire() helper and hand back a mock connection.
 @pytest.fixture
-def mock_db_session():
-    """Fixture to mock the database session context manager and session object."""
-    with patch('sentiment_analyzer.core.data_fetcher.get_async_db_session') as mock_get_session:
-        mock_session = AsyncMock()
-        # The context manager returns the session
-        mock_get_session.return_value = mock_session
-        mock_session.__aenter__.return_value = mock_session
-        yield mock_session
+def mock_asyncpg_conn():
+    """Fixture to mock the asyncpg pool connection used by the data fetcher."""
+    with patch('sentiment_analyzer.utils.asyncpg_pool.acquire') as mock_acquire:
+        mock_conn = AsyncMock()
+        mock_acquire.return_value.__aenter__.return_value = mock_conn
+        yield mock_conn
 
 @pytest.mark.asyncio
-async def test_fetch_and_claim_successful(mock_db_session):
+async def test_fetch_and_claim_successful(mock_asyncpg_conn):
     """Test successfully fetching and claiming a batch of raw events."""
-    # Mock the return value of session.execute().scalars().all()
-    mock_event_data = [
-        (1, '{"text":"event 1"}', 'reddit', '2023-01-01T12:00:00'),
-        (2, '{"text":"event 2"}', 'reddit', '2023-01-01T12:01:00')
+    # asyncpg Records behave like mappings of column name to value
+    mock_asyncpg_conn.fetch.return_value = [
+        {'id': 1, 'content': '{"text":"event 1"}', 'source': 'reddit', 'occurred_at': '2023-01-01T12:00:00'},
+        {'id': 2, 'content': '{"text":"event 2"}', 'source': 'reddit', 'occurred_at': '2023-01-01T12:01:00'},
     ]
-    mock_result = MagicMock()
-    mock_result.all.return_value = mock_event_data
-    mock_db_session.scalars.return_value = mock_result
 
     batch_size = 5
     events = await fetch_and_claim_raw_events(batch_size=batch_size)
 
-    assert mock_db_session.execute.called
+    # Selection and claiming happen in one round trip
+    mock_asyncpg_conn.fetch.assert_awaited_once()
+    assert mock_asyncpg_conn.fetch.call_args.args[1] == batch_size
     assert len(events) == 2
     assert all(isinstance(event, RawEventDTO) for event in events)
     assert events[0].id == 1
@@ -39,38 +38,59 @@ async def test_fetch_and_claim_successful(mock_db_session):
     assert events[0].source == 'reddit'
 
 @pytest.mark.asyncio
-async def test_fetch_and_claim_no_events_found(mock_db_session):
+async def test_fetch_and_claim_no_events_found(mock_asyncpg_conn):
     """Test the case where no new events are available to be fetched."""
-    # Mock the database call to return an empty list
-    mock_result = MagicMock()
-    mock_result.all.return_value = []
-    mock_db_session.scalars.return_value = mock_result
+    mock_asyncpg_conn.fetch.return_value = []
 
     events = await fetch_and_claim_raw_events(batch_size=10)
 
-    assert mock_db_session.execute.called
+    assert mock_asyncpg_conn.fetch.called
     assert len(events) == 0
 
 @pytest.mark.asyncio
-async def test_fetch_and_claim_db_error(mock_db_session):
-    """Test handling of a SQLAlchemyError during the database operation."""
-    # Configure the mock session to raise a database error
-    mock_db_session.execute.side_effect = SQLAlchemyError("Database connection failed")
+async def test_fetch_and_claim_db_error(mock_asyncpg_conn):
+    """Test handling of a database error during the claim statement."""
+    mock_asyncpg_conn.fetch.side_effect = asyncpg.PostgresError("Database connection failed")
 
     # The function should catch the error, log it, and return an empty list
     events = await fetch_and_claim_raw_events(batch_size=10)
 
-    assert mock_db_session.execute.called
-    assert mock_db_session.rollback.called
+    assert mock_asyncpg_conn.fetch.called
     assert len(events) == 0
 
 @pytest.mark.asyncio
-async def test_fetch_and_claim_unexpected_error(mock_db_session):
-    """Test handling of a non-SQLAlchemyError during the operation."""
-    mock_db_session.execute.side_effect = Exception("An unexpected error occurred")
+async def test_fetch_and_claim_unexpected_error(mock_asyncpg_conn):
+    """Test handling of a non-database error during the operation."""
+    mock_asyncpg_conn.fetch.side_effect = Exception("An unexpected error occurred")
 
     events = await fetch_and_claim_raw_events(batch_size=10)
 
-    assert mock_db_session.execute.called
-    assert mock_db_session.rollback.called
+    assert mock_asyncpg_conn.fetch.called
+    assert len(events) == 0
+
+@pytest.mark.asyncio
+async def test_fetch_and_claim_with_session_single_round_trip():
+    """Test that a caller-supplied SQLAlchemy session is used with a single UPDATE ... RETURNING."""
+    mock_session = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ['id', 'content', 'source', 'occurred_at']
+    mock_result.fetchall.return_value = [(1, '{"text":"event 1"}', 'reddit', '2023-01-01T12:00:00')]
+    mock_session.execute.return_value = mock_result
+
+    with patch('sentiment_analyzer.utils.asyncpg_pool.acquire') as mock_acquire:
+        events = await fetch_and_claim_raw_events(batch_size=5, db_session=mock_session)
+
+    mock_acquire.assert_not_called()
+    mock_session.execute.assert_awaited_once()
+    assert [event.id for event in events] == [1]
+
+@pytest.mark.asyncio
+async def test_fetch_and_claim_with_session_db_error():
+    """Test that errors on a caller-supplied session roll it back."""
+    mock_session = AsyncMock()
+    mock_session.execute.side_effect = SQLAlchemyError("Database connection failed")
+
+    events = await fetch_and_claim_raw_events(batch_size=10, db_session=mock_session)
+
+    assert mock_session.rollback.called
     assert len(events) == 0
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 
@@ -20,9 +22,23 @@ def mock_pipeline_components():
         result_processor_instance = MockResultProcessor.return_value
 
         # Make processor methods async mocks
-        result_processor_instance.save_sentiment_result = AsyncMock()
-        result_processor_instance.update_sentiment_metrics = AsyncMock()
-        result_processor_instance.move_to_dead_letter_queue = AsyncMock()
+        result_processor_instance.save_sentiment_result_with_metrics = AsyncMock()
+        result_processor_instance.save_sentiment_results = AsyncMock(return_value=[])
+        # Like the real processor: queued DLQ futures stay pending until the group commit (flush) runs
+        pending_dead_letters = []
+
+        def _queue_dead_letter(**kwargs):
+            future = asyncio.get_running_loop().create_future()
+            pending_dead_letters.append(future)
+            return future
+
+        async def _flush():
+            for future in pending_dead_letters:
+                if not future.done():
+                    future.set_result(MagicMock())
+
+        result_processor_instance.queue_dead_letter = MagicMock(side_effect=_queue_dead_letter)
+        result_processor_instance.flush = AsyncMock(side_effect=_flush)
 
         yield {
             "preprocessor": preprocessor_instance,
@@ -42,17 +58,17 @@ async def test_process_single_event_success(mock_pipeline_components, mocker):
     # Mock component outputs for a successful run
     mock_pipeline_components['preprocessor'].preprocess.return_value = PreprocessedText(is_target_language=True, cleaned_text='good test')
     mock_pipeline_components['analyzer'].analyze.return_value = SentimentAnalysisOutput(label='positive', confidence=0.9)
-    mock_pipeline_components['result_processor'].save_sentiment_result.return_value = MagicMock() # Represents a saved ORM object
-    mock_pipeline_components['result_processor'].update_sentiment_metrics.return_value = True
+    mock_pipeline_components['result_processor'].save_sentiment_result_with_metrics.return_value = MagicMock() # Represents a saved ORM object
 
     result = await pipeline.process_single_event(raw_event)
 
-    assert result is True
+    # On success the saved ORM object is returned
+    assert result is mock_pipeline_components['result_processor'].save_sentiment_result_with_metrics.return_value
     mock_pipeline_components['preprocessor'].preprocess.assert_called_once()
     mock_pipeline_components['analyzer'].analyze.assert_called_once()
-    mock_pipeline_components['result_processor'].save_sentiment_result.assert_called_once()
-    mock_pipeline_components['result_processor'].update_sentiment_metrics.assert_called_once()
-    mock_pipeline_components['result_processor'].move_to_dead_letter_queue.assert_not_called()
+    mock_pipeline_components['result_processor'].save_sentiment_result_with_metrics.assert_called_once()
+    mock_pipeline_components['result_processor'].queue_dead_letter.assert_not_called()
+    assert not pipeline._background # Nothing left running off the critical path
 
 @pytest.mark.asyncio
 async def test_process_event_non_target_language(mock_pipeline_components, mocker):
@@ -68,7 +84,7 @@ async def test_process_event_non_target_language(mock_pipeline_components, mocke
 
     assert result is True # Skipping is considered a successful outcome
     mock_pipeline_components['analyzer'].analyze.assert_not_called()
-    mock_pipeline_components['result_processor'].save_sentiment_result.assert_not_called()
+    mock_pipeline_components['result_processor'].save_sentiment_result_with_metrics.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_process_event_empty_content(mock_pipeline_components, mocker):
@@ -80,7 +96,11 @@ async def test_process_event_empty_content(mock_pipeline_components, mocker):
     result = await pipeline.process_single_event(raw_event)
 
     assert result is False
-    mock_pipeline_components['result_processor'].move_to_dead_letter_queue.assert_called_once()
+    # The DLQ write is queued for the group commit rather than awaited inline
+    assert len(pipeline._background) == 1
+    await pipeline.flush_background_tasks()
+    mock_pipeline_components['result_processor'].flush.assert_awaited_once()
+    mock_pipeline_components['result_processor'].queue_dead_letter.assert_called_once()
     mock_pipeline_components['preprocessor'].preprocess.assert_not_called()
 
 @pytest.mark.asyncio
@@ -93,14 +113,14 @@ async def test_process_event_save_result_fails(mock_pipeline_components, mocker)
     # Mock a failure in the result processor
     mock_pipeline_components['preprocessor'].preprocess.return_value = PreprocessedText(is_target_language=True, cleaned_text='good test')
     mock_pipeline_components['analyzer'].analyze.return_value = SentimentAnalysisOutput(label='positive', confidence=0.9)
-    mock_pipeline_components['result_processor'].save_sentiment_result.return_value = None # Simulate save failure
+    mock_pipeline_components['result_processor'].save_sentiment_result_with_metrics.return_value = None # Simulate save failure
 
     result = await pipeline.process_single_event(raw_event)
 
     assert result is False
-    mock_pipeline_components['result_processor'].move_to_dead_letter_queue.assert_called_once()
-    # Ensure metrics update is not attempted if saving fails
-    mock_pipeline_components['result_processor'].update_sentiment_metrics.assert_not_called()
+    assert len(pipeline._background) == 1
+    await pipeline.flush_background_tasks()
+    mock_pipeline_components['result_processor'].queue_dead_letter.assert_called_once()
 
 @pytest.mark.asyncio
 async def test_run_pipeline_once(mock_pipeline_components, mocker):
@@ -113,6 +133,14 @@ async def test_run_pipeline_once(mock_pipeline_components, mocker):
         RawEventDTO(id=2, content='{"text":"Event 2"}', source='test', occurred_at='2023-01-01T00:00:00')
     ]
     mock_pipeline_components['fetch'].return_value = events
+    mock_pipeline_components['preprocessor'].preprocess_many.return_value = [
+        PreprocessedText(is_target_language=True, cleaned_text='event one'),
+        PreprocessedText(is_target_language=True, cleaned_text='event two'),
+    ]
+    mock_pipeline_components['analyzer'].analyze_many.return_value = [
+        SentimentAnalysisOutput(label='positive', confidence=0.9),
+        SentimentAnalysisOutput(label='negative', confidence=0.8),
+    ]
 
     # Mock process_single_event to simplify the test
     with patch.object(pipeline, 'process_single_event', new_callable=AsyncMock) as mock_process_single:
@@ -121,8 +149,75 @@ async def test_run_pipeline_once(mock_pipeline_components, mocker):
         fetched_count = await pipeline.run_pipeline_once()
 
         assert fetched_count == 2
+        # The batch save fails (returns []), so both events fall back to per-event saves
+        mock_pipeline_components['result_processor'].save_sentiment_results.assert_called_once()
         assert mock_process_single.call_count == 2
 
+    # The model is invoked once for the whole batch, not once per event
+    mock_pipeline_components['analyzer'].analyze_many.assert_called_once()
+    assert len(mock_pipeline_components['analyzer'].analyze_many.call_args.args[0]) == 2
+    mock_pipeline_components['analyzer'].analyze.assert_not_called()
+    precomputed = mock_process_single.call_args_list[1].args[1]
+    assert precomputed[1].label == 'negative'
+
+@pytest.mark.asyncio
+async def test_run_pipeline_once_batches_saves(mock_pipeline_components, mocker):
+    """Test that all analyzed results of a batch are saved with a single batch call."""
+    mocker.patch('sentiment_analyzer.config.settings.settings.EVENT_FETCH_BATCH_SIZE', 10)
+    pipeline = SentimentPipeline()
+    events = [
+        RawEventDTO(id=i, content=f'{{"text":"Event {i}"}}', source='test', occurred_at='2023-01-01T00:00:00')
+        for i in range(3)
+    ]
+    mock_pipeline_components['fetch'].return_value = events
+    mock_pipeline_components['preprocessor'].preprocess_many.return_value = [
+        PreprocessedText(is_target_language=True, cleaned_text=f'event {i}') for i in range(3)
+    ]
+    mock_pipeline_components['analyzer'].analyze_many.return_value = [
+        SentimentAnalysisOutput(label='positive', confidence=0.9) for _ in range(3)
+    ]
+    save_batch = mock_pipeline_components['result_processor'].save_sentiment_results
+    save_batch.return_value = [MagicMock() for _ in range(3)]
+
+    with patch.object(pipeline, 'process_single_event', new_callable=AsyncMock) as mock_process_single:
+        fetched_count = await pipeline.run_pipeline_once()
+
+    assert fetched_count == 3
+    save_batch.assert_called_once()
+    batch = save_batch.call_args.args[0]
+    assert len(batch) == len(events)
+    assert [raw_event.id for raw_event, _, _ in batch] == [0, 1, 2]
+    mock_process_single.assert_not_called()
+    mock_pipeline_components['result_processor'].save_sentiment_result_with_metrics.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_run_pipeline_once_concurrent(mock_pipeline_components, mocker):
+    """Test that events of a batch are processed concurrently, bounded by SENTIMENT_CONCURRENCY."""
+    mocker.patch('sentiment_analyzer.config.settings.settings.SENTIMENT_CONCURRENCY', 4)
+    pipeline = SentimentPipeline()
+    events = [
+        RawEventDTO(id=i, content=f'{{"text":"Event {i}"}}', source='test', occurred_at='2023-01-01T00:00:00')
+        for i in range(10)
+    ]
+    mock_pipeline_components['fetch'].return_value = events
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _slow_process(_event, _precomputed=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.1)
+        in_flight -= 1
+        return True
+
+    with patch.object(pipeline, 'process_single_event', new_callable=AsyncMock, side_effect=_slow_process):
+        fetched_count = await pipeline.run_pipeline_once()
+
+    assert fetched_count == 10
+    assert max_in_flight == 4
+
 @pytest.mark.asyncio
 async def test_run_pipeline_once_no_events(mock_pipeline_components, mocker):
     """Test the pipeline runner when no events are fetched."""
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -25,11 +27,13 @@ def mock_spacy_model():
         mock_load.return_value = mock_nlp
         yield mock_load
 
-# Mock langdetect
+# Mock language identification
 @pytest.fixture
 def mock_langdetect():
-    """Fixture to mock the langdetect library."""
-    with patch('langdetect.detect') as mock_detect:
+    """Fixture to mock the language identification adapter."""
+    with patch('sentiment_analyzer.core.lang_id.detect') as mock_detect, \
+            patch('sentiment_analyzer.core.lang_id.detect_with_confidence',
+                  side_effect=lambda text: (mock_detect(text), 0.99)):
         mock_detect.return_value = 'en' # Default mock to English
         yield mock_detect
 
@@ -106,6 +110,64 @@ def test_individual_cleaning_rules(mock_spacy_model, mock_langdetect, input_text
     result = preprocessor.preprocess(input_text)
     assert result.cleaned_text == expected_output
 
+def test_preprocess_many_uses_pipe(mock_spacy_model, mock_langdetect):
+    """Test that batched preprocessing tokenizes target-language texts via a single nlp.pipe call."""
+    preprocessor = Preprocessor(target_language='en')
+    mock_nlp = mock_spacy_model.return_value
+
+    def _doc(lemma):
+        doc = MagicMock()
+        doc.__iter__.return_value = [MagicMock(lemma_=lemma, is_stop=False, is_punct=False, is_space=False)]
+        return doc
+
+    mock_nlp.pipe.return_value = iter([_doc('good'), _doc('bad')])
+    texts = ["Good stuff", "", "Bad stuff"]
+
+    with patch.object(preprocessor, 'detect_language', return_value=('en', 0.99)):
+        results = preprocessor.preprocess_many(texts)
+
+    mock_nlp.pipe.assert_called_once()
+    piped = mock_nlp.pipe.call_args.args[0]
+    assert isinstance(piped, list)
+    assert piped == ["Good stuff", "Bad stuff"]
+    mock_nlp.assert_not_called()
+    assert [r.cleaned_text for r in results] == ['good', '', 'bad']
+    assert [r.original_text for r in results] == texts
+
+def test_short_text_skips_language_detection(mock_spacy_model, mock_langdetect):
+    """Test that texts shorter than 10 characters are assumed to be in the target language."""
+    preprocessor = Preprocessor(target_language='en')
+
+    lang_code, confidence = preprocessor.detect_language("Love it!")
+
+    assert (lang_code, confidence) == ('en', None)
+    mock_langdetect.assert_not_called()
+
+    preprocessor.detect_language("Long enough to classify")
+    mock_langdetect.assert_called_once_with("Long enough to classify")
+
+@pytest.mark.parametrize("text", [
+    "foohttp://x.com@bar baz",
+    "mail me at a@b.com now",
+    "ping @user about #topic",
+    "see www.example.com/#anchor and @you",
+    "x@y@z #a@b @c#d",
+    "no noise here",
+])
+def test_clean_text_basic_matches_sequential_substitution(mock_spacy_model, mock_langdetect, text):
+    """Test that precompiled cleaning gives the same result as the original sequential re.sub calls."""
+    expected = re.sub(r"http\S+|www\S+|https\S+", "", text, flags=re.MULTILINE)
+    expected = re.sub(r"\S*@\S*\s?", "", expected)
+    expected = re.sub(r"@\w+", "", expected)
+    expected = re.sub(r"#\w+", "", expected)
+    expected = re.sub(r"\s+", " ", expected).strip()
+
+    assert Preprocessor()._clean_text_basic(text) == expected
+
+def test_clean_text_basic_removes_url_before_email(mock_spacy_model):
+    """Test that a URL glued to an email-like suffix only removes the URL token."""
+    assert Preprocessor()._clean_text_basic("foohttp://x.com@bar baz") == "foo baz"
+
 def test_preprocess_empty_and_whitespace_input(mock_spacy_model, mock_langdetect):
     """Test that empty or whitespace-only strings are handled gracefully."""
     preprocessor = Preprocessor()
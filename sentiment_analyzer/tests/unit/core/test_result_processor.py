@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +14,7 @@ from sentiment_analyzer.models.dtos import (
     SentimentAnalysisOutput,
 )
 from sentiment_analyzer.models import (
+    SentimentLabel,
     SentimentResultORM,
     SentimentMetricORM,
     DeadLetterEventORM,
@@ -180,6 +183,127 @@ async def test_save_sentiment_result_exception(
     assert saved_result is None
  
 
+# --- Tests for save_sentiment_result_with_metrics ---
+@pytest.mark.asyncio
+async def test_save_sentiment_result_with_metrics_single_statement(
+    result_processor_instance: ResultProcessor,
+    mock_db_session_for_processor: AsyncMock,
+    mock_raw_event_dto: RawEventDTO,
+    mock_preprocessed_text_dto: PreprocessedText,
+    mock_sentiment_analysis_output_dto: SentimentAnalysisOutput,
+    mock_sentiment_result_orm: SentimentResultORM,
+):
+    """Test that the result insert and metric upsert go out as one statement."""
+    returned_row = MagicMock()
+    returned_row._mapping = {
+        column.name: getattr(mock_sentiment_result_orm, column.name)
+        for column in SentimentResultORM.__table__.columns
+    }
+    mock_db_session_for_processor.execute.return_value = MagicMock(one=MagicMock(return_value=returned_row))
+
+    saved_result = await result_processor_instance.save_sentiment_result_with_metrics(
+        raw_event=mock_raw_event_dto,
+        preprocessed_data=mock_preprocessed_text_dto,
+        sentiment_output=mock_sentiment_analysis_output_dto,
+    )
+
+    mock_db_session_for_processor.execute.assert_awaited_once()
+    statement_sql = str(mock_db_session_for_processor.execute.await_args.args[0])
+    assert "sentiment_results" in statement_sql
+    assert "sentiment_metrics" in statement_sql
+    mock_db_session_for_processor.commit.assert_awaited_once()
+    mock_db_session_for_processor.rollback.assert_not_called()
+    assert isinstance(saved_result, SentimentResultORM)
+    assert saved_result.id == mock_sentiment_result_orm.id
+    assert saved_result.sentiment_label == mock_sentiment_analysis_output_dto.label
+
+# --- Tests for save_sentiment_results ---
+@pytest.mark.asyncio
+async def test_save_sentiment_results_batches_inserts_and_metrics(
+    result_processor_instance: ResultProcessor,
+    mock_db_session_for_processor: AsyncMock,
+    mock_raw_event_dto: RawEventDTO,
+    mock_preprocessed_text_dto: PreprocessedText,
+    mock_sentiment_analysis_output_dto: SentimentAnalysisOutput,
+    mock_sentiment_result_orm: SentimentResultORM,
+):
+    """Test that a batch is saved with one insert, one metric upsert and one commit."""
+    returned_row = MagicMock()
+    returned_row._mapping = {
+        column.name: getattr(mock_sentiment_result_orm, column.name)
+        for column in SentimentResultORM.__table__.columns
+    }
+    mock_db_session_for_processor.execute.return_value = MagicMock(all=MagicMock(return_value=[returned_row] * 3))
+
+    batch = [(mock_raw_event_dto, mock_preprocessed_text_dto, mock_sentiment_analysis_output_dto)] * 3
+    saved = await result_processor_instance.save_sentiment_results(batch)
+
+    assert len(saved) == 3
+    assert all(isinstance(result, SentimentResultORM) for result in saved)
+    assert mock_db_session_for_processor.execute.await_count == 2
+    insert_call, upsert_call = mock_db_session_for_processor.execute.await_args_list
+    assert len(insert_call.args[1]) == 3 # All rows in one executemany-style INSERT
+    assert "sentiment_metrics" in str(upsert_call.args[0])
+    # Same hour/source/label: the three results collapse into one metric row
+    assert len(upsert_call.args[0].compile().params) == 6
+    mock_db_session_for_processor.commit.assert_awaited_once()
+    mock_db_session_for_processor.rollback.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_save_sentiment_results_sqlalchemy_error(
+    result_processor_instance: ResultProcessor,
+    mock_db_session_for_processor: AsyncMock,
+    mock_raw_event_dto: RawEventDTO,
+    mock_preprocessed_text_dto: PreprocessedText,
+    mock_sentiment_analysis_output_dto: SentimentAnalysisOutput,
+):
+    """Test that a failed batch save rolls back and returns no results."""
+    mock_db_session_for_processor.execute.side_effect = SQLAlchemyError("DB error on batch insert")
+
+    saved = await result_processor_instance.save_sentiment_results(
+        [(mock_raw_event_dto, mock_preprocessed_text_dto, mock_sentiment_analysis_output_dto)]
+    )
+
+    assert saved == []
+    mock_db_session_for_processor.commit.assert_not_called()
+    mock_db_session_for_processor.rollback.assert_awaited_once()
+
+# --- Tests for save_sentiment_results_bulk ---
+@pytest.mark.asyncio
+async def test_save_sentiment_results_bulk_uses_copy_in_batches(
+    result_processor_instance: ResultProcessor,
+    mock_db_session_for_processor: AsyncMock,
+    mock_raw_event_dto: RawEventDTO,
+    mock_preprocessed_text_dto: PreprocessedText,
+    mock_sentiment_analysis_output_dto: SentimentAnalysisOutput,
+):
+    """Test that bulk saving streams records through COPY, one call per batch."""
+    driver_connection = MagicMock()
+    driver_connection.copy_records_to_table = AsyncMock()
+    raw_connection = MagicMock(driver_connection=driver_connection)
+    sa_connection = MagicMock()
+    sa_connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    mock_db_session_for_processor.connection = AsyncMock(return_value=sa_connection)
+
+    results = [(mock_raw_event_dto, mock_preprocessed_text_dto, mock_sentiment_analysis_output_dto)] * 3
+
+    written = await result_processor_instance.save_sentiment_results_bulk(results, batch_size=2)
+
+    assert written == 3
+    assert driver_connection.copy_records_to_table.await_count == 2
+    first_call = driver_connection.copy_records_to_table.await_args_list[0]
+    assert first_call.args == ("sentiment_results",)
+    assert len(first_call.kwargs["records"]) == 2
+    record = dict(zip(first_call.kwargs["columns"], first_call.kwargs["records"][0]))
+    assert record["event_id"] == mock_raw_event_dto.id
+    assert record["sentiment_label"] == SentimentLabel.POSITIVE
+    assert record["raw_text"] == mock_preprocessed_text_dto.original_text
+    # Metrics are kept in sync with the copied rows by one upsert in the same transaction
+    mock_db_session_for_processor.execute.assert_awaited_once()
+    assert "sentiment_metrics" in str(mock_db_session_for_processor.execute.await_args.args[0])
+    mock_db_session_for_processor.commit.assert_awaited_once()
+    mock_db_session_for_processor.add.assert_not_called()
+
 # --- Tests for update_sentiment_metrics ---
 @pytest.mark.asyncio
 async def test_update_sentiment_metrics_success(
@@ -205,7 +329,10 @@ async def test_update_sentiment_metrics_success(
         raw_event_source=mock_raw_event_dto.source,
     )
 
-    assert mock_db_session_for_processor.execute.await_count == 2  # Expect two execute calls: 1 for SELECT, 1 for INSERT/UPDATE
+    mock_db_session_for_processor.execute.assert_awaited_once()  # Single INSERT ... ON CONFLICT DO UPDATE
+    upsert_sql = str(mock_db_session_for_processor.execute.await_args.args[0])
+    assert upsert_sql.startswith("INSERT INTO sentiment_metrics")
+    assert "ON CONFLICT (time_bucket, source, source_id, label) DO UPDATE" in upsert_sql
     mock_db_session_for_processor.commit.assert_awaited_once()
     mock_db_session_for_processor.rollback.assert_not_called()
     assert success is True
@@ -233,8 +360,8 @@ async def test_update_sentiment_metrics_sqlalchemy_error(
         raw_event_source=mock_raw_event_dto.source,
     )
 
-    # Execute will be called for the first metric (count), then fail
-    mock_db_session_for_processor.execute.assert_awaited_once() 
+    # The single upsert fails; there is no separate SELECT to have run first
+    mock_db_session_for_processor.execute.assert_awaited_once()
     mock_db_session_for_processor.commit.assert_not_called()
     mock_db_session_for_processor.rollback.assert_awaited_once()
     assert success is False
@@ -262,7 +389,7 @@ async def test_update_sentiment_metrics_exception(
         raw_event_source=mock_raw_event_dto.source,
     )
 
-    # Execute will be called for the first metric (count), then fail
+    # The single upsert fails; there is no separate SELECT to have run first
     mock_db_session_for_processor.execute.assert_awaited_once()
     mock_db_session_for_processor.commit.assert_not_called()
     mock_db_session_for_processor.rollback.assert_awaited_once()
@@ -295,7 +422,7 @@ async def test_move_to_dead_letter_queue_success(
     assert added_object.event_payload == mock_raw_event_dto.model_dump(mode="json") # Check if payload is correctly stored as JSON-compatible dict
 
     mock_db_session_for_processor.commit.assert_awaited_once()
-    mock_db_session_for_processor.refresh.assert_awaited_once_with(added_object)
+    mock_db_session_for_processor.refresh.assert_not_called()
     mock_db_session_for_processor.rollback.assert_not_called()
     assert moved_event is not None
     assert moved_event == added_object
@@ -342,3 +469,81 @@ async def test_move_to_dead_letter_queue_exception(
     mock_db_session_for_processor.rollback.assert_awaited_once()
     assert moved_event is None
  
+
+# --- Tests for queue_dead_letter (group commit) ---
+@pytest.mark.asyncio
+async def test_queue_dead_letter_group_commits_on_flush(
+    mock_db_session_for_processor: AsyncMock,
+    mock_raw_event_dto: RawEventDTO,
+):
+    """Test that queued dead-letter entries are written with one add_all and one commit."""
+    mock_db_session_for_processor.add_all = MagicMock()
+    # Long interval so the background flusher cannot commit before flush()
+    processor = ResultProcessor(flush_interval_ms=10_000)
+
+    futures = [
+        processor.queue_dead_letter(raw_event=mock_raw_event_dto, error_message=f"error {i}", failed_stage="test_stage")
+        for i in range(3)
+    ]
+    mock_db_session_for_processor.commit.assert_not_called() # Nothing written until the group commit
+    await processor.flush()
+
+    mock_db_session_for_processor.add_all.assert_called_once()
+    added_objects = mock_db_session_for_processor.add_all.call_args[0][0]
+    assert [dle.error_msg for dle in added_objects] == ["error 0", "error 1", "error 2"]
+    mock_db_session_for_processor.commit.assert_awaited_once()
+    assert [future.result() for future in futures] == added_objects
+    await processor.close()
+
+@pytest.mark.asyncio
+async def test_queue_dead_letter_background_flusher(
+    mock_db_session_for_processor: AsyncMock,
+    mock_raw_event_dto: RawEventDTO,
+):
+    """Test that the background flusher commits entries queued within one flush interval together."""
+    mock_db_session_for_processor.add_all = MagicMock()
+    processor = ResultProcessor(flush_interval_ms=5)
+
+    futures = [
+        processor.queue_dead_letter(raw_event=mock_raw_event_dto, error_message="error", failed_stage="test_stage")
+        for _ in range(2)
+    ]
+    results = await asyncio.wait_for(asyncio.gather(*futures), timeout=1)
+
+    assert all(isinstance(result, DeadLetterEventORM) for result in results)
+    mock_db_session_for_processor.add_all.assert_called_once()
+    mock_db_session_for_processor.commit.assert_awaited_once()
+    await processor.close()
+
+@pytest.mark.asyncio
+async def test_queue_dead_letter_commit_failure(
+    mock_db_session_for_processor: AsyncMock,
+    mock_raw_event_dto: RawEventDTO,
+):
+    """Test that a failed group commit rolls back and resolves every future with None."""
+    mock_db_session_for_processor.add_all = MagicMock()
+    mock_db_session_for_processor.commit.side_effect = SQLAlchemyError("DB error on group commit")
+    processor = ResultProcessor(flush_interval_ms=10_000)
+
+    futures = [
+        processor.queue_dead_letter(raw_event=mock_raw_event_dto, error_message="error", failed_stage="test_stage")
+        for _ in range(2)
+    ]
+    await processor.close()
+
+    mock_db_session_for_processor.rollback.assert_awaited_once()
+    assert [future.result() for future in futures] == [None, None]
+
+@pytest.mark.asyncio
+async def test_queue_dead_letter_session_failure_resolves_futures(mock_raw_event_dto: RawEventDTO):
+    """Test that futures resolve with None even when the session itself cannot be opened."""
+    processor = ResultProcessor(flush_interval_ms=10_000)
+    with patch('sentiment_analyzer.core.result_processor.get_async_db_session') as mock_get_session:
+        mock_get_session.return_value.__aenter__ = AsyncMock(side_effect=ConnectionRefusedError("database is down"))
+        mock_get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        future = processor.queue_dead_letter(raw_event=mock_raw_event_dto, error_message="error", failed_stage="test_stage")
+        await processor.close()
+
+    assert future.done()
+    assert future.result() is None
@@ -59,6 +59,23 @@ def test_get_device_selection(mock_cuda_available, mock_transformers):
     analyzer_cpu = SentimentAnalyzerComponent(use_gpu_if_available=False)
     assert str(analyzer_cpu.device) == 'cpu'
 
+def test_analyzer_int8_path(mock_transformers):
+    """Test that the quantized path applies dynamic int8 quantization on CPU only."""
+    mock_tokenizer, mock_model = mock_transformers
+    model_instance = mock_model.from_pretrained.return_value
+    quantized_model = MagicMock()
+
+    with patch('torch.ao.quantization.quantize_dynamic', return_value=quantized_model) as mock_quantize:
+        analyzer = SentimentAnalyzerComponent(use_gpu_if_available=False, quantized=True)
+
+        mock_quantize.assert_called_once_with(model_instance, {torch.nn.Linear}, dtype=torch.qint8)
+        assert analyzer.model is quantized_model
+
+        with patch('torch.cuda.is_available', return_value=True):
+            analyzer_gpu = SentimentAnalyzerComponent(use_gpu_if_available=True, quantized=True)
+        assert mock_quantize.call_count == 1 # Not applied on GPU
+        assert analyzer_gpu.model is model_instance
+
 def test_analyze_normal_text(mock_transformers):
     """Test sentiment analysis on a normal string of text."""
     analyzer = SentimentAnalyzerComponent()
@@ -103,3 +120,24 @@ def test_analyze_inference_error(mock_transformers):
     assert result.label == 'neutral'
     assert result.confidence == 0.0 # Confidence is 0 to indicate an error
     assert result.scores == {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
+
+
+def test_analyze_many_single_forward_pass(mock_transformers):
+    """Test that a batch of texts is tokenized together and run through the model once."""
+    mock_tokenizer, mock_model = mock_transformers
+    tokenizer_instance = mock_tokenizer.from_pretrained.return_value
+    tokenizer_instance.return_value = {
+        "input_ids": torch.tensor([[1, 2, 3], [4, 5, 0]]),
+        "attention_mask": torch.tensor([[1, 1, 1], [1, 1, 0]]),
+    }
+    model_instance = mock_model.from_pretrained.return_value
+    model_instance.return_value.logits = torch.tensor([[2.0, 0.1, 0.1], [0.1, 2.0, 0.1]])
+
+    analyzer = SentimentAnalyzerComponent()
+    results = analyzer.analyze_many(["Great quarter.", "", "Terrible losses."])
+
+    tokenizer_instance.assert_called_once()
+    assert tokenizer_instance.call_args.args[0] == ["Great quarter.", "Terrible losses."]
+    model_instance.assert_called_once()
+    assert [r.label for r in results] == ['positive', 'neutral', 'negative']
+    assert results[1].confidence == 1.0 # Empty input gets the neutral default
@@ -0,0 +1,75 @@
+import json
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+from sentiment_analyzer.models import SentimentResultORM
+from sentiment_analyzer.models.dtos import SentimentResultDTO
+
+
+@pytest.fixture
+def sentiment_result_dto():
+    return SentimentResultDTO(
+        id=1,
+        event_id="test_123",
+        occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+        processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+        source="reddit",
+        source_id="test_subreddit",
+        sentiment_score=0.8,
+        sentiment_label="positive",
+        model_version="finbert-v1.0"
+    )
+
+
+def test_to_json_bytes_is_cached(sentiment_result_dto):
+    """Frozen DTOs serialize once and return the same bytes afterwards."""
+    first = sentiment_result_dto.to_json_bytes()
+
+    assert sentiment_result_dto.to_json_bytes() is first
+    assert json.loads(first) == sentiment_result_dto.model_dump(mode="json")
+
+
+def test_frozen_dto_rejects_mutation(sentiment_result_dto):
+    """Internal DTOs are immutable, which is what makes the cache safe."""
+    with pytest.raises(ValidationError):
+        sentiment_result_dto.sentiment_label = "negative"
+
+
+def test_from_orm_fast_skips_validation_but_stringifies_event_id():
+    """ORM rows become DTOs via model_construct, with event_id as a string."""
+    orm_row = SentimentResultORM(
+        id=7,
+        event_id=123,
+        occurred_at=datetime(2025, 6, 29, 12, 0, 0, tzinfo=timezone.utc),
+        processed_at=datetime(2025, 6, 29, 12, 5, 0, tzinfo=timezone.utc),
+        source="reddit",
+        source_id="test_subreddit",
+        sentiment_score=0.8,
+        sentiment_label="positive",
+        confidence=0.85,
+        sentiment_scores_json={"positive": 0.85},
+        model_version="finbert-v1.0",
+        raw_text="This is great news!"
+    )
+
+    with patch.object(SentimentResultDTO, "model_validate") as mock_validate:
+        dto = SentimentResultDTO.from_orm_fast(orm_row)
+
+    mock_validate.assert_not_called()
+    assert dto.id == 7
+    assert dto.event_id == "123"
+    assert dto.raw_text == "This is great news!"
+    assert dto.confidence == 0.85
+
+
+def test_msgpack_round_trip(sentiment_result_dto):
+    """Results survive a msgpack round trip with aware datetimes intact."""
+    pytest.importorskip("msgpack")
+
+    decoded = SentimentResultDTO.from_msgpack(sentiment_result_dto.to_msgpack())
+
+    assert decoded == sentiment_result_dto
+    assert decoded.occurred_at.tzinfo is not None
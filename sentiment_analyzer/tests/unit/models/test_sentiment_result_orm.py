@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from sentiment_analyzer.models import SentimentLabel
+from sentiment_analyzer.models.sentiment_result_orm import SentimentLabelType
+
+
+@pytest.fixture
+def label_type():
+    return SentimentLabelType()
+
+
+@pytest.mark.parametrize("label, code", [
+    ("negative", SentimentLabel.NEGATIVE),
+    ("neutral", SentimentLabel.NEUTRAL),
+    ("positive", SentimentLabel.POSITIVE),
+])
+def test_sentiment_label_round_trip(label_type, label, code):
+    """Labels are stored as SMALLINT codes and read back as lowercase strings."""
+    dialect = postgresql.dialect()
+
+    assert label_type.process_bind_param(label, dialect) == code
+    assert label_type.process_result_value(int(code), dialect) == label
+
+
+def test_sentiment_label_rejects_unknown_label(label_type):
+    """Unknown labels fail at bind time instead of reaching the CHECK constraint."""
+    with pytest.raises(ValueError):
+        label_type.process_bind_param("mixed", postgresql.dialect())
@@ -0,0 +1,47 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.sql.elements import TextClause
+
+from sentiment_analyzer.utils import db_health
+
+
+def _mock_engine(conn):
+    """An engine whose connect() yields `conn` as an async context manager."""
+    engine = MagicMock()
+    connect_cm = AsyncMock()
+    connect_cm.__aenter__.return_value = conn
+    connect_cm.__aexit__.return_value = None
+    engine.connect.return_value = connect_cm
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_db_connection_success():
+    """Test that the health check runs SELECT 1 as a text() statement outside a transaction."""
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.execution_options = AsyncMock(return_value=conn)
+    engine = _mock_engine(conn)
+
+    with patch.object(db_health, "get_async_engine", return_value=engine):
+        assert await db_health.test_db_connection() is True
+
+    engine.connect.assert_called_once()
+    engine.begin.assert_not_called()
+    conn.execution_options.assert_awaited_once_with(isolation_level="AUTOCOMMIT")
+    statement = conn.execute.await_args.args[0]
+    assert isinstance(statement, TextClause)
+    assert statement is db_health._PING
+    assert str(statement) == "SELECT 1"
+
+
+@pytest.mark.asyncio
+async def test_db_connection_failure():
+    """Test that a failing query is reported as an unhealthy database."""
+    conn = MagicMock()
+    conn.execute = AsyncMock(side_effect=ConnectionRefusedError("database is down"))
+    conn.execution_options = AsyncMock(return_value=conn)
+
+    with patch.object(db_health, "get_async_engine", return_value=_mock_engine(conn)):
+        assert await db_health.test_db_connection() is False
@@ -0,0 +1,13 @@
+from sentiment_analyzer.utils.db_session import get_async_engine, get_async_session_factory
+
+
+def test_async_engine_is_process_wide_singleton():
+    """Test that every caller shares one engine, and with it one connection pool."""
+    assert get_async_engine() is get_async_engine()
+
+
+def test_session_factory_is_bound_to_shared_engine():
+    """Test that sessions come from a single factory bound to the shared engine."""
+    factory = get_async_session_factory()
+    assert factory is get_async_session_factory()
+    assert factory.kw["bind"] is get_async_engine()
@@ -0,0 +1,64 @@
+"""
+Raw asyncpg connection pool for hot-path queries that gain nothing from the ORM.
+
+The SQLAlchemy engine in :mod:`sentiment_analyzer.utils.db_session` remains the
+default for everything else; this pool is used where a single statement returns
+plain rows that map straight onto a DTO (e.g. claiming raw events).
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
+
+import asyncpg
+import orjson
+
+from sentiment_analyzer.config.settings import settings
+from sentiment_analyzer.utils.db_session import ASYNCPG_CONNECT_ARGS
+
+_pool: Optional[asyncpg.Pool] = None
+_pool_lock = asyncio.Lock()
+
+def _asyncpg_dsn() -> str:
+    """Returns DATABASE_URL without the SQLAlchemy driver suffix asyncpg does not understand."""
+    return settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Decodes JSON/JSONB with orjson, matching the SQLAlchemy engine's deserializer."""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=lambda value: orjson.dumps(value).decode(),
+            decoder=orjson.loads,
+            schema="pg_catalog",
+        )
+
+async def get_asyncpg_pool() -> asyncpg.Pool:
+    """Returns the process-wide asyncpg pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                _pool = await asyncpg.create_pool(
+                    _asyncpg_dsn(),
+                    # Open connections on demand instead of asyncpg's 10 up front, so this
+                    # pool does not idle a second set of backends next to the engine's
+                    min_size=0,
+                    init=_init_connection,
+                    statement_cache_size=ASYNCPG_CONNECT_ARGS["statement_cache_size"],
+                    server_settings=ASYNCPG_CONNECT_ARGS["server_settings"],
+                )
+    return _pool
+
+@asynccontextmanager
+async def acquire() -> AsyncGenerator[asyncpg.Connection, None]:
+    """Acquires a connection from the shared pool and releases it on exit."""
+    pool = await get_asyncpg_pool()
+    async with pool.acquire() as conn:
+        yield conn
+
+async def close_asyncpg_pool() -> None:
+    """Closes the shared pool, if it was created."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -1,19 +1,29 @@
 """Database health check utilities for startup scripts."""
 
+from sqlalchemy import text
+
 from sentiment_analyzer.utils.db_session import get_async_engine
 
+# Built once; SQLAlchemy caches the compiled statement for this object
+_PING = text("SELECT 1")
+
 
 async def test_db_connection() -> bool:
     """
     Test database connection for startup health checks.
+
+    A ``SELECT 1`` needs no transaction, but SQLAlchemy autobegins one on the
+    first ``execute`` even under ``engine.connect()``; the AUTOCOMMIT isolation
+    level stops asyncpg from sending BEGIN and the ROLLBACK on close.
     
     Returns:
         bool: True if connection successful, False otherwise.
     """
     try:
         engine = get_async_engine()
-        async with engine.begin() as conn:
-            await conn.execute("SELECT 1")
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(_PING)
         return True
     except Exception:
         return False